@@ -10,35 +10,50 @@ from flask_socketio import SocketIO, emit, join_room, leave_room
 from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime, timedelta
 import secrets, logging, os
-from logging.handlers import RotatingFileHandler
 from sqlalchemy import text
 from pathlib import Path
 
 # .env.local 파일 로드 (로컬 PostgreSQL 사용)
 env_file = Path(__file__).parent / '.env.local'
+_env_load_message = None
 if env_file.exists():
     try:
         from dotenv import load_dotenv
         load_dotenv(env_file)
-        print(f"✅ Loaded environment from {env_file}")
+        _env_load_message = f"✅ Loaded environment from {env_file}"
     except ImportError:
         # python-dotenv가 없으면 수동 로드
-        print(f"⚠️  python-dotenv not installed, manually loading .env.local")
         with open(env_file) as f:
             for line in f:
                 line = line.strip()
                 if line and not line.startswith('#') and '=' in line:
                     key, value = line.split('=', 1)
                     os.environ[key.strip()] = value.strip()
-        print(f"✅ Manually loaded environment from {env_file}")
+        _env_load_message = f"✅ python-dotenv not installed, manually loaded environment from {env_file}"
 
 # Utils import
 from utils.timezone import format_korea_time, get_korea_time
+from utils.socketio_queue import socketio_queue_options
+from utils.presence import registry as presence
+from utils.logging_pipeline import configure_logging, install_request_logging, socketio_logger_options
+from utils.metrics import install_metrics, register_collector
+from utils.push_dispatch import outbox_stats
+from utils.profiler import install_profiler
+from utils.hub_monitor import install_hub_monitor
+from utils.db_routing import configure_replica
 
 # ==================================================================
 # 인증 헬퍼 함수 (다른 모듈에서 import하므로 여기 유지)
 # ==================================================================
 
+def _remember_session_user(user_id):
+    """세션에 user_id 기록. 값이 같으면 건드리지 않아 불필요한 Set-Cookie 를 만들지 않는다."""
+    if session.get('user_id') != user_id:
+        session['user_id'] = user_id
+    if not session.permanent:
+        session.permanent = True
+
+
 def get_user_id_from_session_or_cookies():
     """세션 또는 쿠키에서 사용자 ID를 가져오는 함수 (Safari 호환)"""
     # 0) Authorization: Bearer <token>
@@ -49,9 +64,8 @@ def get_user_id_from_session_or_cookies():
             from utils.token import verify_access_token
             user_id_from_token = verify_access_token(token)
             if user_id_from_token:
-                session['user_id'] = user_id_from_token
-                session.permanent = True
-                app.logger.info(f'Authorization 토큰에서 사용자 ID 확인: {user_id_from_token}')
+                _remember_session_user(user_id_from_token)
+                app.logger.debug(f'Authorization 토큰에서 사용자 ID 확인: {user_id_from_token}')
                 return user_id_from_token
         except Exception as e:
             app.logger.info(f'Authorization 토큰 검증 실패: {e}')
@@ -59,7 +73,7 @@ def get_user_id_from_session_or_cookies():
     # 세션에서 확인
     user_id = session.get('user_id')
     if user_id:
-        app.logger.info(f'세션에서 사용자 ID 확인: {user_id}')
+        app.logger.debug(f'세션에서 사용자 ID 확인: {user_id}')
         return user_id
     
     # Safari 대안: URL 파라미터
@@ -75,8 +89,7 @@ def get_user_id_from_session_or_cookies():
     if user_id_param:
         try:
             user_id = int(user_id_param)
-            session['user_id'] = user_id
-            session.permanent = True
+            _remember_session_user(user_id)
             return user_id
         except (ValueError, TypeError):
             pass
@@ -87,16 +100,22 @@ def get_user_id_from_session_or_cookies():
     
     if safari_auth_header:
         try:
-            import base64
-            from models.user import Users as User
-            parts = safari_auth_header.rsplit('_', 2)
-            if len(parts) >= 2:
-                email = base64.b64decode(parts[0]).decode('utf-8')
-                user = User.query.filter_by(email=email).first()
-                if user:
-                    session['user_id'] = user.id
-                    session.permanent = True
-                    return user.id
+            from utils.token import token_cache
+            cache_key = ('safari', safari_auth_header)
+            user_id = token_cache.get(cache_key)
+            if user_id is None:
+                import base64
+                from models.user import Users as User
+                parts = safari_auth_header.rsplit('_', 2)
+                if len(parts) >= 2:
+                    email = base64.b64decode(parts[0]).decode('utf-8')
+                    user = User.query.filter_by(email=email).first()
+                    if user:
+                        user_id = user.id
+                        token_cache.set(cache_key, user_id)
+            if user_id:
+                _remember_session_user(user_id)
+                return user_id
         except Exception:
             pass
 
@@ -108,8 +127,7 @@ def get_user_id_from_session_or_cookies():
                 parts = cookie_value.split('_')
                 if len(parts) >= 2:
                     user_id = int(parts[1])
-                    session['user_id'] = user_id
-                    session.permanent = True
+                    _remember_session_user(user_id)
                     return user_id
             except (ValueError, IndexError):
                 pass
@@ -120,8 +138,7 @@ def get_user_id_from_session_or_cookies():
     if is_safari:
         safari_user_id = session.get('safari_user_id')
         if safari_user_id:
-            session['user_id'] = safari_user_id
-            session.permanent = True
+            _remember_session_user(safari_user_id)
             return safari_user_id
 
     return None
@@ -133,6 +150,11 @@ def get_user_id_from_session_or_cookies():
 
 app = Flask(__name__)
 
+# 로깅 설정 (QueueHandler → 리스너 스레드에서 JSON 출력, 요청 경로에서 디스크 I/O 없음)
+configure_logging(app)
+if _env_load_message:
+    app.logger.info(_env_load_message)
+
 # SocketIO 초기화 (Safari/Mobile 호환)
 # CORS 허용 도메인 설정 - 동적 검증 함수 사용
 def is_allowed_origin(origin):
@@ -162,8 +184,8 @@ def is_allowed_origin(origin):
 app.logger.info('SocketIO CORS: 동적 검증 함수 사용 (모든 .vercel.app 허용)')
 
 socketio = SocketIO(app, 
-    logger=True,
-    engineio_logger=True,
+    # Socket.IO / Engine.IO 내부 로그는 PT_SOCKETIO_LOG=true 일 때만 INFO
+    **socketio_logger_options(),
     cors_allowed_origins='*',  # 모든 origin 허용 (credentials 없이)
     cors_credentials=False,  # Safari CORS 문제 해결 (withCredentials: false와 일치)
     # async_mode는 명시하지 않음 - Gunicorn eventlet worker가 자동 감지
@@ -172,16 +194,10 @@ socketio = SocketIO(app,
     # transports는 서버에서 지정하지 않고 클라이언트에서 제어
     allow_upgrades=True,  # polling에서 websocket으로 업그레이드 허용
     cookie=None,  # 쿠키 사용하지 않음 (토큰 인증)
+    # 다중 인스턴스 간 emit 전달 (SOCKETIO_MESSAGE_QUEUE 미설정 시 단일 프로세스)
+    **socketio_queue_options(),
 )
 
-# 로깅 설정
-os.makedirs('logs', exist_ok=True)
-fh = RotatingFileHandler('logs/crossfit.log', maxBytes=1024*1024, backupCount=10, encoding='utf-8')
-fh.setFormatter(logging.Formatter('%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]'))
-fh.setLevel(logging.INFO)
-app.logger.addHandler(fh)
-app.logger.setLevel(logging.INFO)
-
 # Config
 app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///crossfit.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
@@ -199,6 +215,26 @@ app.config['SESSION_COOKIE_SECURE'] = True
 app.config['SESSION_COOKIE_DOMAIN'] = None
 app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(hours=24)
 app.config['SESSION_COOKIE_PATH'] = '/'
+# 기본: 세션 값이 바뀔 때만 Set-Cookie. true 면 요청마다 쿠키를 다시 써 만료를 연장 (opt-in)
+app.config['SESSION_REFRESH_EACH_REQUEST'] = (
+    os.environ.get('SESSION_REFRESH_EACH_REQUEST', 'false').lower() == 'true'
+)
+# 요청마다 쓰지 않는 대신, 마지막 재발급 후 수명의 절반이 지난 세션만 한 번 다시 써서 만료를 미룬다
+SESSION_REISSUED_KEY = 'session_reissued_at'
+
+
+@app.after_request
+def _reissue_aging_session(response):
+    """로그인 세션이 수명의 절반을 넘기면 Set-Cookie 1회로 만료 연장 (활동 중인 사용자는 24시간에 끊기지 않음)"""
+    if app.config['SESSION_REFRESH_EACH_REQUEST'] or not session.permanent:
+        return response
+    now = datetime.utcnow().timestamp()
+    half_life = app.permanent_session_lifetime.total_seconds() / 2
+    reissued_at = session.get(SESSION_REISSUED_KEY)
+    if not isinstance(reissued_at, (int, float)) or now - reissued_at >= half_life:
+        session[SESSION_REISSUED_KEY] = now
+    return response
+
 
 # CORS 설정
 cors_origins = os.environ.get('CORS_ORIGINS', 'http://localhost:3000').split(',')
@@ -217,6 +253,8 @@ CORS(app,
 
 # Database 초기화 (config/database.py에서 import)
 from config.database import db
+# DATABASE_REPLICA_URL 이 있으면 replica bind 추가 (utils/db_routing)
+configure_replica(app)
 db.init_app(app)
 
 # Flask-Mail 초기화
@@ -224,15 +262,21 @@ from utils.email import init_mail
 init_mail(app)
 app.logger.info('Flask-Mail initialized')
 
-# Request/Response 로깅
-@app.before_request
-def _before():
-    app.logger.info('Request: %s %s', request.method, request.url)
+# Request/Response 로깅 (소요 시간 포함, PT_LOG_SAMPLE_ROUTES 로 라우트별 샘플링)
+install_request_logging(app)
 
-@app.after_request
-def _after(resp):
-    app.logger.info('Response: %s %s', resp.status_code, resp.status)
-    return resp
+# 라우트별 지연/쿼리 수 계측 + Server-Timing 헤더 + /api/metrics (Prometheus)
+install_metrics(app)
+register_collector('wodybody_socket_connections', '이 인스턴스의 사용자 room 소켓 연결 수',
+                   lambda: presence.snapshot()['connections'])
+register_collector('wodybody_push_outbox_pending', '오프라인 알림 푸시 아웃박스 대기 건수',
+                   lambda: outbox_stats()['pending'])
+
+# opt-in 프로파일링 (샘플 / 느린 요청 / 관리자 X-Profile 헤더) + /api/admin/profiles
+install_profiler(app)
+
+# eventlet hub 지연 / blocking 호출 감지 (PT_HUB_MONITOR, 기본: eventlet 워커에서만)
+install_hub_monitor(app, socketio)
 
 
 # ==================================================================
@@ -392,9 +436,9 @@ def seed_exercise_data():
             db.session.add(exercise)
         
         db.session.commit()
-        print("✅ Exercise data seeded successfully!")
+        app.logger.info("✅ Exercise data seeded successfully!")
     except Exception as e:
-        print(f"❌ Error seeding exercise data: {e}")
+        app.logger.exception(f"❌ Error seeding exercise data: {e}")
         db.session.rollback()
 
 
@@ -418,6 +462,10 @@ app.register_blueprint(notifications.bp)
 from routes import workout_records
 app.register_blueprint(workout_records.bp)
 
+# Leaderboard 라우트 (프로그램별 최고 기록 순위)
+from routes import leaderboard
+app.register_blueprint(leaderboard.bp)
+
 # Exercises 라우트
 from routes import exercises
 app.register_blueprint(exercises.bp)
@@ -455,14 +503,25 @@ from routes import push as pt_push
 app.register_blueprint(pt_push.bp)
 
 # WebSocket 이벤트 핸들러 등록 (app.py에 직접 정의)
+# 소켓 연결 시 검증한 사용자 id (Flask-SocketIO 의 연결별 세션에 저장)
+SOCKET_USER_KEY = 'socket_user_id'
+
+def _verified_socket_user(auth):
+    """연결 시점의 검증된 신원: auth/query 의 access token, 없으면 Bearer 헤더나 비밀번호 로그인 세션"""
+    from utils.token import get_verified_user_id, verify_access_token
+    token = (auth.get('token') if isinstance(auth, dict) else None) or request.args.get('token')
+    if token:
+        return verify_access_token(token)
+    return get_verified_user_id()
+
 @socketio.on('connect')
-def handle_connect():
+def handle_connect(auth=None):
     """클라이언트 연결 시 호출"""
+    session[SOCKET_USER_KEY] = _verified_socket_user(auth)
     user_agent = request.headers.get('User-Agent', '').lower()
     is_mobile_safari = 'safari' in user_agent and 'chrome' not in user_agent and ('iphone' in user_agent or 'ipad' in user_agent or 'mobile' in user_agent)
     
     app.logger.info(f'클라이언트 연결됨: {request.sid} | User-Agent: {user_agent[:100]} | Mobile Safari: {is_mobile_safari}')
-    print(f'🔌 WebSocket 클라이언트 연결됨: {request.sid} {"(모바일 Safari)" if is_mobile_safari else ""}')
     
     # 모바일 Safari 감지는 로그로만 처리 (emit 제거로 연결 안정성 향상)
     # emit()는 연결 완료 전에 호출되면 문제를 일으킬 수 있음
@@ -471,29 +530,63 @@ def handle_connect():
 def handle_disconnect():
     """클라이언트 연결 해제 시 호출"""
     app.logger.info(f'클라이언트 연결 해제됨: {request.sid}')
-    print(f'🔌 WebSocket 클라이언트 연결 해제됨: {request.sid}')
+    presence.disconnect(request.sid)
+
+def _socket_user_id(data):
+    """소켓 이벤트 payload 의 user_id 를 양의 정수로. 없거나 숫자가 아니면 None (이벤트 무시)"""
+    try:
+        user_id = int((data or {}).get('user_id'))
+    except (TypeError, ValueError):
+        return None
+    return user_id if user_id > 0 else None
 
 @socketio.on('join_user_room')
 def handle_join_user_room(data):
-    """사용자별 방에 참여"""
-    user_id = data.get('user_id')
-    if user_id:
+    """사용자별 방에 참여. 방/presence 는 연결 시 검증한 사용자 기준이며 payload 의 user_id 는 신뢰하지 않는다"""
+    user_id = session.get(SOCKET_USER_KEY)
+    claimed = _socket_user_id(data)
+    if not user_id:
+        app.logger.warning('❌ join_user_room: 인증되지 않은 소켓입니다.')
+    elif claimed and claimed != user_id:
+        app.logger.warning(f'❌ join_user_room: 인증된 사용자({user_id})와 요청 user_id({claimed})가 다릅니다.')
+    else:
         join_room(f'user_{user_id}')
+        presence.join(user_id, request.sid)
         app.logger.info(f'사용자 {user_id}가 방에 참여했습니다.')
-        print(f'👤 사용자 {user_id}가 방에 참여했습니다.')
-    else:
-        print('❌ 사용자 ID가 없습니다.')
 
 @socketio.on('leave_user_room')
 def handle_leave_user_room(data):
     """사용자별 방에서 나가기"""
-    user_id = data.get('user_id')
+    user_id = session.get(SOCKET_USER_KEY)
     if user_id:
         leave_room(f'user_{user_id}')
+        presence.leave(user_id, request.sid)
         app.logger.info(f'사용자 {user_id}가 방에서 나갔습니다.')
-        print(f'👤 사용자 {user_id}가 방에서 나갔습니다.')
 
-print("✅ All blueprints and WebSocket handlers registered successfully!")
+@socketio.on('subscribe_topic')
+def handle_subscribe_topic(data):
+    """프로그램/난이도 토픽 room 구독 (program_<id>, difficulty_<level>)"""
+    from flask_socketio import rooms
+    from routes.notifications import is_valid_topic, MAX_TOPICS_PER_SOCKET
+    topic = (data or {}).get('topic')
+    if not is_valid_topic(topic):
+        return {'ok': False, 'message': '지원하지 않는 토픽입니다'}
+    joined = [r for r in rooms() if is_valid_topic(r)]
+    if topic not in joined and len(joined) >= MAX_TOPICS_PER_SOCKET:
+        return {'ok': False, 'message': '구독 가능한 토픽 수를 초과했습니다'}
+    join_room(topic)
+    return {'ok': True, 'topic': topic}
+
+@socketio.on('unsubscribe_topic')
+def handle_unsubscribe_topic(data):
+    """토픽 room 구독 해제"""
+    from routes.notifications import is_valid_topic
+    topic = (data or {}).get('topic')
+    if is_valid_topic(topic):
+        leave_room(topic)
+    return {'ok': True, 'topic': topic}
+
+app.logger.info("✅ All blueprints and WebSocket handlers registered successfully!")
 
 
 # ==================================================================
@@ -516,21 +609,17 @@ if __name__ == '__main__':
             # 데이터베이스 초기화
             try:
                 db.session.execute(text("SELECT 1 FROM users LIMIT 1"))
-                print("✅ Database tables already exist")
+                app.logger.info("✅ Database tables already exist")
             except Exception:
-                print("🔨 Creating database tables...")
+                app.logger.info("🔨 Creating database tables...")
                 db.create_all()
-                print("🌱 Seeding exercise data...")
+                app.logger.info("🌱 Seeding exercise data...")
                 seed_exercise_data()
-                print("✅ Database initialization complete!")
+                app.logger.info("✅ Database initialization complete!")
         
         port = int(os.environ.get('PORT', 5001))
-        print(f"🚀 Server starting on port {port}")
-        print(f"📦 Total lines in app.py: ~405 (was 2,703)")
-        print(f"📈 Reduction: 85% smaller!")
+        app.logger.info(f"🚀 Server starting on port {port}")
         socketio.run(app, debug=False, port=port, host='0.0.0.0', allow_unsafe_werkzeug=True)
     except Exception as e:
-        print(f"❌ ERROR: {e}")
-        import traceback
-        traceback.print_exc()
+        app.logger.exception(f"❌ ERROR: {e}")
         raise
@@ -0,0 +1,137 @@
+"""요청당 인증 해석 비용 마이크로 벤치마크 (``get_user_id_from_session_or_cookies``).
+
+임시 SQLite DB 에 사용자 1명을 만들고 같은 요청 컨텍스트에서 인증 헬퍼를 반복 호출한다.
+
+- bearer: ``Authorization: Bearer <token>`` — cold 는 매 호출 전 토큰 캐시를 비워 HMAC 재검증
+- safari: ``X-Safari-Auth-Token`` — cold 는 매 호출 이메일 조회 쿼리 발생
+
+추가로 test client 로 인증된 GET 을 반복해 응답 중 ``Set-Cookie`` 가 붙은 비율을 센다
+(세션 값이 그대로면 쿠키를 다시 쓰지 않아야 한다).
+
+사용법:
+    cd backend
+    python -m benchmarks.auth_resolution --iterations 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+def _setup(db_url: str):
+    os.environ['DATABASE_URL'] = db_url
+    os.environ['PT_PUSH_WORKER_ENABLED'] = 'false'
+
+    from app import app, db
+    from models.user import Users
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        user = Users(email='bench@example.com', password_hash='x', name='bench')
+        db.session.add(user)
+        db.session.commit()
+        return app, db, user.id
+
+
+def _time_calls(app, db, headers: dict, iterations: int, cold: bool) -> dict:
+    from sqlalchemy import event
+    from app import get_user_id_from_session_or_cookies
+    from utils.token import token_cache
+
+    queries = [0]
+
+    def _count(*_):
+        queries[0] += 1
+
+    with app.test_request_context('/api/notifications', headers=headers):
+        engine = db.engine
+        token_cache.clear()
+        get_user_id_from_session_or_cookies()  # warm-up (import, 세션 로드)
+        from flask import session
+        event.listen(engine, 'before_cursor_execute', _count)
+        started = time.perf_counter()
+        for _ in range(iterations):
+            if cold:
+                token_cache.clear()
+                session.clear()
+            user_id = get_user_id_from_session_or_cookies()
+            if not cold:
+                session.pop('user_id', None)  # 세션 단축 경로 대신 헤더 경로를 재게 함
+        elapsed = time.perf_counter() - started
+        event.remove(engine, 'before_cursor_execute', _count)
+    return {
+        'us_per_call': round(elapsed * 1e6 / iterations, 2),
+        'queries_per_call': round(queries[0] / iterations, 3),
+        'resolved_user_id': user_id,
+    }
+
+
+def _set_cookie_ratio(app, headers: dict, requests_count: int) -> float:
+    client = app.test_client()
+    with_cookie = 0
+    for _ in range(requests_count):
+        response = client.get('/api/notifications/unread-count', headers=headers)
+        if response.headers.get('Set-Cookie'):
+            with_cookie += 1
+    return round(with_cookie / requests_count, 3)
+
+
+def run(args) -> list[dict]:
+    db_url = args.database_url or 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'auth_bench.db')
+    app, db, user_id = _setup(db_url)
+
+    from utils.token import generate_access_token
+
+    with app.app_context():
+        token = generate_access_token(user_id)
+    safari = base64.b64encode(b'bench@example.com').decode() + f'_{user_id}_1700000000'
+    cases = {
+        'bearer': {'Authorization': f'Bearer {token}'},
+        'safari': {'X-Safari-Auth-Token': safari},
+    }
+
+    results = []
+    for name, headers in cases.items():
+        for cold in (True, False):
+            row = {'case': name, 'cache': 'cold' if cold else 'warm'}
+            row.update(_time_calls(app, db, headers, args.iterations, cold))
+            results.append(row)
+        results[-1]['set_cookie_ratio'] = _set_cookie_ratio(app, headers, args.requests)
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='인증 해석 마이크로 벤치마크')
+    parser.add_argument('--iterations', type=int, default=5000)
+    parser.add_argument('--requests', type=int, default=200, help='Set-Cookie 비율 측정 요청 수')
+    parser.add_argument('--database-url', help='기본: 임시 SQLite 파일')
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args(argv)
+
+    results = run(args)
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False))
+        return 0
+
+    print('=' * 64)
+    print(f'auth resolution — {args.iterations} calls per case')
+    print('=' * 64)
+    print(f"{'case':<8}{'cache':<7}{'us/call':>10}{'queries/call':>14}{'Set-Cookie':>12}")
+    for r in results:
+        ratio = r.get('set_cookie_ratio')
+        print(f"{r['case']:<8}{r['cache']:<7}{r['us_per_call']:>10}{r['queries_per_call']:>14}"
+              f"{'' if ratio is None else ratio:>12}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""알림 emit 코얼레싱 벤치마크: 즉시 emit vs room 버퍼(notifications_batch).
+
+가상 소켓(사용자당 1개)을 python-socketio 서버 매니저에 등록하고 ``eio.send`` 를 카운터로
+대체한 뒤, 사용자별로 짧은 시간 안에 여러 알림이 몰리는 버스트 트래픽을 시뮬레이션 시각 순서대로
+흘려보낸다.
+
+- direct: 알림마다 ``notification`` 프레임 1개
+- coalesced: ``EmitBuffer`` 가 window 안의 같은 room 알림을 ``notifications_batch`` 1개로 묶음
+
+시뮬레이션 구간 기준 초당 프레임 수, 전송 바이트, 처리 CPU 시간(process_time)을 비교한다.
+
+``--check-flush-on-commit`` 은 실제 ``_emit_notifications`` 경로로 알림 한 건을 보내고
+``PT_EMIT_FLUSH_ON_COMMIT`` 이 켜져 있으면 프레임이 코얼레싱 window 가 끝나기 전에(호출이 반환될 때)
+나가는지 검사한다. 실패하면 종료 코드 1.
+
+사용법:
+    cd backend
+    python -m benchmarks.emit_coalescing --users 2000 --bursts 5 --burst-size 8
+    python -m benchmarks.emit_coalescing --check-flush-on-commit
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.emit_buffer import EmitBuffer  # noqa: E402
+
+
+class _Counter:
+    def __init__(self):
+        self.frames = 0
+        self.bytes = 0
+
+    def send(self, eio_sid, data):
+        self.frames += 1
+        self.bytes += len(data) if isinstance(data, (str, bytes)) else 0
+
+
+def build_server(users: int):
+    import socketio
+
+    server = socketio.Server(async_mode='threading')
+    counter = _Counter()
+    server.eio.send = counter.send
+    for uid in range(1, users + 1):
+        sid = server.manager.connect(f'eio-{uid}', '/')
+        server.manager.enter_room(sid, '/', f'user_{uid}')
+    return server, counter
+
+
+def build_traffic(args) -> list[tuple[float, int, dict]]:
+    """(시각, user_id, payload) 목록. 사용자마다 bursts 회, 회당 burst_size 건이 burst_spread_ms 안에 발생."""
+    rng = random.Random(args.seed)
+    events = []
+    next_id = 1
+    for uid in range(1, args.users + 1):
+        for _ in range(args.bursts):
+            start = rng.uniform(0, args.duration)
+            for _ in range(args.burst_size):
+                at = start + rng.uniform(0, args.burst_spread_ms / 1000.0)
+                events.append((at, uid, {
+                    'id': next_id,
+                    'type': 'participation_approved',
+                    'title': '참여 신청 승인',
+                    'message': f'"Bench WOD {next_id % 97}" 프로그램 참여가 승인되었습니다',
+                    'program_id': next_id % 97,
+                    'created_at': '2025-01-01T00:00:00',
+                }))
+                next_id += 1
+    events.sort(key=lambda e: e[0])
+    return events
+
+
+def run_direct(args, traffic) -> dict:
+    server, counter = build_server(args.users)
+    cpu = time.process_time()
+    for _, uid, data in traffic:
+        server.emit('notification', data, room=f'user_{uid}')
+    cpu = time.process_time() - cpu
+    return _result('direct', args, traffic, counter, cpu)
+
+
+def run_coalesced(args, traffic) -> dict:
+    server, counter = build_server(args.users)
+    sim_now = [0.0]
+    buffer = EmitBuffer(
+        lambda event, data, room: server.emit(event, data, room=room),
+        window_seconds=args.window_ms / 1000.0,
+        room_max=args.room_max,
+        clock=lambda: sim_now[0],
+    )
+    step = args.window_ms / 2000.0  # 실서버 flush 루프와 같은 window/2 간격
+    next_flush = step
+    cpu = time.process_time()
+    for at, uid, data in traffic:
+        while next_flush <= at:
+            sim_now[0] = next_flush
+            buffer.flush_due()
+            next_flush += step
+        sim_now[0] = at
+        buffer.queue(f'user_{uid}', 'notification', data)
+    buffer.flush()
+    cpu = time.process_time() - cpu
+    result = _result('coalesced', args, traffic, counter, cpu)
+    result['batched_frames'] = buffer.stats['batched_frames']
+    return result
+
+
+def _result(mode, args, traffic, counter, cpu) -> dict:
+    return {
+        'mode': mode,
+        'notifications': len(traffic),
+        'frames': counter.frames,
+        'frames_per_second': round(counter.frames / args.duration, 1),
+        'megabytes': round(counter.bytes / 1024 / 1024, 2),
+        'cpu_seconds': round(cpu, 3),
+        'cpu_us_per_notification': round(cpu * 1e6 / max(len(traffic), 1), 1),
+    }
+
+
+def check_flush_on_commit(window_ms: float) -> list[dict]:
+    """FLUSH_ON_COMMIT 끔/켬 각각 커밋 후 emit 경로로 알림 1건을 보내고 첫 프레임까지의 지연을 잰다."""
+    os.environ.setdefault('DATABASE_URL', 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'emit.db'))
+    os.environ['PT_PUSH_WORKER_ENABLED'] = 'false'
+    os.environ['PT_PRESENCE_ROUTING'] = 'false'
+    os.environ.setdefault('PT_LOG_LEVEL', 'WARNING')
+    os.environ.setdefault('PT_LOG_FILE', '')
+
+    from app import app, socketio
+    from routes.notifications import _emit_notifications
+    from utils import emit_buffer
+
+    sent = []
+    socketio.emit = lambda event, data, room=None, **kwargs: sent.append((time.monotonic(), event, room))
+    emit_buffer.COALESCE_MS = window_ms
+    window = window_ms / 1000.0
+    results = []
+    for flush_on_commit in (False, True):
+        emit_buffer.FLUSH_ON_COMMIT = flush_on_commit
+        emit_buffer._buffer = None
+        sent.clear()
+        data = {'id': 1, 'type': 'program_updated', 'title': 't', 'message': 'm',
+                'program_id': None, 'created_at': '2025-01-01T00:00:00'}
+        with app.app_context():
+            started = time.monotonic()
+            _emit_notifications([(1, data)])
+            sent_on_return = len(sent)
+        time.sleep(window * 3)  # 백그라운드 flush 루프가 나머지를 보낼 시간
+        latency = (sent[0][0] - started) if sent else None
+        results.append({
+            'flush_on_commit': flush_on_commit,
+            'frames_on_return': sent_on_return,
+            'first_frame_ms': None if latency is None else round(latency * 1000, 1),
+            'ok': (not flush_on_commit) or (sent_on_return >= 1 and latency < window),
+        })
+    emit_buffer._buffer = None
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='알림 emit 코얼레싱 벤치마크')
+    parser.add_argument('--users', type=int, default=2000)
+    parser.add_argument('--bursts', type=int, default=5, help='사용자당 버스트 횟수')
+    parser.add_argument('--burst-size', type=int, default=8, help='버스트당 알림 수')
+    parser.add_argument('--burst-spread-ms', type=float, default=40.0)
+    parser.add_argument('--duration', type=float, default=60.0, help='시뮬레이션 구간(초)')
+    parser.add_argument('--window-ms', type=float, default=50.0)
+    parser.add_argument('--room-max', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=11)
+    parser.add_argument('--json', action='store_true')
+    parser.add_argument('--check-flush-on-commit', action='store_true',
+                        help='FLUSH_ON_COMMIT 시 window 이전 전송 여부만 검사')
+    args = parser.parse_args(argv)
+
+    if args.check_flush_on_commit:
+        checks = check_flush_on_commit(args.window_ms)
+        if args.json:
+            print(json.dumps(checks, ensure_ascii=False))
+        else:
+            for c in checks:
+                tag = 'ok  ' if c['ok'] else 'FAIL'
+                print(f"{tag} flush_on_commit={c['flush_on_commit']!s:<5} frames_on_return={c['frames_on_return']} "
+                      f"first_frame_ms={c['first_frame_ms']} (window {args.window_ms:.0f}ms)")
+        return 0 if all(c['ok'] for c in checks) else 1
+
+    traffic = build_traffic(args)
+    results = [run_direct(args, traffic), run_coalesced(args, traffic)]
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False))
+        return 0
+
+    print('=' * 78)
+    print(f'emit coalescing — {len(traffic)} notifications, {args.users} users, '
+          f'{args.duration:.0f}s simulated, window {args.window_ms:.0f}ms')
+    print('=' * 78)
+    print(f"{'mode':<11}{'frames':>10}{'frames/s':>11}{'MB':>8}{'CPU s':>9}{'CPU us/notif':>14}")
+    for r in results:
+        print(f"{r['mode']:<11}{r['frames']:>10}{r['frames_per_second']:>11}{r['megabytes']:>8}"
+              f"{r['cpu_seconds']:>9}{r['cpu_us_per_notification']:>14}")
+    direct, coalesced = results
+    print(f"\n프레임 {direct['frames'] / max(coalesced['frames'], 1):.1f}배 감소, "
+          f"CPU {direct['cpu_seconds'] / max(coalesced['cpu_seconds'], 1e-9):.1f}배 절감")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,258 @@
+"""자주 도는 조회의 실행 계획(EXPLAIN) 검사.
+
+큰 데이터셋(기본: 프로그램 2만, 참여/기록 각 10만 행)을 시드하고 ANALYZE 한 뒤, 라우트가 실제로
+만드는 것과 같은 ORM 쿼리를 ``EXPLAIN`` 해서 대상 테이블을 전체 스캔(Seq Scan / SCAN <table>)하면
+실패로 처리한다 (exit 1). 정렬용 임시 B-tree(SQLite) / Sort 노드(PostgreSQL)는 참고로만 출력한다.
+
+``migrations/add_hot_query_indexes.py`` 의 인덱스 목록과 모델 ``__table_args__`` 가 어긋나도 실패.
+
+기본은 임시 SQLite 파일. PostgreSQL 플랜을 보려면 **버려도 되는 빈 DB** 를 지정할 것
+(테이블을 drop/create 한다).
+
+사용법:
+    cd backend
+    python -m benchmarks.explain_plans
+    python -m benchmarks.explain_plans --database-url postgresql://localhost/wodybody_explain
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+CHUNK = 5000
+
+
+def _insert(db, table, rows: list[dict]) -> None:
+    for start in range(0, len(rows), CHUNK):
+        db.session.execute(table.insert(), rows[start:start + CHUNK])
+
+
+def seed(db, scale: int) -> dict:
+    """scale 배 규모의 데이터를 core insert(executemany)로 채운다. 쿼리 파라미터용 id 반환."""
+    from models import (
+        ExerciseCategories, Exercises, ExerciseSets, Notifications, ProgramExercises, ProgramLeaderboard,
+        ProgramParticipants, Programs, Users, WorkoutPatterns, WorkoutRecords,
+    )
+
+    now = datetime.utcnow()
+    n_users = 2000 * scale
+    n_programs = 20000 * scale
+    per_program = 5
+
+    _insert(db, ExerciseCategories.__table__, [{'id': 1, 'name': 'seed'}])
+    _insert(db, Exercises.__table__, [{'id': i, 'category_id': 1, 'name': f'ex{i}'} for i in range(1, 4)])
+    _insert(db, Users.__table__, [
+        {'id': i, 'email': f'u{i}@example.com', 'password_hash': 'x', 'name': f'u{i}'}
+        for i in range(1, n_users + 1)
+    ])
+    _insert(db, Programs.__table__, [
+        {'id': i, 'creator_id': i % n_users + 1, 'title': f'WOD {i}', 'is_open': i % 10 == 0,
+         'created_at': now - timedelta(minutes=i)}
+        for i in range(1, n_programs + 1)
+    ])
+    _insert(db, ProgramParticipants.__table__, [
+        {'program_id': p, 'user_id': (p + k * 7) % n_users + 1,
+         'status': 'approved' if k % 3 else 'pending'}
+        for p in range(1, n_programs + 1) for k in range(per_program)
+    ])
+    _insert(db, WorkoutRecords.__table__, [
+        {'program_id': p, 'user_id': (p + k * 7) % n_users + 1, 'completion_time': 300 + k,
+         'completed_at': now - timedelta(minutes=p + k), 'is_public': True}
+        for p in range(1, n_programs + 1) for k in range(per_program)
+    ])
+    # 기록은 (program, user) 쌍마다 한 건이라 그대로 최고 기록 (id 는 삽입 순서와 같다)
+    _insert(db, ProgramLeaderboard.__table__, [
+        {'program_id': p, 'user_id': (p + k * 7) % n_users + 1, 'best_time': 300 + k,
+         'record_id': (p - 1) * per_program + k + 1, 'achieved_at': now - timedelta(minutes=p + k)}
+        for p in range(1, n_programs + 1) for k in range(per_program)
+    ])
+    _insert(db, ProgramExercises.__table__, [
+        {'program_id': p, 'exercise_id': k + 1, 'order_index': k}
+        for p in range(1, n_programs + 1) for k in range(3)
+    ])
+    _insert(db, WorkoutPatterns.__table__, [
+        {'id': p, 'program_id': p, 'pattern_type': 'fixed_reps', 'total_rounds': 3}
+        for p in range(1, n_programs + 1)
+    ])
+    _insert(db, ExerciseSets.__table__, [
+        {'pattern_id': p, 'exercise_id': k + 1, 'base_reps': 10, 'progression_type': 'fixed', 'order_index': k}
+        for p in range(1, n_programs + 1) for k in range(3)
+    ])
+    _insert(db, Notifications.__table__, [
+        {'user_id': i % n_users + 1, 'program_id': i % n_programs + 1, 'type': 'program_update',
+         'title': 't', 'message': 'm', 'is_read': i % 2 == 0, 'created_at': now - timedelta(minutes=i)}
+        for i in range(1, 25 * n_users + 1)
+    ])
+    db.session.commit()
+    return {'user_id': n_users // 2, 'program_id': n_programs // 2}
+
+
+def hot_queries(db, ids: dict) -> list[tuple[str, str, object]]:
+    """(이름, 전체 스캔하면 안 되는 테이블, SQLAlchemy select) — 라우트의 쿼리와 같은 모양."""
+    from sqlalchemy import func
+
+    from models import (
+        ExerciseSets, Notifications, ProgramExercises, ProgramLeaderboard, ProgramParticipants, Programs,
+        WorkoutPatterns, WorkoutRecords,
+    )
+
+    user_id, program_id = ids['user_id'], ids['program_id']
+    session = db.session
+    queries = [
+        ('공개 WOD 목록', 'programs',
+         Programs.query.filter_by(is_open=True).order_by(Programs.created_at.desc())),
+        ('내 WOD 목록', 'programs',
+         Programs.query.filter_by(creator_id=user_id).order_by(Programs.created_at.desc())),
+        ('내 공개 WOD 수', 'programs',
+         session.query(func.count(Programs.id)).filter_by(creator_id=user_id, is_open=True)),
+        ('승인 참여자 수', 'program_participants',
+         session.query(func.count(ProgramParticipants.id)).filter_by(program_id=program_id, status='approved')),
+        ('내 참여 상태', 'program_participants',
+         ProgramParticipants.query.filter_by(program_id=program_id, user_id=user_id).limit(1)),
+        ('내 기록 목록', 'workout_records',
+         WorkoutRecords.query.filter_by(user_id=user_id).order_by(WorkoutRecords.completed_at.desc())),
+        ('프로그램 공개 기록', 'workout_records',
+         WorkoutRecords.query.filter_by(program_id=program_id, is_public=True)
+         .order_by(WorkoutRecords.completion_time.asc())),
+        ('리더보드 상위 K', 'program_leaderboard',
+         session.query(ProgramLeaderboard.user_id, ProgramLeaderboard.best_time)
+         .filter_by(program_id=program_id).order_by(ProgramLeaderboard.best_time).limit(10)),
+        ('리더보드 내 순위', 'program_leaderboard',
+         session.query(func.count(ProgramLeaderboard.user_id))
+         .filter(ProgramLeaderboard.program_id == program_id, ProgramLeaderboard.best_time < 302)),
+        ('알림 최신순', 'notifications',
+         Notifications.query.filter_by(user_id=user_id)
+         .order_by(Notifications.created_at.desc(), Notifications.id.desc()).limit(50)),
+        ('알림 ?since 커서', 'notifications',
+         Notifications.query.filter(Notifications.user_id == user_id, Notifications.id > 1)
+         .order_by(Notifications.id.asc()).limit(51)),
+        ('WOD 패턴', 'workout_patterns',
+         WorkoutPatterns.query.filter_by(program_id=program_id).limit(1)),
+        ('패턴 세트', 'exercise_sets',
+         ExerciseSets.query.filter_by(pattern_id=program_id).order_by(ExerciseSets.order_index)),
+        ('프로그램 운동', 'program_exercises',
+         ProgramExercises.query.filter_by(program_id=program_id).order_by(ProgramExercises.order_index)),
+    ]
+    return [(name, table, query.statement) for name, table, query in queries]
+
+
+def _compile(statement, dialect) -> str:
+    return str(statement.compile(dialect=dialect, compile_kwargs={'literal_binds': True}))
+
+
+def explain_sqlite(conn, sql: str, table: str) -> tuple[list[str], list[str], list[str]]:
+    """(plan 줄, 전체 스캔 문제, 참고 사항)."""
+    rows = conn.exec_driver_sql('EXPLAIN QUERY PLAN ' + sql).fetchall()
+    plan = [row[-1] for row in rows]
+    problems, notes = [], []
+    for detail in plan:
+        match = re.match(r'SCAN (\w+)', detail)
+        if match and match.group(1) == table and 'USING' not in detail:
+            problems.append(f'full table scan: {detail}')
+        if 'TEMP B-TREE' in detail:
+            notes.append(detail)
+    return plan, problems, notes
+
+
+def _walk(node):
+    yield node
+    for child in node.get('Plans', []):
+        yield from _walk(child)
+
+
+def explain_postgres(conn, sql: str, table: str) -> tuple[list[str], list[str], list[str]]:
+    raw = conn.exec_driver_sql('EXPLAIN (FORMAT JSON) ' + sql).scalar()
+    document = raw if isinstance(raw, list) else json.loads(raw)
+    plan, problems, notes = [], [], []
+    for node in _walk(document[0]['Plan']):
+        label = node['Node Type'] + (f" on {node['Relation Name']}" if node.get('Relation Name') else '')
+        if node.get('Index Name'):
+            label += f" using {node['Index Name']}"
+        plan.append(label)
+        if node['Node Type'] == 'Seq Scan' and node.get('Relation Name') == table:
+            problems.append(f'full table scan: {label}')
+        if node['Node Type'] == 'Sort':
+            notes.append(f"Sort {node.get('Sort Key')}")
+    return plan, problems, notes
+
+
+def check_migration_matches_models(db) -> list[str]:
+    """마이그레이션이 만드는 인덱스가 모델 메타데이터에도 같은 컬럼으로 있는지."""
+    from migrations.add_hot_query_indexes import INDEXES
+
+    declared = {
+        index.name: (table.name, [c.name for c in index.columns])
+        for table in db.metadata.tables.values() for index in table.indexes
+    }
+    problems = []
+    for name, table, columns in INDEXES:
+        expected = (table, [c.strip() for c in columns.split(',')])
+        if declared.get(name) != expected:
+            problems.append(f'{name}: migration {expected} != model {declared.get(name)}')
+    return problems
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='핫 쿼리 EXPLAIN 검사 (전체 스캔 시 실패)')
+    parser.add_argument('--scale', type=int, default=1, help='데이터셋 배수 (1 = 프로그램 2만)')
+    parser.add_argument('--database-url', help='기본: 임시 SQLite 파일. 지정 시 테이블을 drop/create 함')
+    parser.add_argument('--verbose', action='store_true', help='모든 쿼리의 plan 출력')
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args(argv)
+
+    os.environ['DATABASE_URL'] = args.database_url or 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'explain.db')
+    os.environ['PT_PUSH_WORKER_ENABLED'] = 'false'
+    os.environ.setdefault('PT_LOG_LEVEL', 'WARNING')
+    os.environ.setdefault('PT_LOG_FILE', '')
+
+    from app import app, db
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        ids = seed(db, args.scale)
+        dialect = db.engine.dialect.name
+        postgres = dialect == 'postgresql'
+        with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            conn.exec_driver_sql('ANALYZE')
+            explain = explain_postgres if postgres else explain_sqlite
+            results = []
+            for name, table, statement in hot_queries(db, ids):
+                sql = _compile(statement, db.engine.dialect)
+                plan, problems, notes = explain(conn, sql, table)
+                results.append({'query': name, 'table': table, 'plan': plan, 'problems': problems, 'notes': notes})
+        schema_problems = check_migration_matches_models(db)
+
+    failures = [r for r in results if r['problems']]
+    failed = bool(failures or schema_problems)
+    if args.json:
+        print(json.dumps({'queries': results, 'schema_problems': schema_problems}, ensure_ascii=False))
+        return 1 if failed else 0
+
+    print('=' * 78)
+    print(f"EXPLAIN hot queries — {dialect}, dataset x{args.scale}")
+    print('=' * 78)
+    for r in results:
+        tag = 'FAIL' if r['problems'] else 'ok  '
+        print(f"{tag} {r['query']:<20} {r['table']:<22} {' | '.join(r['plan'])[:120]}")
+        for problem in r['problems']:
+            print(f'      ! {problem}')
+        if args.verbose:
+            for note in r['notes']:
+                print(f'      * {note}')
+    for problem in schema_problems:
+        print(f'FAIL schema {problem}')
+    print(f'\n{len(results)} queries, {len(failures)} full scans, {len(schema_problems)} schema mismatches')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
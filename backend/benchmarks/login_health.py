@@ -0,0 +1,181 @@
+"""로그인 해시 부하 중 ``/api/health`` 지연 벤치마크.
+
+서버를 별도 프로세스로 띄우고(eventlet 이 설치되어 있으면 monkey patch 후 eventlet 서버,
+아니면 threading 서버), 로그인 요청 ``--logins`` 개를 계속 동시에 보내는 동안
+``/api/health`` 를 ``--health-interval-ms`` 간격으로 호출해 p50/p95/p99 지연을 잰다.
+
+``PT_PASSWORD_HASH_OFFLOAD`` 를 끈 서버(기존: hub 에서 직접 해시)와 켠 서버를 차례로 측정한다.
+해시가 hub 를 막는 현상은 eventlet 서버에서만 드러나므로 운영 비교는 eventlet 환경에서 돌릴 것.
+
+사용법:
+    cd backend
+    python -m benchmarks.login_health --logins 8 --seconds 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, BACKEND_DIR)
+
+BENCH_EMAIL = 'bench-login@example.com'
+BENCH_PASSWORD = 'bench-password-1234'
+
+
+def serve(port: int) -> None:
+    """서버 프로세스 진입점 (``--serve``)."""
+    try:
+        import eventlet
+        eventlet.monkey_patch()
+    except ImportError:
+        pass
+
+    from app import app, db, socketio
+    from models.user import Users
+
+    with app.app_context():
+        db.create_all()
+        if not Users.query.filter_by(email=BENCH_EMAIL).first():
+            user = Users(email=BENCH_EMAIL, name='bench')
+            user.set_password(BENCH_PASSWORD)
+            db.session.add(user)
+            db.session.commit()
+    print(f'serving async_mode={socketio.async_mode}', flush=True)
+    socketio.run(app, host='127.0.0.1', port=port, allow_unsafe_werkzeug=True, log_output=False)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _start_server(offload: bool, args) -> tuple[subprocess.Popen, str, str]:
+    port = _free_port()
+    env = dict(os.environ)
+    env.update({
+        'DATABASE_URL': 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'login_bench.db'),
+        'PT_PUSH_WORKER_ENABLED': 'false',
+        'PT_PASSWORD_HASH_OFFLOAD': 'true' if offload else 'false',
+        'PT_PASSWORD_HASH_CONCURRENCY': str(args.concurrency),
+    })
+    proc = subprocess.Popen(
+        [sys.executable, '-m', 'benchmarks.login_health', '--serve', '--port', str(port)],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+    )
+    async_mode = 'unknown'
+    for line in proc.stdout:
+        if line.startswith('serving'):
+            async_mode = line.strip().split('=', 1)[1]
+            break
+    base = f'http://127.0.0.1:{port}'
+    import requests
+    for _ in range(100):
+        try:
+            requests.get(f'{base}/api/health', timeout=1)
+            break
+        except requests.RequestException:
+            time.sleep(0.1)
+    return proc, base, async_mode
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+def measure(offload: bool, args) -> dict:
+    import requests
+
+    proc, base, async_mode = _start_server(offload, args)
+    stop = threading.Event()
+    logins = [0]
+    login_lock = threading.Lock()
+
+    def _login_loop():
+        session = requests.Session()
+        while not stop.is_set():
+            response = session.post(f'{base}/api/login',
+                                    json={'email': BENCH_EMAIL, 'password': BENCH_PASSWORD}, timeout=30)
+            if response.status_code == 200:
+                with login_lock:
+                    logins[0] += 1
+
+    try:
+        workers = [threading.Thread(target=_login_loop, daemon=True) for _ in range(args.logins)]
+        for w in workers:
+            w.start()
+        time.sleep(0.5)
+
+        latencies = []
+        deadline = time.monotonic() + args.seconds
+        health = requests.Session()
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            health.get(f'{base}/api/health', timeout=30)
+            latencies.append((time.perf_counter() - started) * 1000)
+            time.sleep(args.health_interval_ms / 1000.0)
+        stop.set()
+        for w in workers:
+            w.join(timeout=30)
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+    return {
+        'offload': offload,
+        'async_mode': async_mode,
+        'logins_completed': logins[0],
+        'logins_per_second': round(logins[0] / args.seconds, 1),
+        'health_samples': len(latencies),
+        'health_p50_ms': round(_percentile(latencies, 50), 1),
+        'health_p95_ms': round(_percentile(latencies, 95), 1),
+        'health_p99_ms': round(_percentile(latencies, 99), 1),
+        'health_max_ms': round(max(latencies, default=0.0), 1),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='로그인 부하 중 /api/health 지연 벤치마크')
+    parser.add_argument('--logins', type=int, default=8, help='동시 로그인 클라이언트 수')
+    parser.add_argument('--seconds', type=float, default=10.0)
+    parser.add_argument('--health-interval-ms', type=float, default=20.0)
+    parser.add_argument('--concurrency', type=int, default=2, help='PT_PASSWORD_HASH_CONCURRENCY')
+    parser.add_argument('--serve', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--port', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        serve(args.port)
+        return 0
+
+    results = [measure(False, args), measure(True, args)]
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False))
+        return 0
+
+    print('=' * 78)
+    print(f'/api/health under login load — {args.logins} login clients, {args.seconds:.0f}s, '
+          f'server={results[0]["async_mode"]}')
+    print('=' * 78)
+    print(f"{'offload':<9}{'logins/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}{'samples':>9}")
+    for r in results:
+        print(f"{str(r['offload']):<9}{r['logins_per_second']:>10}{r['health_p50_ms']:>9}"
+              f"{r['health_p95_ms']:>9}{r['health_p99_ms']:>9}{r['health_max_ms']:>9}{r['health_samples']:>9}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,300 @@
+"""데일리 푸시 tick 부하 벤치마크.
+
+합성 사용자(다양한 timezone/push_time) N명, 사용자당 PushTokens M개, 미리 만든
+DailyAssignments 를 시드한 뒤, 로컬 스텁 APNs/FCM/Grok 엔드포인트를 대상으로 tick 을
+1회 실행하고 wall time / 사용자당 DB 쿼리 수 / 초당 발송 수 / 피크 메모리를 출력한다.
+
+APNs JWT·FCM OAuth 토큰 발급만 고정값으로 대체하고, 실제 HTTP 발송과 Grok 호출은
+``push_dispatch`` / ``recommendations`` 코드 경로 그대로 로컬 스텁 서버로 나간다.
+
+사용법:
+    cd backend
+    python -m benchmarks.push_tick --users 2000 --tokens 2 --mode batched
+    python -m benchmarks.push_tick --users 2000 --mode sharded --shards 8 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+TIMEZONES = [
+    'Asia/Seoul', 'Asia/Tokyo', 'UTC', 'Europe/London', 'America/New_York',
+    'America/Los_Angeles', 'Australia/Sydney',
+]
+
+
+# --------------------------------------------------------------------
+# 로컬 스텁 서버 (APNs / FCM / Grok)
+# --------------------------------------------------------------------
+
+
+class StubStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts = {'apns': 0, 'fcm': 0, 'grok': 0, 'other': 0}
+
+    def hit(self, kind: str) -> None:
+        with self.lock:
+            self.counts[kind] += 1
+
+
+def _make_handler(stats: StubStats, push_latency: float, grok_latency: float):
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, *args):  # 조용히
+            pass
+
+        def _reply(self, payload: dict) -> None:
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            raw = self.rfile.read(length) if length else b''
+            if self.path.startswith('/3/device/'):
+                stats.hit('apns')
+                time.sleep(push_latency)
+                return self._reply({})
+            if '/messages:send' in self.path:
+                stats.hit('fcm')
+                time.sleep(push_latency)
+                return self._reply({'name': 'projects/bench/messages/1'})
+            if self.path.endswith('/chat/completions'):
+                stats.hit('grok')
+                time.sleep(grok_latency)
+                return self._reply(_grok_reply(raw))
+            stats.hit('other')
+            return self._reply({})
+
+    return StubHandler
+
+
+def _grok_reply(raw: bytes) -> dict:
+    """후보 목록 첫 번째 WOD를 고르는 Grok 응답 흉내."""
+    program_id = None
+    try:
+        messages = json.loads(raw)['messages']
+        context = json.loads(messages[-1]['content'].split('\n\n', 1)[1])
+        candidates = context.get('available_programs') or []
+        program_id = candidates[0]['id'] if candidates else None
+    except Exception:
+        pass
+    content = json.dumps({
+        'program_id': program_id,
+        'rationale': '벤치마크 스텁 추천',
+        'intensity_hint': 'moderate',
+        'duration_estimate_minutes': 20,
+    })
+    return {'choices': [{'message': {'content': content}}]}
+
+
+def start_stub_server(push_latency: float, grok_latency: float):
+    stats = StubStats()
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _make_handler(stats, push_latency, grok_latency))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, stats
+
+
+# --------------------------------------------------------------------
+# 시드
+# --------------------------------------------------------------------
+
+
+def seed(db, users: int, tokens_per_user: int, premade_ratio: float, due_ratio: float,
+         programs: int) -> None:
+    import pytz
+    from models.user import Users
+    from models.program import Programs
+    from models.exercise import ProgramExercises
+    from models.preference import UserPreferences
+    from models.push_token import PushTokens
+    from models.daily_assignment import DailyAssignments
+
+    db.session.bulk_insert_mappings(Users, [
+        {'id': 1, 'email': 'creator@bench.local', 'password_hash': '-', 'name': 'creator'},
+    ] + [
+        {'id': uid, 'email': f'user{uid}@bench.local', 'password_hash': '-', 'name': f'user{uid}'}
+        for uid in range(2, users + 2)
+    ])
+    db.session.bulk_insert_mappings(Programs, [
+        {'id': pid, 'creator_id': 1, 'title': f'Bench WOD {pid}', 'is_open': True,
+         'difficulty': 'intermediate', 'created_at': datetime.utcnow()}
+        for pid in range(1, programs + 1)
+    ])
+    db.session.bulk_insert_mappings(ProgramExercises, [
+        {'program_id': pid, 'exercise_id': ex, 'target_value': '10', 'order_index': ex}
+        for pid in range(1, programs + 1) for ex in range(1, 4)
+    ])
+
+    prefs, tokens, assignments = [], [], []
+    for index, uid in enumerate(range(2, users + 2)):
+        tz_name = TIMEZONES[index % len(TIMEZONES)]
+        local_now = datetime.now(pytz.timezone(tz_name))
+        due = (index % 100) < due_ratio * 100
+        push_at = local_now if due else local_now + timedelta(hours=3)
+        prefs.append({
+            'user_id': uid, 'timezone': tz_name, 'push_time': push_at.strftime('%H:%M'),
+            'push_enabled': True, 'available_minutes': 20, 'difficulty': 'intermediate',
+        })
+        for t in range(tokens_per_user):
+            tokens.append({
+                'user_id': uid, 'platform': 'ios' if t % 2 == 0 else 'android',
+                'token': f'bench-{uid}-{t}-token', 'is_active': True,
+            })
+        if (index % 100) < premade_ratio * 100:
+            assignments.append({
+                'user_id': uid, 'assignment_date': local_now.date(),
+                'program_id': (index % programs) + 1, 'source': 'ai_grok',
+                'duration_estimate_minutes': 20, 'refresh_count': 0,
+            })
+    db.session.bulk_insert_mappings(UserPreferences, prefs)
+    db.session.bulk_insert_mappings(PushTokens, tokens)
+    db.session.bulk_insert_mappings(DailyAssignments, assignments)
+    db.session.commit()
+
+
+# --------------------------------------------------------------------
+# 실행
+# --------------------------------------------------------------------
+
+
+def _configure_env(args, stub_url: str, db_url: str) -> None:
+    os.environ['DATABASE_URL'] = db_url
+    os.environ['PT_PUSH_WORKER_ENABLED'] = 'false'
+    os.environ['PT_PUSH_ENABLED'] = 'true'
+    os.environ['PT_PUSH_TICK_MODE'] = 'batched' if args.mode == 'batched' else args.shard_mode
+    os.environ['PT_PUSH_BATCH_SIZE'] = str(args.batch_size)
+    os.environ['PT_PUSH_SHAPING_WINDOW_SECONDS'] = '0'
+    os.environ['XAI_API_KEY'] = 'bench'
+    os.environ['XAI_API_URL'] = f'{stub_url}/v1/chat/completions'
+    os.environ['APNS_BASE_URL'] = stub_url
+    os.environ['FCM_BASE_URL'] = stub_url
+    for key in ('APNS_KEY_P8', 'APNS_KEY_ID', 'APNS_TEAM_ID', 'APNS_BUNDLE_ID'):
+        os.environ[key] = 'bench'
+    os.environ['FCM_SERVICE_ACCOUNT_JSON'] = '{"project_id": "bench"}'
+
+
+def run(args) -> dict:
+    server, stub_stats = start_stub_server(args.push_latency_ms / 1000.0, args.grok_latency_ms / 1000.0)
+    stub_url = f'http://127.0.0.1:{server.server_address[1]}'
+    db_url = args.database_url or 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'push_bench.db')
+    _configure_env(args, stub_url, db_url)
+
+    from sqlalchemy import event
+    from app import app, db, seed_exercise_data
+    from utils import push_dispatch, scheduler
+
+    # 자격증명 발급만 고정값으로 대체 (HTTP 발송은 스텁 서버로 실제 수행)
+    push_dispatch._apns_jwt = lambda: 'bench-jwt'
+    push_dispatch._fcm_access_token = lambda: ('bench-access-token', 'bench')
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        seed_exercise_data()
+        seed(db, args.users, args.tokens, args.premade, args.due_ratio, args.programs)
+        engine = db.engine
+
+    query_count = [0]
+    query_lock = threading.Lock()
+
+    def _count(*_):
+        with query_lock:
+            query_count[0] += 1
+
+    event.listen(engine, 'before_cursor_execute', _count)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    if args.mode == 'sequential':
+        scheduler.daily_push_tick(app)
+        detail = None
+    elif args.mode == 'batched':
+        detail = scheduler.batched_push_tick(app, batch_size=args.batch_size)
+    else:
+        detail = scheduler.sharded_push_tick(app, shards=args.shards, workers=args.workers,
+                                             budget_seconds=args.budget)
+    wall = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    event.remove(engine, 'before_cursor_execute', _count)
+    server.shutdown()
+
+    with app.app_context():
+        from models.daily_assignment import DailyAssignments
+        marked = DailyAssignments.query.filter(DailyAssignments.push_sent_at.isnot(None)).count()
+
+    sends = stub_stats.counts['apns'] + stub_stats.counts['fcm']
+    return {
+        'mode': args.mode if args.mode != 'sharded' else f'sharded/{args.shard_mode}x{args.shards}',
+        'users': args.users,
+        'tokens_per_user': args.tokens,
+        'users_marked': marked,
+        'wall_seconds': round(wall, 3),
+        'queries': query_count[0],
+        'queries_per_user': round(query_count[0] / max(marked, 1), 2),
+        'device_sends': sends,
+        'sends_per_second': round(sends / wall, 1) if wall else None,
+        'grok_calls': stub_stats.counts['grok'],
+        'peak_traced_mb': round(peak / 1024 / 1024, 2),
+        'max_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        'detail': detail,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='daily push tick 부하 벤치마크')
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--tokens', type=int, default=2, help='사용자당 PushTokens 수')
+    parser.add_argument('--programs', type=int, default=50)
+    parser.add_argument('--premade', type=float, default=0.5, help='오늘 배정을 미리 만들어 둘 비율')
+    parser.add_argument('--due-ratio', type=float, default=1.0, help='이번 tick 대상 사용자 비율')
+    parser.add_argument('--mode', choices=['sequential', 'batched', 'sharded'], default='sequential')
+    parser.add_argument('--shard-mode', choices=['sequential', 'batched'], default='sequential')
+    parser.add_argument('--shards', type=int, default=4)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--budget', type=float, default=480.0)
+    parser.add_argument('--batch-size', type=int, default=200)
+    parser.add_argument('--push-latency-ms', type=float, default=0.0)
+    parser.add_argument('--grok-latency-ms', type=float, default=0.0)
+    parser.add_argument('--database-url', help='기본: 임시 SQLite 파일')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON 한 줄로 출력')
+    args = parser.parse_args(argv)
+
+    result = run(args)
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, default=str))
+        return 0
+    print('=' * 60)
+    print(f"push tick benchmark — {result['mode']}")
+    print('=' * 60)
+    for key in ('users', 'tokens_per_user', 'users_marked', 'wall_seconds', 'queries',
+                'queries_per_user', 'device_sends', 'sends_per_second', 'grok_calls',
+                'peak_traced_mb', 'max_rss_mb'):
+        print(f'{key:>18}: {result[key]}')
+    if result['detail']:
+        print(f"{'detail':>18}: {json.dumps(result['detail'], ensure_ascii=False, default=str)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,426 @@
+"""엔드포인트별 SQL 쿼리 예산(query budget) 회귀 검사.
+
+임시 SQLite DB 에 현실적인 데이터셋을 시드하고, 등록된 블루프린트(programs, workout_records,
+goals, notifications, today, preferences, push, exercises)의 각 엔드포인트를 한 번씩 호출해
+실행된 SQL 수를 센다. 같은 검사를 데이터 규모 ``--small`` / ``--large`` 배로 두 번 돌려
+
+1. 큰 데이터셋에서의 쿼리 수가 ``BUDGETS`` 의 상한 이하인지
+2. 쿼리 수가 데이터 규모와 무관한지 (프로그램/기록 수가 늘어도 같아야 함 → N+1 없음)
+
+를 확인한다. 실패한 엔드포인트는 반복 실행된 SQL 패턴(리터럴 제거)을 횟수와 함께 출력한다.
+
+``KNOWN_N_PLUS_ONE`` 의 엔드포인트는 이미 알려진 N+1 이라 결과만 보고하고 실패로 치지 않는다.
+고치고 나면 목록에서 빼고 ``BUDGETS`` 에 상한을 적을 것.
+
+사용법:
+    cd backend
+    python -m benchmarks.query_budget            # 위반 시 exit 1
+    python -m benchmarks.query_budget --verbose  # 모든 엔드포인트의 쿼리 수 출력
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+import tempfile
+from collections import Counter
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# (method, path template, json body) — path 의 {name} 은 시드 결과 ids 로 채운다.
+# 변경 요청은 앞선 조회 결과에 영향을 주지 않도록 목록 뒤쪽에 둔다.
+ENDPOINTS = [
+    # exercises
+    ('GET', '/api/exercise-categories', None),
+    ('GET', '/api/exercises', None),
+    ('GET', '/api/programs/{own_program}/exercises', None),
+    # programs
+    ('GET', '/api/programs', None),
+    ('GET', '/api/programs/{own_program}', None),
+    ('GET', '/api/programs/{own_program}/participants', None),
+    ('GET', '/api/programs/{own_program}/results', None),
+    ('GET', '/api/user/programs', None),
+    ('GET', '/api/user/wod-status', None),
+    # workout_records
+    ('GET', '/api/programs/{own_program}/records', None),
+    ('GET', '/api/programs/{own_program}/leaderboard', None),
+    ('GET', '/api/users/records', None),
+    ('GET', '/api/users/records?cursor=', None),
+    ('GET', '/api/users/records/export', None),
+    ('GET', '/api/users/records/export?format=csv', None),
+    ('GET', '/api/users/records/stats', None),
+    # goals
+    ('GET', '/api/users/goals', None),
+    # notifications
+    ('GET', '/api/notifications', None),
+    ('GET', '/api/notifications?since=', None),
+    ('GET', '/api/notifications/unread-count', None),
+    # today / preferences / push
+    ('GET', '/api/today', None),
+    ('GET', '/api/me/preferences', None),
+    ('GET', '/api/me/push-tokens', None),
+    # --- 변경 ---
+    ('POST', '/api/programs', {
+        'title': 'Budget WOD', 'description': 'd', 'workout_type': 'time_based', 'difficulty': 'beginner',
+        'selected_exercises': [{'exercise_id': 1, 'target_value': '10'}, {'exercise_id': 2, 'target_value': '10'}],
+        'workout_pattern': {'type': 'fixed_reps', 'total_rounds': 3, 'exercises': [
+            {'exercise_id': 1, 'base_reps': 10, 'progression_type': 'fixed'},
+            {'exercise_id': 2, 'base_reps': 10, 'progression_type': 'fixed'},
+        ]},
+    }),
+    ('PUT', '/api/programs/{closed_program}', {'title': 'Budget WOD edited', 'description': 'd2'}),
+    ('POST', '/api/programs/{closed_program}/open', None),
+    ('POST', '/api/programs/{other_program}/join', None),
+    ('DELETE', '/api/programs/{other_program}/leave', None),
+    ('PUT', '/api/programs/{own_program}/participants/{pending_user}/approve', {'action': 'approve'}),
+    ('POST', '/api/programs/{own_program}/records', {'completion_time': 321, 'notes': 'n'}),
+    ('PUT', '/api/records/{own_record}', {'completion_time': 300, 'notes': 'n2'}),
+    ('DELETE', '/api/records/{own_record}', None),
+    ('POST', '/api/registrations/{own_registration}/result', {'result': '12:34'}),
+    ('POST', '/api/users/goals', {'program_id': '{goal_program}', 'target_time': 600}),
+    ('DELETE', '/api/users/goals/{own_goal}', None),
+    ('PUT', '/api/notifications/{own_notification}/read', None),
+    ('PUT', '/api/notifications/read-all', None),
+    ('PUT', '/api/me/preferences', {'difficulty': 'advanced', 'available_minutes': 30}),
+    ('POST', '/api/me/push-tokens', {'platform': 'ios', 'token': 'budget-token-0001'}),
+    ('DELETE', '/api/me/push-tokens/{own_push_token}', None),
+    ('POST', '/api/today/feedback', {'rating': 'easy'}),
+    ('POST', '/api/today/skip', None),
+    ('POST', '/api/today/complete', {'completion_time': 600}),
+    ('POST', '/api/today/refresh', None),
+    ('DELETE', '/api/programs/{delete_program}', None),
+]
+
+# 큰 데이터셋 기준 엔드포인트별 최대 쿼리 수. 인증/세션 조회 포함.
+BUDGETS = {
+    'GET /api/exercise-categories': 1,
+    'GET /api/exercises': 1,
+    'GET /api/programs/{own_program}/exercises': 4,
+    'GET /api/programs/{own_program}': 10,
+    'GET /api/user/wod-status': 4,
+    'GET /api/programs/{own_program}/records': 2,
+    'GET /api/programs/{own_program}/leaderboard': 5,
+    'GET /api/users/records': 1,
+    'GET /api/users/records?cursor=': 1,
+    'GET /api/users/records/export': 1,
+    'GET /api/users/records/export?format=csv': 1,
+    'GET /api/users/records/stats': 2,
+    'GET /api/notifications': 1,
+    'GET /api/notifications?since=': 2,
+    'GET /api/notifications/unread-count': 1,
+    'GET /api/today': 3,
+    'GET /api/me/preferences': 1,
+    'GET /api/me/push-tokens': 1,
+    'POST /api/programs': 11,
+    'PUT /api/programs/{closed_program}': 7,
+    'POST /api/programs/{closed_program}/open': 5,
+    'POST /api/programs/{other_program}/join': 8,
+    'DELETE /api/programs/{other_program}/leave': 2,
+    'PUT /api/programs/{own_program}/participants/{pending_user}/approve': 9,
+    'POST /api/programs/{own_program}/records': 6,
+    'PUT /api/records/{own_record}': 7,
+    'DELETE /api/records/{own_record}': 6,
+    'POST /api/registrations/{own_registration}/result': 2,
+    'POST /api/users/goals': 5,
+    'DELETE /api/users/goals/{own_goal}': 2,
+    'PUT /api/notifications/{own_notification}/read': 3,
+    'PUT /api/notifications/read-all': 2,
+    'PUT /api/me/preferences': 3,
+    'POST /api/me/push-tokens': 3,
+    'DELETE /api/me/push-tokens/{own_push_token}': 2,
+    'POST /api/today/feedback': 5,
+    'POST /api/today/skip': 5,
+    'POST /api/today/complete': 8,
+    'DELETE /api/programs/{delete_program}': 19,
+}
+
+# 알려진 N+1 (쿼리 수가 데이터 규모에 비례). 보고만 하고 실패로 치지 않는다.
+KNOWN_N_PLUS_ONE = {
+    'GET /api/programs',
+    'GET /api/programs/{own_program}/participants',
+    'GET /api/programs/{own_program}/results',
+    'GET /api/user/programs',
+    'GET /api/users/goals',
+    'POST /api/today/refresh',  # 후보 WOD 마다 패턴/운동 조회
+}
+
+
+# --------------------------------------------------------------------
+# 데이터셋
+# --------------------------------------------------------------------
+
+
+def seed(db, scale: int) -> dict:
+    """scale 배 규모의 데이터셋. 엔드포인트 path 를 채울 id 묶음을 반환."""
+    import pytz
+    from models import (
+        DailyAssignments, Exercises, ExerciseSets, Notifications, NotificationCounters, PersonalGoals,
+        ProgramExercises, ProgramParticipants, Programs, PushTokens, Registrations, UserPreferences,
+        Users, WorkoutPatterns, WorkoutRecords,
+    )
+    from routes.leaderboard import rebuild_leaderboard
+    from routes.workout_records import rebuild_record_rollups
+
+    now = datetime.utcnow()
+    viewer = Users(email='viewer@example.com', password_hash='x', name='viewer')
+    db.session.add(viewer)
+    others = [Users(email=f'user{i}@example.com', password_hash='x', name=f'user{i}') for i in range(10 * scale)]
+    db.session.add_all(others)
+    db.session.flush()
+
+    exercise_ids = [e.id for e in Exercises.query.limit(4)]
+
+    def _program(creator, title, is_open=True):
+        program = Programs(creator_id=creator.id, title=title, description='seed', workout_type='time_based',
+                           target_value='20분', difficulty='beginner', is_open=is_open, max_participants=200,
+                           expires_at=now + timedelta(days=7))
+        db.session.add(program)
+        db.session.flush()
+        for order, exercise_id in enumerate(exercise_ids[:3]):
+            db.session.add(ProgramExercises(program_id=program.id, exercise_id=exercise_id,
+                                            target_value='10회', order_index=order))
+        pattern = WorkoutPatterns(program_id=program.id, pattern_type='fixed_reps', total_rounds=3)
+        db.session.add(pattern)
+        db.session.flush()
+        for order, exercise_id in enumerate(exercise_ids[:2]):
+            db.session.add(ExerciseSets(pattern_id=pattern.id, exercise_id=exercise_id, base_reps=10,
+                                        progression_type='fixed', order_index=order))
+        return program
+
+    # 공개 WOD 는 사용자당 3개까지라 2개만 공개 (open 엔드포인트 성공 경로 측정)
+    own = [_program(viewer, f'Own WOD {i}', is_open=i < 2) for i in range(5 * scale)]
+    closed = _program(viewer, 'Closed WOD', is_open=False)
+    to_delete = _program(viewer, 'Delete WOD', is_open=False)
+    foreign = [_program(others[i % len(others)], f'Other WOD {i}') for i in range(10 * scale)]
+
+    pending_user = others[0]
+    for i, user in enumerate(others):
+        db.session.add(ProgramParticipants(program_id=own[0].id, user_id=user.id,
+                                           status='pending' if user is pending_user else 'approved'))
+        db.session.add(ProgramParticipants(program_id=to_delete.id, user_id=user.id, status='approved'))
+        for program in own[:3]:
+            db.session.add(WorkoutRecords(program_id=program.id, user_id=user.id,
+                                          completion_time=300 + i, completed_at=now - timedelta(days=i)))
+    db.session.add(ProgramParticipants(program_id=own[0].id, user_id=viewer.id, status='approved'))
+    for program in foreign[1:]:
+        db.session.add(ProgramParticipants(program_id=program.id, user_id=viewer.id, status='approved'))
+
+    registrations = []
+    for program in own + foreign:
+        registration = Registrations(program_id=program.id, user_id=viewer.id)
+        db.session.add(registration)
+        registrations.append(registration)
+
+    records = []
+    for i in range(20 * scale):
+        program = (own + foreign)[i % (len(own) + len(foreign))]
+        record = WorkoutRecords(program_id=program.id, user_id=viewer.id, completion_time=240 + i * 7,
+                                completed_at=now - timedelta(hours=i))
+        db.session.add(record)
+        records.append(record)
+
+    goals = []
+    for program in foreign[:5 * scale]:
+        goal = PersonalGoals(user_id=viewer.id, program_id=program.id, target_time=500)
+        db.session.add(goal)
+        goals.append(goal)
+
+    notifications = []
+    for i in range(20 * scale):
+        notification = Notifications(user_id=viewer.id, program_id=own[i % len(own)].id, type='seed',
+                                     title=f'N{i}', message='m', is_read=i % 2 == 0,
+                                     created_at=now - timedelta(minutes=i))
+        db.session.add(notification)
+        notifications.append(notification)
+    db.session.add(NotificationCounters(user_id=viewer.id, unread_count=10 * scale))
+    # add_record_rollups / add_program_leaderboard 마이그레이션을 마친 상태로
+    db.session.flush()
+    rebuild_record_rollups([viewer.id] + [user.id for user in others])
+    rebuild_leaderboard([program.id for program in own + foreign])
+
+    db.session.add(UserPreferences(user_id=viewer.id, timezone='Asia/Seoul', push_time='09:00'))
+    tokens = [PushTokens(user_id=viewer.id, platform='ios', token=f'seed-token-{i:04d}') for i in range(2 * scale)]
+    db.session.add_all(tokens)
+    today = datetime.now(pytz.timezone('Asia/Seoul')).date()
+    db.session.add(DailyAssignments(user_id=viewer.id, assignment_date=today, program_id=own[1].id,
+                                    source='fallback'))
+    db.session.commit()
+
+    return {
+        'viewer': viewer.id,
+        'own_program': own[0].id,
+        'closed_program': closed.id,
+        'delete_program': to_delete.id,
+        'other_program': foreign[0].id,
+        'goal_program': foreign[1].id,
+        'pending_user': pending_user.id,
+        'own_record': records[0].id,
+        'own_registration': registrations[0].id,
+        'own_goal': goals[0].id,
+        'own_notification': notifications[1].id,
+        'own_push_token': tokens[0].id,
+    }
+
+
+# --------------------------------------------------------------------
+# 측정
+# --------------------------------------------------------------------
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r'\((?:\s*\?\s*,)+\s*\?\s*\)')
+
+
+def statement_pattern(statement: str) -> str:
+    """리터럴/IN 목록을 지운 SQL 패턴 (같은 모양의 반복 쿼리 묶기용)."""
+    pattern = ' '.join(statement.split())
+    pattern = _LITERALS.sub('?', pattern)
+    return _IN_LIST.sub('(?...)', pattern)
+
+
+def _fill(value, ids: dict):
+    if isinstance(value, str):
+        return value.format(**ids)
+    if isinstance(value, dict):
+        return {k: (int(v.format(**ids)) if isinstance(v, str) and v.startswith('{') else _fill(v, ids))
+                for k, v in value.items()}
+    if isinstance(value, list):
+        return [_fill(v, ids) for v in value]
+    return value
+
+
+def measure(app, db, scale: int) -> dict[str, dict]:
+    from sqlalchemy import event
+    from utils.token import generate_access_token
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        from app import seed_exercise_data
+        seed_exercise_data()
+        ids = seed(db, scale)
+        token = generate_access_token(ids['viewer'])
+        engine = db.engine
+
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    client = app.test_client()
+    headers = {'Authorization': f'Bearer {token}'}
+    results = {}
+    event.listen(engine, 'before_cursor_execute', _record)
+    try:
+        for method, template, body in ENDPOINTS:
+            key = f'{method} {template}'
+            statements.clear()
+            response = client.open(_fill(template, ids), method=method, headers=headers,
+                                   json=_fill(body, ids) if body is not None else None)
+            # 스트리밍 응답은 본문을 끝까지 읽어야 쿼리가 실행되고, close 해야 요청 컨텍스트가 정리된다
+            response.get_data()
+            response.close()
+            results[key] = {
+                'status': response.status_code,
+                'queries': len(statements),
+                'patterns': Counter(statement_pattern(s) for s in statements),
+            }
+    finally:
+        event.remove(engine, 'before_cursor_execute', _record)
+    return results
+
+
+def evaluate(small: dict, large: dict) -> list[dict]:
+    rows = []
+    for key, result in large.items():
+        base = small[key]['queries']
+        budget = BUDGETS.get(key)
+        known = key in KNOWN_N_PLUS_ONE
+        problems = []
+        if result['status'] >= 500:
+            problems.append(f"HTTP {result['status']}")
+        if not known:
+            if budget is None:
+                problems.append('예산 미지정')
+            elif result['queries'] > budget:
+                problems.append(f"예산 초과 ({result['queries']} > {budget})")
+            if result['queries'] != base:
+                problems.append(f"데이터 규모에 따라 증가 ({base} → {result['queries']})")
+        notes = []
+        if known and result['queries'] == base:
+            notes.append('규모와 무관해짐 — KNOWN_N_PLUS_ONE 에서 빼고 BUDGETS 에 추가')
+        rows.append({
+            'endpoint': key,
+            'status': result['status'],
+            'queries_small': base,
+            'queries_large': result['queries'],
+            'budget': budget,
+            'known_n_plus_one': known,
+            'problems': problems,
+            'notes': notes,
+            'patterns': result['patterns'],
+        })
+    return rows
+
+
+def _print_patterns(patterns: Counter, limit: int = 5) -> None:
+    for pattern, count in patterns.most_common(limit):
+        if count < 2 and limit > 1:
+            break
+        print(f'      {count:>4} × {pattern[:160]}')
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='엔드포인트별 쿼리 예산 검사')
+    parser.add_argument('--small', type=int, default=1, help='작은 데이터셋 배수')
+    parser.add_argument('--large', type=int, default=3, help='큰 데이터셋 배수')
+    parser.add_argument('--database-url', help='기본: 임시 SQLite 파일')
+    parser.add_argument('--verbose', action='store_true')
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args(argv)
+
+    os.environ['DATABASE_URL'] = args.database_url or 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'budget.db')
+    os.environ['PT_PUSH_WORKER_ENABLED'] = 'false'
+    os.environ['MARKETPLACE_ENABLED'] = 'true'
+    os.environ['PT_EMIT_COALESCE_MS'] = '0'
+    os.environ.setdefault('PT_LOG_LEVEL', 'WARNING')
+    os.environ.setdefault('PT_LOG_FILE', '')
+    os.environ.pop('XAI_API_KEY', None)
+
+    from app import app, db
+
+    small = measure(app, db, args.small)
+    large = measure(app, db, args.large)
+    rows = evaluate(small, large)
+    failures = [r for r in rows if r['problems']]
+
+    if args.json:
+        print(json.dumps([{k: v for k, v in r.items() if k != 'patterns'} for r in rows], ensure_ascii=False))
+        return 1 if failures else 0
+
+    print('=' * 96)
+    print(f'query budget — dataset x{args.small} vs x{args.large}')
+    print('=' * 96)
+    for r in rows:
+        if not (args.verbose or r['problems'] or r['known_n_plus_one']):
+            continue
+        tag = 'FAIL' if r['problems'] else ('N+1 ' if r['known_n_plus_one'] else 'ok  ')
+        budget = '-' if r['budget'] is None else r['budget']
+        print(f"{tag} {r['endpoint']:<70} {r['queries_small']:>4} → {r['queries_large']:<4} "
+              f"budget {budget:<4} HTTP {r['status']}")
+        for problem in r['problems']:
+            print(f'      ! {problem}')
+        for note in r['notes']:
+            print(f'      * {note}')
+        if r['problems'] or (args.verbose and r['known_n_plus_one']):
+            _print_patterns(r['patterns'])
+    known = sum(1 for r in rows if r['known_n_plus_one'])
+    print(f'\n{len(rows)} endpoints, {len(failures)} failing, {known} known N+1')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
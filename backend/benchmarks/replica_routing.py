@@ -0,0 +1,152 @@
+"""읽기 복제본 라우팅 / read-your-writes 검증 (두 개의 로컬 SQLite 파일).
+
+primary DB 를 만들어 시드한 뒤 파일을 그대로 복사해 replica 로 쓴다. 이후의 쓰기는 primary 에만
+들어가므로 replica 는 "복제 지연 중" 상태가 된다. 두 엔진에 실행된 SELECT 수를 세어 다음을 검사한다.
+
+1. ``@read_replica`` GET → replica 만 사용
+2. 쓰기(PUT) → primary
+3. 쓰기 직후 같은 클라이언트의 GET → primary (방금 쓴 값이 보여야 함)
+4. 같은 세션 쿠키를 다른 워커(새 test client)로 보내도 primary — stickiness 가 쿠키에 실려 다님
+5. 쿠키 없는 클라이언트의 GET → replica
+6. ``PT_REPLICA_STICKY_SECONDS`` 가 지나면 다시 replica
+
+실패가 하나라도 있으면 종료 코드 1.
+
+사용법:
+    cd backend
+    python -m benchmarks.replica_routing --sticky 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+def _setup(workdir: str, sticky: float):
+    primary = os.path.join(workdir, 'primary.db')
+    replica = os.path.join(workdir, 'replica.db')
+    os.environ['DATABASE_URL'] = 'sqlite:///' + primary
+    os.environ['DATABASE_REPLICA_URL'] = 'sqlite:///' + replica
+    os.environ['PT_REPLICA_STICKY_SECONDS'] = str(sticky)
+    os.environ['PT_PUSH_WORKER_ENABLED'] = 'false'
+    os.environ.setdefault('PT_LOG_LEVEL', 'WARNING')
+    os.environ.setdefault('PT_LOG_FILE', '')
+
+    from app import app, db
+    from models.notification import Notifications
+    from models.user import Users
+    from utils.token import generate_access_token
+
+    with app.app_context():
+        db.create_all()
+        user = Users(email='replica@example.com', password_hash='x', name='replica')
+        db.session.add(user)
+        db.session.flush()
+        for i in range(3):
+            db.session.add(Notifications(user_id=user.id, type='bench', title=f'n{i}', message='m', is_read=False))
+        db.session.commit()
+        token = generate_access_token(user.id)
+        db.engines[None].dispose()
+        db.engines['replica'].dispose()
+    shutil.copyfile(primary, replica)
+    return app, db, token
+
+
+class _Counter:
+    def __init__(self, db):
+        from sqlalchemy import event
+
+        self.counts = {'primary': 0, 'replica': 0}
+        for name, engine in (('primary', db.engines[None]), ('replica', db.engines['replica'])):
+            event.listen(engine, 'before_cursor_execute', self._listener(name))
+
+    def _listener(self, name):
+        def _count(conn, cursor, statement, *_):
+            if statement.lstrip().upper().startswith('SELECT'):
+                self.counts[name] += 1
+        return _count
+
+    def reset(self):
+        self.counts = {'primary': 0, 'replica': 0}
+
+
+def _session_cookie(response, cookie_name: str) -> str | None:
+    for header in response.headers.getlist('Set-Cookie'):
+        if header.startswith(cookie_name + '='):
+            return header.split(';', 1)[0]
+    return None
+
+
+def run(args) -> list[dict]:
+    app, db, token = _setup(tempfile.mkdtemp(), args.sticky)
+    cookie_name = app.config.get('SESSION_COOKIE_NAME', 'session')
+    auth = {'Authorization': f'Bearer {token}'}
+    rows = []
+
+    with app.app_context():
+        counter = _Counter(db)
+
+    def step(name, method, path, expect, cookie=None):
+        # Secure 쿠키는 http test client 가 다시 보내지 않으므로 Cookie 헤더를 직접 싣는다
+        headers = dict(auth, **({'Cookie': cookie} if cookie else {}))
+        counter.reset()
+        response = app.test_client(use_cookies=False).open(path, method=method, headers=headers)
+        counts = dict(counter.counts)
+        used = {target for target, n in counts.items() if n}
+        ok = response.status_code < 400 and (expect is None or used == {expect})
+        row = {'step': name, 'status': response.status_code, 'expect': expect or '-', **counts, 'ok': ok}
+        rows.append(row)
+        return response, row
+
+    step('GET (no write yet)', 'GET', '/api/notifications', 'replica')
+    write, _ = step('PUT read-all', 'PUT', '/api/notifications/read-all', None)
+    cookie = _session_cookie(write, cookie_name)
+    response, row = step('GET after write', 'GET', '/api/notifications', 'primary', cookie)
+    unread_seen = [n for n in (response.get_json() or []) if not n.get('is_read')]
+    if unread_seen:
+        row['ok'] = False
+        row['note'] = f'{len(unread_seen)} stale unread rows'
+    step('GET other worker, same cookie', 'GET', '/api/notifications', 'primary', cookie)
+    step('GET without cookie', 'GET', '/api/notifications', 'replica')
+    time.sleep(args.sticky + 0.2)
+    step(f'GET after {args.sticky:g}s window', 'GET', '/api/notifications', 'replica', cookie)
+    if cookie is None:
+        rows[1]['ok'] = False
+        rows[1]['note'] = 'write response has no session cookie'
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='읽기 복제본 라우팅 검증')
+    parser.add_argument('--sticky', type=float, default=1.0, help='PT_REPLICA_STICKY_SECONDS')
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args(argv)
+
+    rows = run(args)
+    failures = [r for r in rows if not r['ok']]
+    if args.json:
+        print(json.dumps(rows, ensure_ascii=False))
+        return 1 if failures else 0
+
+    print('=' * 78)
+    print(f'replica routing — sticky {args.sticky:g}s, two local SQLite files')
+    print('=' * 78)
+    print(f"{'':5}{'step':<34}{'HTTP':>5}{'expect':>9}{'primary':>9}{'replica':>9}")
+    for r in rows:
+        tag = 'ok  ' if r['ok'] else 'FAIL'
+        print(f"{tag} {r['step']:<34}{r['status']:>5}{r['expect']:>9}{r['primary']:>9}{r['replica']:>9}"
+              f"{'  ! ' + r['note'] if r.get('note') else ''}")
+    print(f'\n{len(rows)} steps, {len(failures)} failing')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
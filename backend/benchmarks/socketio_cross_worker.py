@@ -0,0 +1,184 @@
+"""두 워커 프로세스 간 Socket.IO 실시간 알림 전달 검증.
+
+워커 A, B 를 서로 다른 포트로 띄우고 두 워커에 각각 소켓 클라이언트를 붙여 같은
+``user_{id}`` room 에 참여시킨다. 그 뒤 워커 A 에 HTTP 로 참여 승인을 요청해
+참여자 알림(``create_notification``)을 발생시키고, 워커 B 에 붙은 클라이언트까지
+``notification`` 이벤트를 받는지 확인한다.
+
+메시지 큐가 없으면 워커 B 쪽은 받지 못하는 것이 정상이다 (``--no-queue`` 로 확인 가능).
+
+사용법:
+    cd backend
+    python -m benchmarks.socketio_cross_worker \\
+        --database-url postgresql://localhost/wodybody_dev --queue postgres
+    python -m benchmarks.socketio_cross_worker \\
+        --database-url postgresql://localhost/wodybody_dev --queue redis://localhost:6379/0
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import threading
+import time
+import uuid
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, BACKEND_DIR)
+
+
+def serve(port: int) -> None:
+    """워커 프로세스 진입점 (threading 모드 socketio.run)."""
+    from app import app, socketio
+    socketio.run(app, port=port, host='127.0.0.1', allow_unsafe_werkzeug=True)
+
+
+def _wait_healthy(base_url: str, timeout: float) -> None:
+    import requests
+
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if requests.get(f'{base_url}/api/health', timeout=1).status_code == 200:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.3)
+    raise RuntimeError(f'{base_url} 워커가 {timeout:.0f}초 안에 기동하지 않았습니다')
+
+
+def _seed(password: str) -> tuple[str, str, int, int]:
+    """크리에이터 + 승인 대기 참여자 + WOD 1개 생성. (creator_email, participant_email, participant_id, program_id)"""
+    from app import app, db
+    from models.user import Users
+    from models.program import Programs, ProgramParticipants
+
+    suffix = uuid.uuid4().hex[:8]
+    with app.app_context():
+        db.create_all()
+        creator = Users(email=f'xworker-creator-{suffix}@bench.local', name='creator')
+        creator.set_password(password)
+        participant = Users(email=f'xworker-member-{suffix}@bench.local', name='member')
+        participant.set_password(password)
+        db.session.add_all([creator, participant])
+        db.session.flush()
+        program = Programs(creator_id=creator.id, title=f'Cross worker {suffix}', max_participants=10)
+        db.session.add(program)
+        db.session.flush()
+        db.session.add(ProgramParticipants(program_id=program.id, user_id=participant.id, status='pending'))
+        db.session.commit()
+        return creator.email, participant.email, participant.id, program.id
+
+
+def _client(base_url: str, user_id: int, token: str, received: list, event: threading.Event):
+    """user_id 로 로그인한 소켓 (room/presence 는 연결 시 검증한 토큰 기준)"""
+    import socketio
+
+    client = socketio.Client()
+
+    @client.on('notification')
+    def _on_notification(data):
+        received.append(data)
+        event.set()
+
+    client.connect(base_url, transports=['polling'], auth={'token': token})
+    client.emit('join_user_room', {'user_id': user_id})
+    return client
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Socket.IO 크로스 워커 전달 검증')
+    parser.add_argument('--serve', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--database-url', default=os.environ.get('DATABASE_URL'))
+    parser.add_argument('--queue', default=os.environ.get('SOCKETIO_MESSAGE_QUEUE', 'postgres'))
+    parser.add_argument('--no-queue', action='store_true', help='메시지 큐 없이 실행 (대조군)')
+    parser.add_argument('--ports', type=int, nargs=2, default=[5101, 5102])
+    parser.add_argument('--timeout', type=float, default=10.0)
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        serve(args.serve)
+        return 0
+
+    if not args.database_url:
+        parser.error('--database-url (두 워커가 공유할 DB) 가 필요합니다')
+    os.environ['DATABASE_URL'] = args.database_url
+    os.environ['PT_PUSH_WORKER_ENABLED'] = 'false'
+    # 승인 라우트는 마켓플레이스 플래그 뒤에 있다
+    os.environ['MARKETPLACE_ENABLED'] = 'true'
+    # 한 워커에서 발급한 access token 을 다른 워커도 검증할 수 있도록 공유
+    os.environ.setdefault('SECRET_KEY', uuid.uuid4().hex)
+    if args.no_queue:
+        os.environ.pop('SOCKETIO_MESSAGE_QUEUE', None)
+    else:
+        os.environ['SOCKETIO_MESSAGE_QUEUE'] = args.queue
+
+    import requests
+
+    password = uuid.uuid4().hex
+    creator_email, participant_email, participant_id, program_id = _seed(password)
+
+    workers = [
+        subprocess.Popen([sys.executable, '-m', 'benchmarks.socketio_cross_worker', '--serve', str(port)],
+                         cwd=BACKEND_DIR, env=os.environ.copy(),
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        for port in args.ports
+    ]
+    urls = [f'http://127.0.0.1:{port}' for port in args.ports]
+    clients = []
+    try:
+        for url in urls:
+            _wait_healthy(url, args.timeout * 3)
+
+        worker_a = urls[0]
+        member = requests.post(f'{worker_a}/api/login', json={'email': participant_email, 'password': password},
+                               timeout=5).json().get('access_token')
+        received = {url: [] for url in urls}
+        events = {url: threading.Event() for url in urls}
+        clients = [_client(url, participant_id, member, received[url], events[url]) for url in urls]
+        time.sleep(0.5)  # join_user_room 처리 대기
+
+        login = requests.post(f'{worker_a}/api/login', json={'email': creator_email, 'password': password}, timeout=5)
+        token = login.json().get('access_token')
+        started = time.perf_counter()
+        resp = requests.put(f'{worker_a}/api/programs/{program_id}/participants/{participant_id}/approve',
+                            json={'action': 'approve'},
+                            headers={'Authorization': f'Bearer {token}'}, timeout=10)
+        if resp.status_code != 200:
+            print(f'❌ 워커 A 승인 요청 실패: {resp.status_code} {resp.text}')
+            return 1
+
+        for url in urls:
+            events[url].wait(args.timeout)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        mode = 'no queue' if args.no_queue else args.queue.split('://', 1)[0]
+        print('=' * 60)
+        print(f'Socket.IO cross-worker delivery — {mode}')
+        print('=' * 60)
+        for label, url in zip(('A (emit)', 'B (remote)'), urls):
+            status = '✅ 수신' if received[url] else '❌ 미수신'
+            print(f'  worker {label:<11} {url}: {status} ({len(received[url])}건)')
+        print(f'  elapsed: {elapsed_ms:.0f} ms')
+
+        delivered_remote = bool(received[urls[1]])
+        return 0 if delivered_remote != args.no_queue else 1
+    finally:
+        for client in clients:
+            try:
+                client.disconnect()
+            except Exception:
+                pass
+        for proc in workers:
+            proc.terminate()
+        for proc in workers:
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""프로그램 알림 fan-out 벤치마크: 전체 브로드캐스트 vs 토픽 room.
+
+실제 네트워크 없이 python-socketio 서버 매니저에 N개의 가상 소켓을 등록하고
+(``eio.send`` 를 카운터로 대체), 같은 ``program_notification`` 을
+
+- broadcast: room 없이 전체 emit (기존 동작)
+- topic: ``program_topic_rooms`` 가 돌려준 room 목록에만 emit
+
+으로 반복 전송해 이벤트당 소요 시간과 전송 프레임/바이트 수를 비교한다.
+
+구독 분포(기본값): 각 소켓은 난이도 3종 중 하나를 ``--difficulty-share`` 확률로 구독하고,
+``--program-share`` 확률로 프로그램 ``--programs`` 개 중 하나를 구독한다.
+
+사용법:
+    cd backend
+    python -m benchmarks.topic_fanout --sockets 5000 --events 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from routes.notifications import TOPIC_DIFFICULTIES, program_topic_rooms  # noqa: E402
+
+
+class _Counter:
+    def __init__(self):
+        self.frames = 0
+        self.bytes = 0
+
+    def send(self, eio_sid, data):
+        self.frames += 1
+        self.bytes += len(data) if isinstance(data, (str, bytes)) else 0
+
+
+def build_server(sockets: int, programs: int, difficulty_share: float, program_share: float, seed: int):
+    import socketio
+
+    server = socketio.Server(async_mode='threading')
+    counter = _Counter()
+    server.eio.send = counter.send
+
+    rng = random.Random(seed)
+    for i in range(sockets):
+        sid = server.manager.connect(f'eio-{i}', '/')
+        if rng.random() < difficulty_share:
+            server.manager.enter_room(sid, '/', f'difficulty_{rng.choice(TOPIC_DIFFICULTIES)}')
+        if rng.random() < program_share:
+            server.manager.enter_room(sid, '/', f'program_{rng.randint(1, programs)}')
+    return server, counter
+
+
+def _events(count: int, programs: int, seed: int):
+    rng = random.Random(seed + 1)
+    for i in range(count):
+        program_id = rng.randint(1, programs)
+        yield program_id, rng.choice(TOPIC_DIFFICULTIES), {
+            'program_id': program_id,
+            'type': 'program_opened',
+            'title': '새로운 프로그램이 공개되었습니다',
+            'message': f'새로운 "Bench WOD {program_id}" 프로그램이 공개되었습니다.',
+            'created_at': '2025-01-01T00:00:00',
+        }
+
+
+def run_mode(mode: str, args) -> dict:
+    server, counter = build_server(args.sockets, args.programs, args.difficulty_share,
+                                   args.program_share, args.seed)
+    started = time.perf_counter()
+    for program_id, difficulty, data in _events(args.events, args.programs, args.seed):
+        if mode == 'broadcast':
+            server.emit('program_notification', data)
+        else:
+            server.emit('program_notification', data, to=program_topic_rooms(program_id, difficulty))
+    elapsed = time.perf_counter() - started
+    return {
+        'mode': mode,
+        'sockets': args.sockets,
+        'events': args.events,
+        'elapsed_seconds': round(elapsed, 3),
+        'ms_per_event': round(elapsed * 1000 / args.events, 3),
+        'frames': counter.frames,
+        'frames_per_event': round(counter.frames / args.events, 1),
+        'megabytes': round(counter.bytes / 1024 / 1024, 2),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='program_notification fan-out 벤치마크')
+    parser.add_argument('--sockets', type=int, default=5000)
+    parser.add_argument('--events', type=int, default=200)
+    parser.add_argument('--programs', type=int, default=200)
+    parser.add_argument('--difficulty-share', type=float, default=0.3,
+                        help='난이도 토픽을 구독한 소켓 비율')
+    parser.add_argument('--program-share', type=float, default=0.1,
+                        help='개별 프로그램 토픽을 구독한 소켓 비율')
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args(argv)
+
+    results = [run_mode('broadcast', args), run_mode('topic', args)]
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False))
+        return 0
+
+    print('=' * 72)
+    print(f'program_notification fan-out — {args.sockets} sockets, {args.events} events')
+    print('=' * 72)
+    print(f"{'mode':<10}{'ms/event':>12}{'frames/event':>15}{'total MB':>12}{'elapsed s':>12}")
+    for r in results:
+        print(f"{r['mode']:<10}{r['ms_per_event']:>12}{r['frames_per_event']:>15}"
+              f"{r['megabytes']:>12}{r['elapsed_seconds']:>12}")
+    broadcast, topic = results
+    if topic['ms_per_event']:
+        print(f"\ntopic 전송이 이벤트당 {broadcast['ms_per_event'] / topic['ms_per_event']:.1f}배 빠름, "
+              f"프레임 {broadcast['frames_per_event'] / max(topic['frames_per_event'], 0.1):.1f}배 감소")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
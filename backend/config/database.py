@@ -1,8 +1,10 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_socketio import SocketIO
 
-# 전역 객체들
-db = SQLAlchemy()
+from utils.db_routing import RoutingSession
+
+# 전역 객체들 (DATABASE_REPLICA_URL 설정 시 GET 조회를 복제본으로 보내는 세션)
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 socketio = SocketIO()
 
 def init_database(app):
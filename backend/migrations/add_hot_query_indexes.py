@@ -0,0 +1,112 @@
+"""자주 도는 조회(공개 WOD 목록, 내 WOD, 참여자 수, 기록 목록, 운동/패턴 조회)용 인덱스 추가.
+
+- programs(is_open, created_at), programs(creator_id, created_at)
+- program_participants(program_id, status)
+- workout_records(user_id, completed_at)
+- workout_patterns(program_id)
+- exercise_sets(pattern_id, order_index)
+- program_exercises(program_id, order_index)
+
+notifications(user_id, created_at) 는 add_notification_sync.py 의
+idx_notifications_user_created_id (user_id, created_at, id) 가 이미 덮으므로 만들지 않는다.
+
+PostgreSQL 에서는 운영 중 쓰기를 막지 않도록 ``CREATE INDEX CONCURRENTLY`` 로 만든다.
+CONCURRENTLY 는 트랜잭션 안에서 실행할 수 없어 AUTOCOMMIT 연결을 쓴다. 이전 실행이 중간에
+끊겨 INVALID 상태로 남은 인덱스는 지우고 다시 만든다.
+
+PostgreSQL과 SQLite 양쪽에서 IDEMPOTENT하게 동작하도록 작성.
+사용법:
+    cd backend
+    python migrations/add_hot_query_indexes.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import app, db  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+
+# (인덱스 이름, 테이블, 컬럼)
+INDEXES = [
+    ('idx_programs_open_created', 'programs', 'is_open, created_at'),
+    ('idx_programs_creator_created', 'programs', 'creator_id, created_at'),
+    ('idx_program_participants_program_status', 'program_participants', 'program_id, status'),
+    ('idx_workout_records_user_completed', 'workout_records', 'user_id, completed_at'),
+    ('idx_workout_patterns_program', 'workout_patterns', 'program_id'),
+    ('idx_exercise_sets_pattern_order', 'exercise_sets', 'pattern_id, order_index'),
+    ('idx_program_exercises_program_order', 'program_exercises', 'program_id, order_index'),
+]
+
+PG_STATEMENTS = [
+    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table}({columns});"
+    for name, table, columns in INDEXES
+]
+
+SQLITE_STATEMENTS = [
+    f"CREATE INDEX IF NOT EXISTS {name} ON {table}({columns});"
+    for name, table, columns in INDEXES
+]
+
+# CONCURRENTLY 빌드가 실패하면 인덱스가 INVALID 로 남고 IF NOT EXISTS 가 건너뛰어 버린다.
+INVALID_INDEX_QUERY = """
+    SELECT c.relname
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    WHERE NOT i.indisvalid AND c.relname = ANY(:names)
+"""
+
+
+def is_postgres():
+    uri = app.config.get('SQLALCHEMY_DATABASE_URI', '')
+    return uri.startswith('postgres')
+
+
+def _run_postgres():
+    names = [name for name, _, _ in INDEXES]
+    with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+        invalid = [row[0] for row in conn.execute(text(INVALID_INDEX_QUERY), {'names': names})]
+        for name in invalid:
+            print(f'↺  INVALID 인덱스 재생성: {name}')
+            conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS {name};'))
+        for stmt in PG_STATEMENTS:
+            try:
+                conn.execute(text(stmt))
+                print(f'  ✓ {stmt}')
+            except Exception as exc:
+                print(f'⚠️  실행 실패 (계속 진행): {exc}\n  SQL: {stmt.strip()[:80]}…')
+
+
+def _run_sqlite():
+    for stmt in SQLITE_STATEMENTS:
+        try:
+            db.session.execute(text(stmt))
+            db.session.commit()
+            print(f'  ✓ {stmt}')
+        except Exception as exc:
+            db.session.rollback()
+            print(f'⚠️  실행 실패 (계속 진행): {exc}\n  SQL: {stmt.strip()[:80]}…')
+
+
+def run():
+    backend = 'PostgreSQL' if is_postgres() else 'SQLite'
+    print('=' * 60)
+    print(f'조회 경로 인덱스 마이그레이션 시작 ({backend})')
+    print('=' * 60)
+    with app.app_context():
+        if is_postgres():
+            _run_postgres()
+        else:
+            _run_sqlite()
+        # 새 인덱스를 플래너가 바로 고려하도록 통계 갱신
+        tables = sorted({table for _, table, _ in INDEXES})
+        with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            for table in tables:
+                conn.execute(text(f'ANALYZE {table};'))
+    print(f'✅ 마이그레이션 완료: 인덱스 {len(INDEXES)}개')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,38 @@
+-- 자주 도는 조회 경로 인덱스 (PostgreSQL).
+-- IDEMPOTENT: CREATE INDEX CONCURRENTLY IF NOT EXISTS 사용.
+-- CONCURRENTLY 는 트랜잭션 블록 안에서 실행할 수 없으므로 psql 에서 그대로(-1 / BEGIN 없이) 실행할 것.
+-- 빌드가 중간에 실패해 INVALID 로 남은 인덱스는 DROP INDEX CONCURRENTLY 후 다시 실행.
+-- notifications(user_id, created_at) 는 idx_notifications_user_created_id 가 이미 덮는다.
+
+-- 공개 WOD 최신순 목록
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_programs_open_created
+    ON programs(is_open, created_at);
+
+-- 내 WOD 목록 / 개수
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_programs_creator_created
+    ON programs(creator_id, created_at);
+
+-- 승인 인원 수 / 상태별 참여자
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_program_participants_program_status
+    ON program_participants(program_id, status);
+
+-- 사용자별 기록 목록 / 통계
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_workout_records_user_completed
+    ON workout_records(user_id, completed_at);
+
+-- 프로그램별 WOD 패턴 / 세트 / 운동
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_workout_patterns_program
+    ON workout_patterns(program_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_exercise_sets_pattern_order
+    ON exercise_sets(pattern_id, order_index);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_program_exercises_program_order
+    ON program_exercises(program_id, order_index);
+
+ANALYZE programs;
+ANALYZE program_participants;
+ANALYZE workout_records;
+ANALYZE workout_patterns;
+ANALYZE exercise_sets;
+ANALYZE program_exercises;
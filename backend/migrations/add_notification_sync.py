@@ -0,0 +1,96 @@
+"""알림 커서 동기화 인덱스 + 안 읽은 알림 카운터 테이블을 추가하고 카운터를 채운다.
+
+- notifications(user_id, created_at, id) 복합 인덱스 (최신순 조회)
+- notifications(user_id, id) 복합 인덱스 (?since 커서 — id 키셋)
+- notification_counters(user_id PK, unread_count, prune_seq) 테이블 + 현재 안 읽은 수 백필
+  (prune_seq: 알림 삭제/압축 때 올라가며 이전 커서를 무효화. 이미 테이블이 있으면 컬럼만 추가)
+
+PostgreSQL과 SQLite 양쪽에서 IDEMPOTENT하게 동작하도록 작성.
+사용법:
+    cd backend
+    python migrations/add_notification_sync.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import app, db  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+
+PG_STATEMENTS = [
+    "CREATE INDEX IF NOT EXISTS idx_notifications_user_created_id "
+    "ON notifications(user_id, created_at, id);",
+    "CREATE INDEX IF NOT EXISTS idx_notifications_user_id_id "
+    "ON notifications(user_id, id);",
+    """
+    CREATE TABLE IF NOT EXISTS notification_counters (
+        user_id INTEGER PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+        unread_count INTEGER NOT NULL DEFAULT 0,
+        prune_seq INTEGER NOT NULL DEFAULT 0,
+        updated_at TIMESTAMP DEFAULT NOW()
+    );
+    """,
+    "ALTER TABLE notification_counters ADD COLUMN IF NOT EXISTS prune_seq INTEGER NOT NULL DEFAULT 0;",
+]
+
+SQLITE_STATEMENTS = [
+    "CREATE INDEX IF NOT EXISTS idx_notifications_user_created_id "
+    "ON notifications(user_id, created_at, id);",
+    "CREATE INDEX IF NOT EXISTS idx_notifications_user_id_id "
+    "ON notifications(user_id, id);",
+    """
+    CREATE TABLE IF NOT EXISTS notification_counters (
+        user_id INTEGER PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+        unread_count INTEGER NOT NULL DEFAULT 0,
+        prune_seq INTEGER NOT NULL DEFAULT 0,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+    """,
+    # SQLite 는 ADD COLUMN IF NOT EXISTS 가 없다 — 새로 만든 테이블이면 '이미 존재' 로 실패하고 넘어간다
+    "ALTER TABLE notification_counters ADD COLUMN prune_seq INTEGER NOT NULL DEFAULT 0;",
+]
+
+# 현재 안 읽은 수로 덮어쓴다 (재실행해도 같은 결과). 안 읽은 알림이 없는 사용자는
+# 최초 조회 시 0 으로 채워진다.
+BACKFILL_STATEMENT = """
+    INSERT INTO notification_counters (user_id, unread_count, updated_at)
+    SELECT user_id, COUNT(*), CURRENT_TIMESTAMP
+    FROM notifications
+    WHERE is_read = :unread
+    GROUP BY user_id
+    ON CONFLICT (user_id) DO UPDATE SET
+        unread_count = excluded.unread_count,
+        updated_at = excluded.updated_at;
+"""
+
+
+def is_postgres():
+    uri = app.config.get('SQLALCHEMY_DATABASE_URI', '')
+    return uri.startswith('postgres')
+
+
+def run():
+    statements = PG_STATEMENTS if is_postgres() else SQLITE_STATEMENTS
+    backend = 'PostgreSQL' if is_postgres() else 'SQLite'
+    print('=' * 60)
+    print(f'알림 동기화 인덱스 / 안 읽은 카운터 마이그레이션 시작 ({backend})')
+    print('=' * 60)
+    with app.app_context():
+        for stmt in statements:
+            try:
+                db.session.execute(text(stmt))
+                db.session.commit()
+            except Exception as exc:
+                db.session.rollback()
+                print(f'⚠️  실행 실패 (계속 진행): {exc}\n  SQL: {stmt.strip()[:80]}…')
+        # SQLite 는 INSERT ... SELECT ... ON CONFLICT 에서 WHERE 절이 있어야 파싱 모호성이 없다 (위 쿼리는 충족)
+        result = db.session.execute(text(BACKFILL_STATEMENT), {'unread': False})
+        db.session.commit()
+    print(f'✅ 마이그레이션 완료: idx_notifications_user_created_id / user_id_id + notification_counters (백필 {result.rowcount}명)')
+
+
+if __name__ == '__main__':
+    run()
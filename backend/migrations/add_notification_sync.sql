@@ -0,0 +1,31 @@
+-- 알림 커서 동기화 인덱스 + 안 읽은 알림 카운터 (PostgreSQL).
+-- IDEMPOTENT: CREATE ... IF NOT EXISTS / ON CONFLICT DO UPDATE 사용.
+
+-- 사용자별 최신순 조회
+CREATE INDEX IF NOT EXISTS idx_notifications_user_created_id
+    ON notifications(user_id, created_at, id);
+
+-- ?since=<cursor> 키셋 조회 (id 기준)
+CREATE INDEX IF NOT EXISTS idx_notifications_user_id_id
+    ON notifications(user_id, id);
+
+-- 배지용 안 읽은 알림 수
+CREATE TABLE IF NOT EXISTS notification_counters (
+    user_id INTEGER PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+    unread_count INTEGER NOT NULL DEFAULT 0,
+    prune_seq INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT NOW()
+);
+
+-- 알림 삭제/압축 세대 번호 (이전 버전으로 테이블을 만든 경우)
+ALTER TABLE notification_counters ADD COLUMN IF NOT EXISTS prune_seq INTEGER NOT NULL DEFAULT 0;
+
+-- 현재 안 읽은 수 백필
+INSERT INTO notification_counters (user_id, unread_count, updated_at)
+SELECT user_id, COUNT(*), NOW()
+FROM notifications
+WHERE is_read = FALSE
+GROUP BY user_id
+ON CONFLICT (user_id) DO UPDATE SET
+    unread_count = excluded.unread_count,
+    updated_at = excluded.updated_at;
@@ -0,0 +1,116 @@
+"""프로그램별 리더보드 테이블을 추가하고 현재 공개 기록으로 채운다.
+
+- program_leaderboard((program_id, user_id) PK, best_time, record_id, achieved_at)
+- program_leaderboard(program_id, best_time) 인덱스 (상위 K 명 / 순위 계산)
+- (program, user) 별 가장 빠른 공개 기록으로 백필. 재실행하면 현재 기록 기준으로 다시 맞춘다.
+
+PostgreSQL과 SQLite 양쪽에서 IDEMPOTENT하게 동작하도록 작성.
+사용법:
+    cd backend
+    python migrations/add_program_leaderboard.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import app, db  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+
+PG_STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS program_leaderboard (
+        program_id INTEGER NOT NULL REFERENCES programs(id) ON DELETE CASCADE,
+        user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+        best_time INTEGER NOT NULL,
+        record_id INTEGER NOT NULL REFERENCES workout_records(id) ON DELETE CASCADE,
+        achieved_at TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT NOW(),
+        PRIMARY KEY (program_id, user_id)
+    );
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_program_leaderboard_program_time "
+    "ON program_leaderboard(program_id, best_time);",
+]
+
+SQLITE_STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS program_leaderboard (
+        program_id INTEGER NOT NULL REFERENCES programs(id) ON DELETE CASCADE,
+        user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+        best_time INTEGER NOT NULL,
+        record_id INTEGER NOT NULL REFERENCES workout_records(id) ON DELETE CASCADE,
+        achieved_at DATETIME,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (program_id, user_id)
+    );
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_program_leaderboard_program_time "
+    "ON program_leaderboard(program_id, best_time);",
+]
+
+# 공개 기록이 더 이상 없는 쌍은 지운다.
+PRUNE_STATEMENT = """
+    DELETE FROM program_leaderboard
+    WHERE NOT EXISTS (
+        SELECT 1 FROM workout_records r
+        WHERE r.program_id = program_leaderboard.program_id
+          AND r.user_id = program_leaderboard.user_id
+          AND r.is_public = :public
+    );
+"""
+
+# (program, user) 별 가장 빠른 공개 기록 (같은 시간이면 먼저 달성한 기록).
+# SQLite 는 INSERT ... SELECT ... ON CONFLICT 에서 WHERE 절이 있어야 파싱 모호성이 없다 (충족).
+BACKFILL_STATEMENT = """
+    INSERT INTO program_leaderboard (program_id, user_id, best_time, record_id, achieved_at, updated_at)
+    SELECT program_id, user_id, completion_time, id, completed_at, CURRENT_TIMESTAMP
+    FROM (
+        SELECT program_id, user_id, completion_time, id, completed_at,
+               ROW_NUMBER() OVER (
+                   PARTITION BY program_id, user_id
+                   ORDER BY completion_time, completed_at, id
+               ) AS position
+        FROM workout_records
+        WHERE is_public = :public
+    ) ranked
+    WHERE position = 1
+    ON CONFLICT (program_id, user_id) DO UPDATE SET
+        best_time = excluded.best_time,
+        record_id = excluded.record_id,
+        achieved_at = excluded.achieved_at,
+        updated_at = excluded.updated_at;
+"""
+
+
+def is_postgres():
+    uri = app.config.get('SQLALCHEMY_DATABASE_URI', '')
+    return uri.startswith('postgres')
+
+
+def run():
+    statements = PG_STATEMENTS if is_postgres() else SQLITE_STATEMENTS
+    backend = 'PostgreSQL' if is_postgres() else 'SQLite'
+    print('=' * 60)
+    print(f'프로그램 리더보드 마이그레이션 시작 ({backend})')
+    print('=' * 60)
+    with app.app_context():
+        for stmt in statements:
+            try:
+                db.session.execute(text(stmt))
+                db.session.commit()
+            except Exception as exc:
+                db.session.rollback()
+                print(f'⚠️  실행 실패 (계속 진행): {exc}\n  SQL: {stmt.strip()[:80]}…')
+        db.session.execute(text(PRUNE_STATEMENT), {'public': True})
+        result = db.session.execute(text(BACKFILL_STATEMENT), {'public': True})
+        db.session.commit()
+        with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            conn.execute(text('ANALYZE program_leaderboard;'))
+    print(f'✅ 마이그레이션 완료: program_leaderboard + idx_program_leaderboard_program_time (백필 {result.rowcount}행)')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,41 @@
+-- 프로그램별 리더보드 (PostgreSQL).
+-- IDEMPOTENT: CREATE ... IF NOT EXISTS / ON CONFLICT DO UPDATE 사용.
+
+-- (program, user) 당 공개 기록 중 최고 기록 한 행
+CREATE TABLE IF NOT EXISTS program_leaderboard (
+    program_id INTEGER NOT NULL REFERENCES programs(id) ON DELETE CASCADE,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    best_time INTEGER NOT NULL,
+    record_id INTEGER NOT NULL REFERENCES workout_records(id) ON DELETE CASCADE,
+    achieved_at TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT NOW(),
+    PRIMARY KEY (program_id, user_id)
+);
+
+-- 상위 K 명 (ORDER BY best_time LIMIT K) / 내 순위 (best_time < ? 개수)
+CREATE INDEX IF NOT EXISTS idx_program_leaderboard_program_time
+    ON program_leaderboard(program_id, best_time);
+
+-- 공개 기록이 없어진 쌍 정리
+DELETE FROM program_leaderboard
+WHERE NOT EXISTS (
+    SELECT 1 FROM workout_records r
+    WHERE r.program_id = program_leaderboard.program_id
+      AND r.user_id = program_leaderboard.user_id
+      AND r.is_public = TRUE
+);
+
+-- 가장 빠른 공개 기록으로 백필 (같은 시간이면 먼저 달성한 기록, 재실행 시 덮어씀)
+INSERT INTO program_leaderboard (program_id, user_id, best_time, record_id, achieved_at, updated_at)
+SELECT DISTINCT ON (program_id, user_id)
+       program_id, user_id, completion_time, id, completed_at, NOW()
+FROM workout_records
+WHERE is_public = TRUE
+ORDER BY program_id, user_id, completion_time, completed_at, id
+ON CONFLICT (program_id, user_id) DO UPDATE SET
+    best_time = excluded.best_time,
+    record_id = excluded.record_id,
+    achieved_at = excluded.achieved_at,
+    updated_at = excluded.updated_at;
+
+ANALYZE program_leaderboard;
@@ -0,0 +1,123 @@
+"""daily_assignments.feedback_json 의 푸시 플래그(push_sent_at / push_skipped_reason /
+push_counts)를 실제 컬럼으로 승격하고 기존 데이터를 이관한다.
+
+PostgreSQL과 SQLite 양쪽에서 IDEMPOTENT하게 동작하도록 작성.
+사용법:
+    cd backend
+    python migrations/add_push_status_columns.py
+"""
+
+import json
+import os
+import sys
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import app, db  # noqa: E402
+from models.daily_assignment import DailyAssignments  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+
+PUSH_COLUMNS = [
+    ('push_sent_at', 'TIMESTAMP'),
+    ('push_skipped_reason', 'VARCHAR(32)'),
+    ('push_ios_sent', 'INTEGER DEFAULT 0'),
+    ('push_ios_failed', 'INTEGER DEFAULT 0'),
+    ('push_android_sent', 'INTEGER DEFAULT 0'),
+    ('push_android_failed', 'INTEGER DEFAULT 0'),
+    ('push_skipped', 'INTEGER DEFAULT 0'),
+]
+
+PG_STATEMENTS = [
+    f"ALTER TABLE daily_assignments ADD COLUMN IF NOT EXISTS {name} {ddl};"
+    for name, ddl in PUSH_COLUMNS
+]
+
+# SQLite는 ADD COLUMN IF NOT EXISTS 미지원 — 이미 있으면 실패 로그 후 계속 진행.
+SQLITE_STATEMENTS = [
+    f"ALTER TABLE daily_assignments ADD COLUMN {name} {ddl};"
+    for name, ddl in PUSH_COLUMNS
+]
+
+PUSH_FEEDBACK_KEYS = ('push_sent_at', 'push_skipped_reason', 'push_counts')
+BACKFILL_BATCH = 500
+
+
+def is_postgres():
+    uri = app.config.get('SQLALCHEMY_DATABASE_URI', '')
+    return uri.startswith('postgres')
+
+
+def _parse_sent_at(value):
+    """feedback_json 의 ISO 문자열(사용자 timezone 포함) → naive UTC."""
+    try:
+        parsed = datetime.fromisoformat(str(value))
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def backfill():
+    """feedback_json 에 push_sent_at 이 있는 행을 배치 단위로 컬럼에 옮기고 JSON 키는 제거."""
+    moved = 0
+    last_id = 0
+    while True:
+        rows = db.session.execute(
+            text(
+                "SELECT id, feedback_json FROM daily_assignments "
+                "WHERE id > :last_id AND feedback_json LIKE '%push_sent_at%' "
+                "ORDER BY id LIMIT :limit"
+            ),
+            {'last_id': last_id, 'limit': BACKFILL_BATCH},
+        ).fetchall()
+        if not rows:
+            break
+        updates = []
+        for row_id, raw in rows:
+            last_id = row_id
+            try:
+                feedback = json.loads(raw)
+            except (TypeError, ValueError):
+                continue
+            if not isinstance(feedback, dict) or not feedback.get('push_sent_at'):
+                continue
+            values = DailyAssignments.push_status_values(
+                _parse_sent_at(feedback.get('push_sent_at')) or datetime.utcnow(),
+                feedback.get('push_skipped_reason'),
+                feedback.get('push_counts') if isinstance(feedback.get('push_counts'), dict) else None,
+            )
+            for key in PUSH_FEEDBACK_KEYS:
+                feedback.pop(key, None)
+            values['feedback_json'] = json.dumps(feedback, ensure_ascii=False) if feedback else None
+            values['id'] = row_id
+            updates.append(values)
+        if updates:
+            db.session.bulk_update_mappings(DailyAssignments, updates)
+        db.session.commit()
+        moved += len(updates)
+    return moved
+
+
+def run():
+    statements = PG_STATEMENTS if is_postgres() else SQLITE_STATEMENTS
+    backend = 'PostgreSQL' if is_postgres() else 'SQLite'
+    print('=' * 60)
+    print(f'daily_assignments 푸시 상태 컬럼 마이그레이션 시작 ({backend})')
+    print('=' * 60)
+    with app.app_context():
+        for stmt in statements:
+            try:
+                db.session.execute(text(stmt))
+                db.session.commit()
+            except Exception as exc:
+                db.session.rollback()
+                print(f'⚠️  실행 실패 (계속 진행): {exc}\n  SQL: {stmt[:80]}…')
+        moved = backfill()
+    print(f'✅ 마이그레이션 완료: push_* 컬럼 (이관 {moved}행)')
+
+
+if __name__ == '__main__':
+    run()
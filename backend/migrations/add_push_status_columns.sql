@@ -0,0 +1,11 @@
+-- daily_assignments.feedback_json 안의 푸시 발송 플래그를 실제 컬럼으로 승격 (PostgreSQL).
+-- IDEMPOTENT: ADD COLUMN IF NOT EXISTS 사용.
+-- 기존 feedback_json 데이터 이관은 migrations/add_push_status_columns.py 가 수행한다.
+
+ALTER TABLE daily_assignments ADD COLUMN IF NOT EXISTS push_sent_at TIMESTAMP;
+ALTER TABLE daily_assignments ADD COLUMN IF NOT EXISTS push_skipped_reason VARCHAR(32);
+ALTER TABLE daily_assignments ADD COLUMN IF NOT EXISTS push_ios_sent INTEGER DEFAULT 0;
+ALTER TABLE daily_assignments ADD COLUMN IF NOT EXISTS push_ios_failed INTEGER DEFAULT 0;
+ALTER TABLE daily_assignments ADD COLUMN IF NOT EXISTS push_android_sent INTEGER DEFAULT 0;
+ALTER TABLE daily_assignments ADD COLUMN IF NOT EXISTS push_android_failed INTEGER DEFAULT 0;
+ALTER TABLE daily_assignments ADD COLUMN IF NOT EXISTS push_skipped INTEGER DEFAULT 0;
@@ -0,0 +1,108 @@
+"""사용자 × 프로그램별 운동 기록 집계 테이블을 추가하고 현재 기록으로 채운다.
+
+- workout_record_rollups((user_id, program_id) PK, record_count, time_sum, best_time, last_completed_at)
+- workout_records GROUP BY 백필 (재실행하면 현재 기록 기준으로 덮어써 어긋난 집계도 바로잡힌다)
+
+개인 통계(/api/users/records/stats)는 이 테이블만 읽는다. 기록 생성/수정/삭제 경로가 같은
+트랜잭션에서 갱신한다.
+
+PostgreSQL과 SQLite 양쪽에서 IDEMPOTENT하게 동작하도록 작성.
+사용법:
+    cd backend
+    python migrations/add_record_rollups.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import app, db  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+
+PG_STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS workout_record_rollups (
+        user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+        program_id INTEGER NOT NULL REFERENCES programs(id) ON DELETE CASCADE,
+        record_count INTEGER NOT NULL DEFAULT 0,
+        time_sum BIGINT NOT NULL DEFAULT 0,
+        best_time INTEGER,
+        last_completed_at TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT NOW(),
+        PRIMARY KEY (user_id, program_id)
+    );
+    """,
+]
+
+SQLITE_STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS workout_record_rollups (
+        user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+        program_id INTEGER NOT NULL REFERENCES programs(id) ON DELETE CASCADE,
+        record_count INTEGER NOT NULL DEFAULT 0,
+        time_sum BIGINT NOT NULL DEFAULT 0,
+        best_time INTEGER,
+        last_completed_at DATETIME,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (user_id, program_id)
+    );
+    """,
+]
+
+# 기록이 모두 지워진 쌍은 집계 행도 지운다.
+PRUNE_STATEMENT = """
+    DELETE FROM workout_record_rollups
+    WHERE NOT EXISTS (
+        SELECT 1 FROM workout_records r
+        WHERE r.user_id = workout_record_rollups.user_id
+          AND r.program_id = workout_record_rollups.program_id
+    );
+"""
+
+# SQLite 는 INSERT ... SELECT ... ON CONFLICT 에서 WHERE 절이 있어야 파싱 모호성이 없다.
+BACKFILL_STATEMENT = """
+    INSERT INTO workout_record_rollups
+        (user_id, program_id, record_count, time_sum, best_time, last_completed_at, updated_at)
+    SELECT user_id, program_id, COUNT(*), SUM(completion_time), MIN(completion_time), MAX(completed_at),
+           CURRENT_TIMESTAMP
+    FROM workout_records
+    WHERE completion_time IS NOT NULL
+    GROUP BY user_id, program_id
+    ON CONFLICT (user_id, program_id) DO UPDATE SET
+        record_count = excluded.record_count,
+        time_sum = excluded.time_sum,
+        best_time = excluded.best_time,
+        last_completed_at = excluded.last_completed_at,
+        updated_at = excluded.updated_at;
+"""
+
+
+def is_postgres():
+    uri = app.config.get('SQLALCHEMY_DATABASE_URI', '')
+    return uri.startswith('postgres')
+
+
+def run():
+    statements = PG_STATEMENTS if is_postgres() else SQLITE_STATEMENTS
+    backend = 'PostgreSQL' if is_postgres() else 'SQLite'
+    print('=' * 60)
+    print(f'운동 기록 집계 테이블 마이그레이션 시작 ({backend})')
+    print('=' * 60)
+    with app.app_context():
+        for stmt in statements:
+            try:
+                db.session.execute(text(stmt))
+                db.session.commit()
+            except Exception as exc:
+                db.session.rollback()
+                print(f'⚠️  실행 실패 (계속 진행): {exc}\n  SQL: {stmt.strip()[:80]}…')
+        db.session.execute(text(PRUNE_STATEMENT))
+        result = db.session.execute(text(BACKFILL_STATEMENT))
+        db.session.commit()
+    print(f'✅ 마이그레이션 완료: workout_record_rollups (백필 {result.rowcount}쌍)')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,35 @@
+-- 사용자 × 프로그램별 운동 기록 집계 (PostgreSQL).
+-- IDEMPOTENT: CREATE ... IF NOT EXISTS / ON CONFLICT DO UPDATE 사용.
+
+-- 개인 통계용 집계 (기록 생성/수정/삭제 경로가 같은 트랜잭션에서 갱신)
+CREATE TABLE IF NOT EXISTS workout_record_rollups (
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    program_id INTEGER NOT NULL REFERENCES programs(id) ON DELETE CASCADE,
+    record_count INTEGER NOT NULL DEFAULT 0,
+    time_sum BIGINT NOT NULL DEFAULT 0,
+    best_time INTEGER,
+    last_completed_at TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT NOW(),
+    PRIMARY KEY (user_id, program_id)
+);
+
+-- 기록이 모두 지워진 쌍 정리
+DELETE FROM workout_record_rollups
+WHERE NOT EXISTS (
+    SELECT 1 FROM workout_records r
+    WHERE r.user_id = workout_record_rollups.user_id
+      AND r.program_id = workout_record_rollups.program_id
+);
+
+-- 현재 기록으로 백필 (재실행 시 덮어씀)
+INSERT INTO workout_record_rollups
+    (user_id, program_id, record_count, time_sum, best_time, last_completed_at, updated_at)
+SELECT user_id, program_id, COUNT(*), SUM(completion_time), MIN(completion_time), MAX(completed_at), NOW()
+FROM workout_records
+GROUP BY user_id, program_id
+ON CONFLICT (user_id, program_id) DO UPDATE SET
+    record_count = excluded.record_count,
+    time_sum = excluded.time_sum,
+    best_time = excluded.best_time,
+    last_completed_at = excluded.last_completed_at,
+    updated_at = excluded.updated_at;
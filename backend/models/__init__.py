@@ -2,8 +2,8 @@
 from .user import Users
 from .program import Programs, Registrations, ProgramParticipants, PersonalGoals
 from .exercise import ExerciseCategories, Exercises, ProgramExercises, WorkoutPatterns, ExerciseSets
-from .notification import Notifications
-from .workout_record import WorkoutRecords
+from .notification import Notifications, NotificationCounters, NotificationArchive
+from .workout_record import WorkoutRecords, WorkoutRecordRollups, ProgramLeaderboard
 from .preference import UserPreferences
 from .daily_assignment import DailyAssignments
 from .push_token import PushTokens
@@ -12,8 +12,8 @@ __all__ = [
     'Users',
     'Programs', 'Registrations', 'ProgramParticipants', 'PersonalGoals',
     'ExerciseCategories', 'Exercises', 'ProgramExercises', 'WorkoutPatterns', 'ExerciseSets',
-    'Notifications',
-    'WorkoutRecords',
+    'Notifications', 'NotificationCounters', 'NotificationArchive',
+    'WorkoutRecords', 'WorkoutRecordRollups', 'ProgramLeaderboard',
     'UserPreferences',
     'DailyAssignments',
     'PushTokens',
@@ -35,6 +35,15 @@ class DailyAssignments(db.Model):
     skipped_at = db.Column(db.DateTime)
     # JSON: { "user_feedback": "easy|hard|skip|refused", "client_meta": {...} }
     feedback_json = db.Column(db.Text)
+    # 데일리 푸시 발송 상태 (UTC). NULL이면 오늘 푸시 미발송 — tick 이 (user_id, assignment_date) 로 읽어 판단.
+    push_sent_at = db.Column(db.DateTime)
+    # 'no_tokens' | 'creds_missing' — 발송 시도 없이 마킹된 경우
+    push_skipped_reason = db.Column(db.String(32))
+    push_ios_sent = db.Column(db.Integer, default=0)
+    push_ios_failed = db.Column(db.Integer, default=0)
+    push_android_sent = db.Column(db.Integer, default=0)
+    push_android_failed = db.Column(db.Integer, default=0)
+    push_skipped = db.Column(db.Integer, default=0)
     created_at = db.Column(db.DateTime, default=get_korea_time)
     updated_at = db.Column(
         db.DateTime, default=get_korea_time, onupdate=datetime.utcnow
@@ -50,6 +59,34 @@ class DailyAssignments(db.Model):
         db.Index('idx_daily_assignments_user_date', 'user_id', 'assignment_date'),
     )
 
+    # send_to_tokens() 결과 키 → 컬럼
+    PUSH_COUNT_COLUMNS = {
+        'ios_sent': 'push_ios_sent',
+        'ios_failed': 'push_ios_failed',
+        'android_sent': 'push_android_sent',
+        'android_failed': 'push_android_failed',
+        'skipped': 'push_skipped',
+    }
+
+    @classmethod
+    def push_status_values(cls, sent_at, skipped_reason=None, counts=None):
+        """push_* 컬럼 값 딕셔너리. 인스턴스 갱신과 bulk UPDATE 매핑에 공용으로 사용."""
+        counts = counts or {}
+        values = {'push_sent_at': sent_at, 'push_skipped_reason': skipped_reason}
+        for key, column in cls.PUSH_COUNT_COLUMNS.items():
+            values[column] = int(counts.get(key) or 0)
+        return values
+
+    def mark_push(self, sent_at, skipped_reason=None, counts=None):
+        for column, value in self.push_status_values(sent_at, skipped_reason, counts).items():
+            setattr(self, column, value)
+
+    def push_counts_dict(self):
+        return {
+            key: getattr(self, column) or 0
+            for key, column in self.PUSH_COUNT_COLUMNS.items()
+        }
+
     def feedback_dict(self):
         if not self.feedback_json:
             return {}
@@ -80,6 +117,11 @@ class DailyAssignments(db.Model):
             ),
             'skipped_at': self.skipped_at.isoformat() if self.skipped_at else None,
             'feedback': self.feedback_dict(),
+            'push_sent_at': (
+                self.push_sent_at.isoformat() if self.push_sent_at else None
+            ),
+            'push_skipped_reason': self.push_skipped_reason,
+            'push_counts': self.push_counts_dict(),
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
         }
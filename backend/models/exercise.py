@@ -68,6 +68,10 @@ class ProgramExercises(db.Model):
     program = db.relationship('Programs', backref='program_exercises')
     exercise = db.relationship('Exercises', backref='program_exercises')
     
+    __table_args__ = (
+        db.Index('idx_program_exercises_program_order', 'program_id', 'order_index'),
+    )
+    
     def to_dict(self):
         """프로그램 운동 정보를 딕셔너리로 변환"""
         return {
@@ -98,6 +102,10 @@ class WorkoutPatterns(db.Model):
     # 관계 설정
     program = db.relationship('Programs', backref='workout_patterns')
     
+    __table_args__ = (
+        db.Index('idx_workout_patterns_program', 'program_id'),
+    )
+    
     def to_dict(self):
         """WOD 패턴 정보를 딕셔너리로 변환"""
         return {
@@ -130,6 +138,10 @@ class ExerciseSets(db.Model):
     pattern = db.relationship('WorkoutPatterns', backref='exercise_sets')
     exercise = db.relationship('Exercises', backref='exercise_sets')
     
+    __table_args__ = (
+        db.Index('idx_exercise_sets_pattern_order', 'pattern_id', 'order_index'),
+    )
+    
     def to_dict(self):
         """운동 세트 정보를 딕셔너리로 변환"""
         return {
@@ -4,6 +4,16 @@ from config.database import db
 class Notifications(db.Model):
     """알림 모델"""
     __tablename__ = 'notifications'
+    __table_args__ = (
+        # 사용자별 최신순 조회 (created_at, id)
+        db.Index('idx_notifications_user_created_id', 'user_id', 'created_at', 'id'),
+        # ?since 커서 동기화 (id 키셋)
+        db.Index('idx_notifications_user_id_id', 'user_id', 'id'),
+        # 프로그램 삭제 시 program_id 조회/삭제
+        db.Index('idx_notifications_program_id', 'program_id'),
+        # 보존 기간 정리: 읽은 알림 중 오래된 것 스캔
+        db.Index('idx_notifications_read_created', 'is_read', 'created_at'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
@@ -33,3 +43,41 @@ class Notifications(db.Model):
     
     def __repr__(self):
         return f'<Notification {self.type} for user {self.user_id}>'
+
+
+class NotificationCounters(db.Model):
+    """사용자별 안 읽은 알림 수 (배지용 O(1) 조회)
+
+    create_notification / 읽음 처리 경로가 같은 트랜잭션에서 갱신한다.
+    행이 없으면 최초 조회 시 notifications 를 세어 채운다.
+
+    prune_seq 는 알림 행이 삭제(보존 기간 정리, 다이제스트 압축, 프로그램 삭제)될 때마다 올라간다.
+    ?since 커서에 함께 실려, 값이 바뀌었으면 클라이언트에 전체 재동기화(reset)를 요구한다.
+    """
+    __tablename__ = 'notification_counters'
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True)
+    unread_count = db.Column(db.Integer, nullable=False, default=0)
+    prune_seq = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<NotificationCounter user {self.user_id}: {self.unread_count}>'
+
+
+class NotificationArchive(db.Model):
+    """보존 기간이 지난 알림 보관 (PT_NOTIFICATION_RETENTION_MODE=archive)"""
+    __tablename__ = 'notifications_archive'
+    
+    id = db.Column(db.Integer, primary_key=True)  # 원본 notifications.id
+    user_id = db.Column(db.Integer, nullable=False, index=True)
+    program_id = db.Column(db.Integer, nullable=True)
+    type = db.Column(db.String(50), nullable=False)
+    title = db.Column(db.String(200), nullable=False)
+    message = db.Column(db.Text, nullable=False)
+    is_read = db.Column(db.Boolean, default=True)
+    created_at = db.Column(db.DateTime)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<NotificationArchive {self.id} for user {self.user_id}>'
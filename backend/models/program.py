@@ -21,6 +21,13 @@ class Programs(db.Model):
     # 관계 설정
     creator = db.relationship('Users', backref='created_programs')
     
+    __table_args__ = (
+        # 공개 WOD 최신순 목록 (is_open = true ORDER BY created_at DESC)
+        db.Index('idx_programs_open_created', 'is_open', 'created_at'),
+        # 내 WOD 목록 / 개수 (creator_id = ? [ORDER BY created_at DESC])
+        db.Index('idx_programs_creator_created', 'creator_id', 'created_at'),
+    )
+    
     def to_dict(self):
         """프로그램 정보를 딕셔너리로 변환"""
         return {
@@ -88,7 +95,11 @@ class ProgramParticipants(db.Model):
     user = db.relationship('Users', backref='program_participations')
     
     # 복합 유니크 제약조건 (한 사용자는 한 프로그램에 한 번만 참여 가능)
-    __table_args__ = (db.UniqueConstraint('program_id', 'user_id', name='unique_program_user'),)
+    __table_args__ = (
+        db.UniqueConstraint('program_id', 'user_id', name='unique_program_user'),
+        # 승인 인원 수 / 상태별 참여자 조회 (program_id = ? AND status = ?)
+        db.Index('idx_program_participants_program_status', 'program_id', 'status'),
+    )
     
     def to_dict(self):
         """참여자 정보를 딕셔너리로 변환"""
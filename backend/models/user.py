@@ -1,7 +1,7 @@
 from datetime import datetime
-from werkzeug.security import generate_password_hash, check_password_hash
 from config.database import db
 from utils.timezone import get_korea_time
+from utils.hashing import hash_password, verify_password
 
 class Users(db.Model):
     """사용자 모델"""
@@ -17,12 +17,12 @@ class Users(db.Model):
     last_login_at = db.Column(db.DateTime)
     
     def set_password(self, password):
-        """비밀번호 해시화"""
-        self.password_hash = generate_password_hash(password)
+        """비밀번호 해시화 (해시 전용 스레드에서 실행)"""
+        self.password_hash = hash_password(password)
     
     def check_password(self, password):
-        """비밀번호 검증"""
-        return check_password_hash(self.password_hash, password)
+        """비밀번호 검증 (해시 전용 스레드에서 실행)"""
+        return verify_password(self.password_hash, password)
     
     def to_dict(self):
         """사용자 정보를 딕셔너리로 변환"""
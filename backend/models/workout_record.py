@@ -18,7 +18,11 @@ class WorkoutRecords(db.Model):
     user = db.relationship('Users', backref='workout_records')
     
     # 복합 인덱스: 프로그램별 사용자 기록 조회 최적화
-    __table_args__ = (db.Index('idx_program_user_time', 'program_id', 'user_id', 'completed_at'),)
+    __table_args__ = (
+        db.Index('idx_program_user_time', 'program_id', 'user_id', 'completed_at'),
+        # 사용자별 기록 목록 / 통계 (user_id = ? ORDER BY completed_at DESC)
+        db.Index('idx_workout_records_user_completed', 'user_id', 'completed_at'),
+    )
     
     def to_dict(self):
         """운동 기록 정보를 딕셔너리로 변환"""
@@ -34,3 +38,47 @@ class WorkoutRecords(db.Model):
     
     def __repr__(self):
         return f'<WorkoutRecord {self.user_id} -> {self.program_id}: {self.completion_time}s>'
+
+
+class WorkoutRecordRollups(db.Model):
+    """사용자 × 프로그램별 기록 집계 (개인 통계 O(프로그램 수) 조회)
+
+    기록 생성 경로는 같은 트랜잭션에서 증분 갱신하고, 수정/삭제는 해당 (user, program) 한 쌍만
+    다시 집계한다. 행이 없는데 기록이 있으면 최초 통계 조회 시 GROUP BY 로 채운다.
+    """
+    __tablename__ = 'workout_record_rollups'
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True)
+    program_id = db.Column(db.Integer, db.ForeignKey('programs.id', ondelete='CASCADE'), primary_key=True)
+    record_count = db.Column(db.Integer, nullable=False, default=0)
+    time_sum = db.Column(db.BigInteger, nullable=False, default=0)
+    best_time = db.Column(db.Integer)
+    last_completed_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<WorkoutRecordRollup {self.user_id} -> {self.program_id}: {self.record_count}>'
+
+
+class ProgramLeaderboard(db.Model):
+    """프로그램별 리더보드 (사용자당 공개 기록 중 최고 기록 한 행)
+
+    상위 K 명 / 내 순위는 (program_id, best_time) 인덱스만 읽는다. 기록 생성/수정/삭제 경로가 같은
+    트랜잭션에서 갱신한다.
+    """
+    __tablename__ = 'program_leaderboard'
+    
+    program_id = db.Column(db.Integer, db.ForeignKey('programs.id', ondelete='CASCADE'), primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True)
+    best_time = db.Column(db.Integer, nullable=False)
+    record_id = db.Column(db.Integer, db.ForeignKey('workout_records.id', ondelete='CASCADE'), nullable=False)
+    achieved_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        # 상위 K 명 (ORDER BY best_time) / 순위 (best_time < ? 개수)
+        db.Index('idx_program_leaderboard_program_time', 'program_id', 'best_time'),
+    )
+    
+    def __repr__(self):
+        return f'<ProgramLeaderboard {self.program_id}: user {self.user_id} {self.best_time}s>'
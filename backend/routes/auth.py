@@ -111,6 +111,9 @@ def login():
 
             # 세션도 유지하되, 헤더 기반 토큰도 함께 발급
             session['user_id'] = user.id
+            # 권한 판단용 (Safari 대안 경로가 채우는 user_id 와 구분)
+            from utils.token import VERIFIED_SESSION_KEY
+            session[VERIFIED_SESSION_KEY] = user.id
 
             # access_token 발급 (itsdangerous)
             try:
@@ -145,6 +148,8 @@ def logout():
     """로그아웃"""
     try:
         session.pop('user_id', None)
+        from utils.token import VERIFIED_SESSION_KEY
+        session.pop(VERIFIED_SESSION_KEY, None)
         return jsonify({'message': '로그아웃되었습니다'}), 200
     except Exception as e:
         from flask import current_app
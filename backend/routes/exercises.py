@@ -3,12 +3,14 @@
 from flask import Blueprint, jsonify, request, current_app
 from config.database import db
 from models.exercise import ExerciseCategories, Exercises, ProgramExercises
+from utils.db_routing import read_replica
 
 # 블루프린트 생성
 bp = Blueprint('exercises', __name__, url_prefix='/api')
 
 
 @bp.route('/exercise-categories', methods=['GET'])
+@read_replica
 def get_exercise_categories():
     """운동 카테고리 목록 조회"""
     try:
@@ -27,6 +29,7 @@ def get_exercise_categories():
 
 
 @bp.route('/exercises', methods=['GET'])
+@read_replica
 def get_exercises():
     """운동 종류 목록 조회"""
     try:
@@ -0,0 +1,237 @@
+"""프로그램 리더보드 라우트 / 유지 함수
+
+program_leaderboard 는 (program, user) 당 공개 기록 중 최고 기록 한 행을 가진다.
+
+- 상위 K 명: (program_id, best_time) 인덱스 순서대로 K 행
+- 내 순위: 나보다 빠른 사람 수 + 1 (같은 기록은 같은 순위), 백분위는 나보다 느린 사람 비율
+
+기록 생성은 더 빠를 때만 덮어쓰는 upsert 한 번, 수정/삭제는 해당 (program, user) 한 쌍만 다시 고른다.
+유지 함수는 커밋하지 않는다 (호출자의 트랜잭션에 포함).
+"""
+
+from datetime import datetime
+
+from flask import Blueprint, request, jsonify, current_app
+from sqlalchemy import case, func, literal
+from config.database import db
+from models.user import Users
+from models.program import Programs
+from models.workout_record import WorkoutRecords, ProgramLeaderboard
+from utils.db_routing import read_replica, use_primary
+
+# 블루프린트 생성
+bp = Blueprint('leaderboard', __name__, url_prefix='/api')
+
+LEADERBOARD_DEFAULT_LIMIT = 10
+LEADERBOARD_MAX_LIMIT = 100
+
+
+def get_user_id_from_session_or_cookies():
+    """세션 또는 쿠키에서 사용자 ID를 가져오는 함수"""
+    # TODO: 중앙화된 인증 미들웨어로 교체 예정
+    from app import get_user_id_from_session_or_cookies as get_user_id
+    return get_user_id()
+
+
+# --------------------------------------------------------------------
+# program_leaderboard 유지 (커밋은 호출자)
+# --------------------------------------------------------------------
+
+
+def _leaderboard_upsert(values, only_if_faster):
+    """program_leaderboard INSERT ... ON CONFLICT (program_id, user_id) DO UPDATE 문 (PG/SQLite)"""
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+    table = ProgramLeaderboard.__table__
+    stmt = insert(table).values(values)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.program_id, table.c.user_id],
+        set_={
+            'best_time': stmt.excluded.best_time,
+            'record_id': stmt.excluded.record_id,
+            'achieved_at': stmt.excluded.achieved_at,
+            'updated_at': stmt.excluded.updated_at,
+        },
+        where=(stmt.excluded.best_time < table.c.best_time) if only_if_faster else None,
+    )
+
+
+def add_record_to_leaderboard(record):
+    """새 기록 한 건 반영 (공개 기록이 기존 최고보다 빠를 때만 교체)"""
+    if not record.is_public:
+        return
+    stmt = _leaderboard_upsert({
+        'program_id': record.program_id,
+        'user_id': record.user_id,
+        'best_time': record.completion_time,
+        'record_id': record.id,
+        'achieved_at': record.completed_at,
+        'updated_at': datetime.utcnow(),
+    }, only_if_faster=True)
+    if stmt is None:
+        refresh_leaderboard_entry(record.program_id, record.user_id)
+        return
+    db.session.execute(stmt)
+
+
+def _best_public_records():
+    """(program, user) 별 가장 빠른 공개 기록 (같은 시간이면 먼저 달성한 기록) 서브쿼리"""
+    return db.session.query(
+        WorkoutRecords.program_id,
+        WorkoutRecords.user_id,
+        WorkoutRecords.completion_time,
+        WorkoutRecords.id,
+        WorkoutRecords.completed_at,
+        func.row_number().over(
+            partition_by=(WorkoutRecords.program_id, WorkoutRecords.user_id),
+            order_by=(WorkoutRecords.completion_time, WorkoutRecords.completed_at, WorkoutRecords.id),
+        ).label('position'),
+    ).filter(WorkoutRecords.is_public.is_(True))
+
+
+def refresh_leaderboard_entry(program_id, user_id):
+    """(program, user) 한 쌍을 다시 고른다 (기록 수정/삭제 후). 공개 기록이 없으면 행 삭제"""
+    best = WorkoutRecords.query.filter_by(
+        program_id=program_id, user_id=user_id, is_public=True
+    ).order_by(
+        WorkoutRecords.completion_time, WorkoutRecords.completed_at, WorkoutRecords.id
+    ).with_entities(WorkoutRecords.id, WorkoutRecords.completion_time, WorkoutRecords.completed_at).first()
+    if best is None:
+        ProgramLeaderboard.query.filter_by(program_id=program_id, user_id=user_id).delete(
+            synchronize_session=False)
+        return
+    values = {
+        'program_id': program_id,
+        'user_id': user_id,
+        'best_time': best.completion_time,
+        'record_id': best.id,
+        'achieved_at': best.completed_at,
+        'updated_at': datetime.utcnow(),
+    }
+    stmt = _leaderboard_upsert(values, only_if_faster=False)
+    if stmt is None:
+        db.session.merge(ProgramLeaderboard(**values))
+        return
+    db.session.execute(stmt)
+
+
+def rebuild_leaderboard(program_ids):
+    """프로그램들의 리더보드를 workout_records 에서 다시 만든다"""
+    program_ids = list(dict.fromkeys(program_ids))
+    if not program_ids:
+        return
+    table = ProgramLeaderboard.__table__
+    db.session.execute(table.delete().where(table.c.program_id.in_(program_ids)))
+    ranked = _best_public_records().filter(WorkoutRecords.program_id.in_(program_ids)).subquery()
+    best = db.session.query(
+        ranked.c.program_id,
+        ranked.c.user_id,
+        ranked.c.completion_time,
+        ranked.c.id,
+        ranked.c.completed_at,
+        literal(datetime.utcnow(), db.DateTime),
+    ).filter(ranked.c.position == 1)
+    db.session.execute(table.insert().from_select(
+        ['program_id', 'user_id', 'best_time', 'record_id', 'achieved_at', 'updated_at'],
+        best.statement,
+    ))
+
+
+def _ensure_leaderboard(program_id):
+    """리더보드가 비어 있는데 공개 기록이 있으면 (마이그레이션 이전 기록) primary 기준으로 채운다"""
+    has_entries = db.session.query(
+        ProgramLeaderboard.query.filter_by(program_id=program_id).exists()
+    ).scalar()
+    if has_entries:
+        return
+    with use_primary():
+        has_records = db.session.query(
+            WorkoutRecords.query.filter_by(program_id=program_id, is_public=True).exists()
+        ).scalar()
+        if has_records:
+            rebuild_leaderboard([program_id])
+            db.session.commit()
+
+
+# --------------------------------------------------------------------
+# 조회
+# --------------------------------------------------------------------
+
+
+def get_top_entries(program_id, limit):
+    """상위 limit 명 [{rank, user_id, user_name, best_time, achieved_at}] (같은 기록은 같은 순위)"""
+    rows = db.session.query(
+        ProgramLeaderboard.user_id,
+        Users.name,
+        ProgramLeaderboard.best_time,
+        ProgramLeaderboard.achieved_at,
+    ).outerjoin(Users, Users.id == ProgramLeaderboard.user_id).filter(
+        ProgramLeaderboard.program_id == program_id
+    ).order_by(
+        ProgramLeaderboard.best_time, ProgramLeaderboard.achieved_at, ProgramLeaderboard.user_id
+    ).limit(limit).all()
+
+    entries = []
+    for position, row in enumerate(rows, start=1):
+        rank = entries[-1]['rank'] if entries and entries[-1]['best_time'] == row.best_time else position
+        entries.append({
+            'rank': rank,
+            'user_id': row.user_id,
+            'user_name': row.name or 'Unknown',
+            'best_time': row.best_time,
+            'achieved_at': row.achieved_at.strftime('%Y-%m-%d %H:%M:%S') if row.achieved_at else None
+        })
+    return entries
+
+
+def get_user_rank(program_id, user_id):
+    """내 순위 {rank, best_time, total, percentile}. 공개 기록이 없으면 None
+
+    percentile 은 나보다 느린 참가자 비율(%) — 1등이면 100 에 가깝고 꼴찌면 0.
+    """
+    mine = db.session.get(ProgramLeaderboard, (program_id, user_id))
+    if mine is None:
+        return None
+    faster, slower, total = db.session.query(
+        func.count(case((ProgramLeaderboard.best_time < mine.best_time, 1))),
+        func.count(case((ProgramLeaderboard.best_time > mine.best_time, 1))),
+        func.count(),
+    ).filter(ProgramLeaderboard.program_id == program_id).one()
+    return {
+        'rank': faster + 1,
+        'best_time': mine.best_time,
+        'total': total,
+        'percentile': round(slower / total * 100, 1) if total else 0
+    }
+
+
+@bp.route('/programs/<int:program_id>/leaderboard', methods=['GET'])
+@read_replica
+def get_program_leaderboard(program_id):
+    """프로그램 리더보드 (?limit=K 상위 K 명 + 내 순위)"""
+    try:
+        user_id = get_user_id_from_session_or_cookies()
+        if not user_id:
+            return jsonify({'error': '로그인이 필요합니다'}), 401
+
+        program = db.session.query(Programs.id, Programs.title).filter(Programs.id == program_id).first()
+        if not program:
+            return jsonify({'error': '프로그램을 찾을 수 없습니다'}), 404
+
+        limit = max(1, min(request.args.get('limit', LEADERBOARD_DEFAULT_LIMIT, type=int), LEADERBOARD_MAX_LIMIT))
+        _ensure_leaderboard(program_id)
+
+        return jsonify({
+            'program_title': program.title,
+            'entries': get_top_entries(program_id, limit),
+            'me': get_user_rank(program_id, user_id)
+        }), 200
+
+    except Exception as e:
+        current_app.logger.exception('get_program_leaderboard error: %s', str(e))
+        return jsonify({'error': '리더보드 조회 중 오류가 발생했습니다'}), 500
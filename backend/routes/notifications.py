@@ -1,9 +1,14 @@
 """알림 관련 라우트"""
 
-from flask import Blueprint, request, jsonify, session, current_app
+import base64
+from contextlib import contextmanager
+from functools import wraps
+from flask import Blueprint, request, jsonify, session, current_app, g, has_app_context
 from datetime import datetime
+from sqlalchemy import case, func
 from config.database import db
-from models.notification import Notifications
+from models.notification import Notifications, NotificationCounters
+from utils.db_routing import read_replica, use_primary
 
 # 블루프린트 생성
 bp = Blueprint('notifications', __name__, url_prefix='/api')
@@ -16,9 +21,12 @@ def get_user_id_from_session_or_cookies():
     return get_user_id()
 
 
-@bp.route('/notifications', methods=['GET'])
-def get_notifications():
-    """사용자의 알림 목록 조회"""
+SYNC_DEFAULT_LIMIT = 50
+SYNC_MAX_LIMIT = 200
+
+
+def _resolve_user_id():
+    """인증 사용자 ID. Safari 는 전용 세션(safari_user_id)까지 확인"""
     user_id = get_user_id_from_session_or_cookies()
     
     # Safari 대안: User-Agent로 Safari 감지 시 자동 인증 (개선된 버전)
@@ -33,29 +41,120 @@ def get_notifications():
                 session['user_id'] = user_id  # 일반 세션에도 복사
             else:
                 current_app.logger.warning('Safari 브라우저이지만 전용 세션이 없음 - 인증 필요')
-    
+    return user_id
+
+
+def _serialize(n):
+    return {
+        'id': n.id,
+        'type': n.type,
+        'title': n.title,
+        'message': n.message,
+        'program_id': n.program_id,
+        'is_read': n.is_read,
+        'created_at': n.created_at.isoformat()
+    }
+
+
+def encode_cursor(notification_id, prune_seq):
+    """(마지막으로 받은 알림 id, 발급 시점 prune_seq) → 불투명 커서 문자열
+
+    created_at 은 커밋 전에 정해져 커밋 순서와 어긋날 수 있으므로 키셋은 id 만 쓴다.
+    """
+    raw = f'{notification_id}|{prune_seq}'
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """커서 → (id, prune_seq). 이전 (created_at, id) 형식이면 prune_seq 가 None (재동기화 필요).
+    형식이 잘못되면 ValueError"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        head, tail = base64.urlsafe_b64decode(padded).decode('utf-8').split('|')
+        if head.isdigit():
+            return int(head), int(tail)
+        datetime.fromisoformat(head)
+        return int(tail), None
+    except Exception:
+        raise ValueError('invalid cursor')
+
+
+@bp.route('/notifications', methods=['GET'])
+@read_replica
+def get_notifications():
+    """사용자의 알림 목록 조회
+
+    - 파라미터 없음: 최신 50개 배열 (기존 응답 형태)
+    - ?since= (빈 값): 최신 limit 개 + next_cursor (초기 동기화)
+    - ?since=<cursor>: 커서 이후 새 알림만 (최신순) + next_cursor / has_more
+    - 커서 발급 뒤 알림이 삭제/압축됐으면 초기 동기화와 같은 목록에 reset=true (클라이언트는 목록 교체)
+    """
+    user_id = _resolve_user_id()
     if not user_id:
         return jsonify({'message': '로그인이 필요합니다'}), 401
     
+    since = request.args.get('since')
     try:
-        notifications = Notifications.query.filter_by(user_id=user_id)\
-            .order_by(Notifications.created_at.desc())\
-            .limit(50).all()
+        if since is None:
+            notifications = Notifications.query.filter_by(user_id=user_id)\
+                .order_by(Notifications.created_at.desc(), Notifications.id.desc())\
+                .limit(50).all()
+            return jsonify([_serialize(n) for n in notifications]), 200
+        
+        limit = max(1, min(request.args.get('limit', SYNC_DEFAULT_LIMIT, type=int), SYNC_MAX_LIMIT))
+        counter = db.session.get(NotificationCounters, user_id)
+        prune_seq = counter.prune_seq if counter is not None else 0
+        reset = False
+        if since:
+            try:
+                cursor_id, cursor_seq = decode_cursor(since)
+            except ValueError:
+                return jsonify({'message': '잘못된 커서입니다'}), 400
+            reset = cursor_seq != prune_seq
+        if since and not reset:
+            # 커서 이후 분을 오래된 순으로 limit+1 개 (has_more 판단용) 가져온 뒤 최신순으로 뒤집는다
+            rows = Notifications.query.filter(
+                Notifications.user_id == user_id,
+                Notifications.id > cursor_id,
+            ).order_by(Notifications.id.asc()).limit(limit + 1).all()
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].id if rows else cursor_id, prune_seq)
+            rows.reverse()
+        else:
+            rows = Notifications.query.filter_by(user_id=user_id)\
+                .order_by(Notifications.id.desc())\
+                .limit(limit).all()
+            has_more = False
+            next_cursor = encode_cursor(rows[0].id, prune_seq) if rows else ''
         
-        return jsonify([{
-            'id': n.id,
-            'type': n.type,
-            'title': n.title,
-            'message': n.message,
-            'program_id': n.program_id,
-            'is_read': n.is_read,
-            'created_at': n.created_at.isoformat()
-        } for n in notifications]), 200
+        return jsonify({
+            'notifications': [_serialize(n) for n in rows],
+            'next_cursor': next_cursor,
+            'has_more': has_more,
+            'unread_count': get_unread_count(user_id),
+            'reset': reset,
+        }), 200
     except Exception as e:
         current_app.logger.exception('get_notifications error: %s', str(e))
         return jsonify({'message': '알림 조회 중 오류가 발생했습니다'}), 500
 
 
+@bp.route('/notifications/unread-count', methods=['GET'])
+def get_notifications_unread_count():
+    """안 읽은 알림 수 (배지용, notification_counters 단건 조회)"""
+    user_id = _resolve_user_id()
+    if not user_id:
+        return jsonify({'message': '로그인이 필요합니다'}), 401
+    
+    try:
+        return jsonify({'unread_count': get_unread_count(user_id)}), 200
+    except Exception as e:
+        current_app.logger.exception('get_notifications_unread_count error: %s', str(e))
+        db.session.rollback()
+        return jsonify({'message': '알림 조회 중 오류가 발생했습니다'}), 500
+
+
 @bp.route('/notifications/<int:notification_id>/read', methods=['PUT'])
 def mark_notification_read(notification_id):
     """알림을 읽음으로 표시"""
@@ -72,7 +171,9 @@ def mark_notification_read(notification_id):
         if not notification:
             return jsonify({'message': '알림을 찾을 수 없습니다'}), 404
         
-        notification.is_read = True
+        if not notification.is_read:
+            notification.is_read = True
+            bump_unread({user_id: -1})
         db.session.commit()
         
         return jsonify({'message': '알림이 읽음으로 표시되었습니다'}), 200
@@ -94,6 +195,7 @@ def mark_all_notifications_read():
             user_id=user_id,
             is_read=False
         ).update({'is_read': True})
+        set_unread({user_id: 0})
         
         db.session.commit()
         
@@ -104,14 +206,339 @@ def mark_all_notifications_read():
         return jsonify({'message': '알림 읽음 처리 중 오류가 발생했습니다'}), 500
 
 
+# --------------------------------------------------------------------
+# 안 읽은 알림 카운터 (notification_counters)
+# --------------------------------------------------------------------
+# 알림 INSERT / 읽음 처리와 같은 트랜잭션에서 upsert 로 갱신한다 (커밋은 호출자).
+# 알림 행을 직접 지우는 경로(프로그램 삭제, 보존 기간 정리 등)는 recount_unread 로 다시 세고
+# mark_notifications_removed 로 prune_seq 를 올려 ?since 클라이언트가 재동기화하게 한다.
+
+
+def _counter_upsert(values, unread_expr):
+    """notification_counters INSERT ... ON CONFLICT (user_id) DO UPDATE 문 (PG/SQLite)"""
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+    table = NotificationCounters.__table__
+    stmt = insert(table).values(values)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.user_id],
+        set_={'unread_count': unread_expr(table, stmt.excluded), 'updated_at': stmt.excluded.updated_at},
+    )
+
+
+def bump_unread(deltas):
+    """{user_id: 증감} 만큼 카운터 조정 (0 미만으로 내려가지 않음).
+
+    증감 값이 같은 사용자끼리 묶어 upsert 한 번씩 실행한다 (대부분 +1 한 묶음).
+    """
+    by_delta = {}
+    for uid, delta in deltas.items():
+        if delta:
+            by_delta.setdefault(delta, []).append(uid)
+    if not by_delta:
+        return
+    now = datetime.utcnow()
+    for delta, user_ids in by_delta.items():
+        def _add(table, excluded, delta=delta):
+            total = table.c.unread_count + delta
+            return case((total < 0, 0), else_=total)
+
+        stmt = _counter_upsert(
+            [{'user_id': uid, 'unread_count': max(delta, 0), 'updated_at': now} for uid in user_ids],
+            _add,
+        )
+        if stmt is None:
+            recount_unread(user_ids)
+            continue
+        db.session.execute(stmt)
+
+
+def set_unread(values):
+    """{user_id: 값} 으로 카운터를 덮어쓴다"""
+    if not values:
+        return
+    now = datetime.utcnow()
+    stmt = _counter_upsert(
+        [{'user_id': uid, 'unread_count': n, 'updated_at': now} for uid, n in values.items()],
+        lambda table, excluded: excluded.unread_count,
+    )
+    if stmt is None:
+        for uid, n in values.items():
+            counter = db.session.get(NotificationCounters, uid) or NotificationCounters(user_id=uid)
+            counter.unread_count = n
+            db.session.add(counter)
+        return
+    db.session.execute(stmt)
+
+
+def recount_unread(user_ids):
+    """notifications 를 다시 세어 카운터를 맞춘다 (커밋은 호출자)"""
+    user_ids = list(dict.fromkeys(user_ids))
+    if not user_ids:
+        return {}
+    counts = dict.fromkeys(user_ids, 0)
+    for start in range(0, len(user_ids), BULK_INSERT_CHUNK):
+        chunk = user_ids[start:start + BULK_INSERT_CHUNK]
+        counts.update(db.session.query(Notifications.user_id, func.count(Notifications.id)).filter(
+            Notifications.user_id.in_(chunk),
+            Notifications.is_read.is_(False),
+        ).group_by(Notifications.user_id).all())
+    set_unread(counts)
+    return counts
+
+
+def mark_notifications_removed(user_ids):
+    """알림 행이 지워진 사용자들의 prune_seq 를 올린다 (커밋은 호출자).
+
+    카운터 행이 없으면 먼저 실제 안 읽은 수로 만든다 — 0 으로 만들면 배지가 틀어진다.
+    """
+    user_ids = list(dict.fromkeys(user_ids))
+    table = NotificationCounters.__table__
+    for start in range(0, len(user_ids), BULK_INSERT_CHUNK):
+        chunk = user_ids[start:start + BULK_INSERT_CHUNK]
+        existing = {uid for (uid,) in db.session.query(NotificationCounters.user_id).filter(
+            NotificationCounters.user_id.in_(chunk))}
+        missing = [uid for uid in chunk if uid not in existing]
+        if missing:
+            recount_unread(missing)
+            db.session.flush()
+        db.session.execute(
+            table.update().where(table.c.user_id.in_(chunk)).values(
+                prune_seq=table.c.prune_seq + 1, updated_at=datetime.utcnow())
+        )
+
+
+def get_unread_count(user_id):
+    """안 읽은 알림 수. 카운터 행이 없으면 한 번 세어 만든다"""
+    counter = db.session.get(NotificationCounters, user_id)
+    if counter is not None:
+        return counter.unread_count
+    # 카운터를 만드는 경로는 복제본이 아닌 primary 기준으로 센다
+    with use_primary():
+        count = recount_unread([user_id])[user_id]
+        db.session.commit()
+    return count
+
+
+BULK_INSERT_CHUNK = 1000  # 한 INSERT 문에 담을 최대 행 수 (PG/SQLite 파라미터 한도 이내)
+
+
+def _notification_data(notification_id, notification_type, title, message, program_id, created_at):
+    """WebSocket 'notification' 이벤트 페이로드"""
+    return {
+        'id': notification_id,
+        'type': notification_type,
+        'title': title,
+        'message': message,
+        'program_id': program_id,
+        'created_at': created_at.isoformat()
+    }
+
+
+def _emit_notifications(items):
+    """커밋이 끝난 알림을 사용자 room 별로 전송. items: [(user_id, notification_data)]
+
+    presence 레지스트리 기준으로 접속 중인 사용자만 emit 하고, 오프라인 사용자는
+    푸시 아웃박스로 보낸다. presence 를 판단할 수 없으면 기존처럼 모두 emit 한다.
+    코얼레싱이 켜져 있으면 room 별 버퍼를 거쳐 짧은 시간 안의 알림을 한 프레임으로 묶는다.
+    ``PT_EMIT_FLUSH_ON_COMMIT`` 이면 방금 적재한 room 을 window 를 기다리지 않고 바로 보낸다
+    (호출 시점에 이미 커밋이 끝났으므로 커밋 훅으로는 이 알림을 잡을 수 없다).
+    """
+    if not items:
+        return
+    from utils import emit_buffer
+    from utils.emit_buffer import get_buffer
+    from utils.presence import registry as presence
+    from utils.push_dispatch import enqueue_outbox
+
+    online = presence.online_users(uid for uid, _ in items)
+    socketio = buffer = None
+    queued_rooms = []
+    for user_id, notification_data in items:
+        if online is not None and user_id not in online:
+            enqueue_outbox(
+                user_id,
+                notification_data['title'],
+                notification_data['message'],
+                data_extra={
+                    'type': notification_data['type'],
+                    'notification_id': str(notification_data['id']),
+                    'program_id': str(notification_data['program_id'] or ''),
+                },
+            )
+            continue
+        if socketio is None:
+            try:
+                from app import socketio
+            except ImportError:
+                current_app.logger.warning('SocketIO를 import할 수 없어 실시간 알림을 전송하지 못했습니다')
+                return
+            buffer = get_buffer(socketio)
+        if buffer is not None:
+            buffer.queue(f'user_{user_id}', 'notification', notification_data)
+            queued_rooms.append(f'user_{user_id}')
+        else:
+            socketio.emit('notification', notification_data, room=f'user_{user_id}')
+    if queued_rooms and emit_buffer.FLUSH_ON_COMMIT:
+        buffer.flush(rooms=list(dict.fromkeys(queued_rooms)))
+
+
+def _insert_notifications(user_ids, notification_type, title, message, program_id, created_at):
+    """user_ids 전원에게 같은 알림 행을 INSERT ... RETURNING 으로 일괄 생성하고
+    안 읽은 알림 카운터를 올린다 (커밋하지 않음).
+
+    반환: [(user_id, notification_id)]
+    """
+    table = Notifications.__table__
+    inserted = []
+    for start in range(0, len(user_ids), BULK_INSERT_CHUNK):
+        chunk = user_ids[start:start + BULK_INSERT_CHUNK]
+        stmt = (
+            table.insert()
+            .values([{
+                'user_id': uid,
+                'program_id': program_id,
+                'type': notification_type,
+                'title': title,
+                'message': message,
+                'is_read': False,
+                'created_at': created_at,
+            } for uid in chunk])
+            .returning(table.c.user_id, table.c.id)
+        )
+        inserted.extend((row.user_id, row.id) for row in db.session.execute(stmt))
+    bump_unread({uid: 1 for uid in user_ids})
+    return inserted
+
+
+def create_notifications_bulk(user_ids, notification_type, title, message, program_id=None):
+    """여러 사용자에게 같은 알림을 한 번의 INSERT + 한 번의 커밋으로 생성하고,
+    커밋 후 room(`user_{id}`) 마다 한 번씩 전송한다.
+
+    요청 단위 배치 모드(`notification_batch`)가 켜져 있으면 버퍼에만 쌓고 빈 리스트를 반환한다.
+    반환: [(user_id, notification_id)] — 실패 시 빈 리스트
+    """
+    user_ids = list(dict.fromkeys(uid for uid in user_ids if uid))
+    if not user_ids:
+        return []
+
+    if _batch_buffer() is not None:
+        _batch_buffer().append((tuple(user_ids), notification_type, title, message, program_id))
+        return []
+
+    created_at = datetime.utcnow()
+    try:
+        inserted = _insert_notifications(user_ids, notification_type, title, message, program_id, created_at)
+        db.session.commit()
+    except Exception as e:
+        current_app.logger.exception('알림 일괄 생성 중 오류: %s', str(e))
+        db.session.rollback()
+        return []
+
+    _emit_notifications([
+        (uid, _notification_data(nid, notification_type, title, message, program_id, created_at))
+        for uid, nid in inserted
+    ])
+    return inserted
+
+
+# --------------------------------------------------------------------
+# 요청 단위 배치 모드
+# --------------------------------------------------------------------
+# with notification_batch(): 또는 @batch_notifications 로 감싼 구간에서 발생한 알림은
+# 바로 커밋/전송하지 않고 모아 두었다가, 구간이 끝날 때 같은 내용끼리 묶어 INSERT 하고
+# 한 번만 커밋한 뒤 room 별로 전송한다.
+
+
+def _batch_buffer():
+    if not has_app_context():
+        return None
+    return g.get('_notification_batch')
+
+
+def flush_notification_batch(buffer):
+    """버퍼에 쌓인 알림을 내용별 INSERT + 단일 커밋 + room 별 전송으로 처리"""
+    if not buffer:
+        return []
+    groups = {}
+    for user_ids, notification_type, title, message, program_id in buffer:
+        key = (notification_type, title, message, program_id)
+        groups.setdefault(key, {}).update(dict.fromkeys(user_ids))
+
+    created_at = datetime.utcnow()
+    emits = []
+    try:
+        for (notification_type, title, message, program_id), user_ids in groups.items():
+            for uid, nid in _insert_notifications(
+                list(user_ids), notification_type, title, message, program_id, created_at
+            ):
+                emits.append((uid, _notification_data(nid, notification_type, title, message, program_id, created_at)))
+        db.session.commit()
+    except Exception as e:
+        current_app.logger.exception('알림 배치 저장 중 오류: %s', str(e))
+        db.session.rollback()
+        return []
+
+    _emit_notifications(emits)
+    return [(uid, data['id']) for uid, data in emits]
+
+
+@contextmanager
+def notification_batch():
+    """구간 내 알림을 모았다가 정상 종료 시 한 번에 저장/전송. 예외가 나면 버린다.
+
+    이미 바깥 배치가 열려 있으면 그 배치에 합류한다.
+    """
+    if g.get('_notification_batch') is not None:
+        yield g._notification_batch
+        return
+    buffer = g._notification_batch = []
+    try:
+        yield buffer
+    except Exception:
+        g._notification_batch = None
+        raise
+    g._notification_batch = None
+    flush_notification_batch(buffer)
+
+
+def batch_notifications(view):
+    """뷰 함수 데코레이터: 요청 중 발생한 알림을 모아 응답 직전에 한 번에 처리.
+
+    응답이 4xx/5xx 이면(롤백된 요청) 모은 알림을 버린다.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if g.get('_notification_batch') is not None:
+            return view(*args, **kwargs)
+        buffer = g._notification_batch = []
+        try:
+            response = view(*args, **kwargs)
+        finally:
+            g._notification_batch = None
+        status = response[1] if isinstance(response, tuple) and len(response) > 1 else getattr(response, 'status_code', 200)
+        if isinstance(status, int) and status < 400:
+            flush_notification_batch(buffer)
+        return response
+    return wrapper
+
+
 def create_notification(user_id, notification_type, title, message, program_id=None):
     """알림 생성 및 실시간 전송
-    
-    Note: SocketIO 전송은 app.py에서 import하여 사용
+
+    Note: SocketIO 전송은 app.py에서 import하여 사용.
+    배치 모드 안에서는 버퍼에만 쌓고 None을 반환한다.
     """
+    if _batch_buffer() is not None:
+        create_notifications_bulk([user_id], notification_type, title, message, program_id)
+        return None
+
     try:
-        print(f'🔔 알림 생성 시작: user_id={user_id}, type={notification_type}')
-        
         # 알림 생성
         notification = Notifications(
             user_id=user_id,
@@ -121,41 +548,59 @@ def create_notification(user_id, notification_type, title, message, program_id=N
             message=message
         )
         db.session.add(notification)
+        bump_unread({user_id: 1})
         db.session.commit()
         
-        print(f'💾 알림 DB 저장 완료: id={notification.id}')
-        
         # 실시간 알림 전송 (SocketIO)
-        # Note: circular import 방지를 위해 app.py에서 socketio import
-        try:
-            from app import socketio
-            room_name = f'user_{user_id}'
-            notification_data = {
-                'id': notification.id,
-                'type': notification_type,
-                'title': title,
-                'message': message,
-                'program_id': program_id,
-                'created_at': notification.created_at.isoformat()
-            }
-            
-            print(f'📡 WebSocket 알림 전송: room={room_name}, data={notification_data}')
-            socketio.emit('notification', notification_data, room=room_name)
-        except ImportError:
-            current_app.logger.warning('SocketIO를 import할 수 없어 실시간 알림을 전송하지 못했습니다')
+        notification_data = _notification_data(
+            notification.id, notification_type, title, message, program_id, notification.created_at
+        )
+        current_app.logger.debug('🔔 알림 생성: id=%s user_id=%s type=%s', notification.id, user_id, notification_type)
+        _emit_notifications([(user_id, notification_data)])
         
         return notification
     except Exception as e:
         current_app.logger.exception('알림 생성 중 오류: %s', str(e))
-        print(f'❌ 알림 생성 오류: {str(e)}')
         db.session.rollback()
         return None
 
 
-def broadcast_program_notification(program_id, notification_type, title, message):
-    """프로그램 관련 알림을 모든 사용자에게 브로드캐스트"""
+# --------------------------------------------------------------------
+# 프로그램 토픽 room
+# --------------------------------------------------------------------
+# 프로그램 알림은 전체 브로드캐스트 대신, 클라이언트가 subscribe_topic 으로 명시적으로
+# 참여한 토픽 room 에만 전송한다.
+#   program_<id>          특정 프로그램 소식
+#   difficulty_<level>    해당 난이도 프로그램 소식 (beginner / intermediate / advanced)
+
+TOPIC_DIFFICULTIES = ('beginner', 'intermediate', 'advanced')
+MAX_TOPICS_PER_SOCKET = 50
+
+
+def is_valid_topic(topic):
+    """구독 가능한 토픽 이름인지 검증"""
+    if not isinstance(topic, str):
+        return False
+    if topic.startswith('program_'):
+        return topic[len('program_'):].isdigit()
+    if topic.startswith('difficulty_'):
+        return topic[len('difficulty_'):] in TOPIC_DIFFICULTIES
+    return False
+
+
+def program_topic_rooms(program_id, difficulty=None):
+    """프로그램 알림을 받을 토픽 room 목록"""
+    rooms = [f'program_{program_id}']
+    if difficulty in TOPIC_DIFFICULTIES:
+        rooms.append(f'difficulty_{difficulty}')
+    return rooms
+
+
+def broadcast_program_notification(program_id, notification_type, title, message, difficulty=None):
+    """프로그램 관련 알림을 해당 프로그램/난이도 토픽 구독자에게 전송"""
     try:
-        print(f'📢 브로드캐스트 알림 전송: program_id={program_id}, type={notification_type}')
+        rooms = program_topic_rooms(program_id, difficulty)
+        current_app.logger.debug('📢 토픽 알림 전송: program_id=%s type=%s rooms=%s', program_id, notification_type, rooms)
         
         notification_data = {
             'program_id': program_id,
@@ -165,16 +610,12 @@ def broadcast_program_notification(program_id, notification_type, title, message
             'created_at': datetime.utcnow().isoformat()
         }
         
-        print(f'📡 WebSocket 브로드캐스트 전송: data={notification_data}')
-        
-        # 실시간 알림 전송 (SocketIO)
+        # 실시간 알림 전송 (SocketIO) — 여러 room 에 속한 소켓도 한 번만 받는다
         try:
             from app import socketio
-            socketio.emit('program_notification', notification_data)
+            socketio.emit('program_notification', notification_data, to=rooms)
         except ImportError:
             current_app.logger.warning('SocketIO를 import할 수 없어 브로드캐스트 알림을 전송하지 못했습니다')
         
     except Exception as e:
         current_app.logger.exception('프로그램 알림 브로드캐스트 중 오류: %s', str(e))
-        print(f'❌ 브로드캐스트 오류: {str(e)}')
-
@@ -8,7 +8,11 @@ from models.program import Programs, Registrations, ProgramParticipants
 from models.exercise import ProgramExercises, WorkoutPatterns, ExerciseSets
 from models.notification import Notifications
 from models.user import Users
+from routes.notifications import (
+    broadcast_program_notification, create_notification, mark_notifications_removed, recount_unread,
+)
 from utils.validators import validate_program
+from utils.db_routing import read_replica
 from utils.timezone import format_korea_time
 from datetime import datetime, timedelta
 
@@ -35,6 +39,7 @@ def _gone_if_marketplace_disabled():
     return None
 
 @bp.route('/programs', methods=['GET'])
+@read_replica
 def get_programs():
     """프로그램 목록 조회"""
     try:
@@ -390,7 +395,8 @@ def open_program(program_id):
                 program_id=p.id,
                 notification_type='program_opened',
                 title='새로운 프로그램이 공개되었습니다',
-                message=f'새로운 "{p.title}" 프로그램이 공개되었습니다.'
+                message=f'새로운 "{p.title}" 프로그램이 공개되었습니다.',
+                difficulty=p.difficulty
             )
         except Exception:
             pass
@@ -733,36 +739,6 @@ def my_programs():
         current_app.logger.exception('my_programs error: %s', str(e))
         return jsonify({'message': '프로그램 조회 중 오류가 발생했습니다'}), 500
 
-def create_notification(user_id, notification_type, title, message, program_id=None):
-    """알림 생성 및 실시간 전송"""
-    try:
-        print(f'🔔 알림 생성 시작: user_id={user_id}, type={notification_type}')
-        
-        # 알림 생성
-        notification = Notifications(
-            user_id=user_id,
-            program_id=program_id,
-            type=notification_type,
-            title=title,
-            message=message
-        )
-        db.session.add(notification)
-        db.session.commit()
-        
-        print(f'💾 알림 DB 저장 완료: id={notification.id}')
-        
-        # 실시간 알림 전송 (SocketIO는 별도로 처리 필요)
-        # socketio.emit('notification', notification_data, room=f'user_{user_id}')
-        
-        return notification
-        
-    except Exception as e:
-        from flask import current_app
-        current_app.logger.exception('알림 생성 중 오류: %s', str(e))
-        print(f'❌ 알림 생성 오류: {str(e)}')
-        db.session.rollback()
-        return None
-
 def get_user_id_from_session_or_cookies():
     """세션 또는 쿠키에서 사용자 ID를 가져오는 함수"""
     from app import get_user_id_from_session_or_cookies as get_user_id
@@ -913,8 +889,17 @@ def delete_program(program_id):
             db.session.execute(text("DELETE FROM program_exercises WHERE program_id = :pid"), {"pid": program_id})
             db.session.execute(text("DELETE FROM registrations WHERE program_id = :pid"), {"pid": program_id})
             db.session.execute(text("DELETE FROM program_participants WHERE program_id = :pid"), {"pid": program_id})
+            db.session.execute(text("DELETE FROM program_leaderboard WHERE program_id = :pid"), {"pid": program_id})
+            db.session.execute(text("DELETE FROM workout_record_rollups WHERE program_id = :pid"), {"pid": program_id})
             db.session.execute(text("DELETE FROM workout_records WHERE program_id = :pid"), {"pid": program_id})
+            owner_rows = db.session.execute(
+                text("SELECT user_id, MAX(CASE WHEN is_read = :unread THEN 1 ELSE 0 END) "
+                     "FROM notifications WHERE program_id = :pid GROUP BY user_id"),
+                {"pid": program_id, "unread": False}
+            ).fetchall()
             db.session.execute(text("DELETE FROM notifications WHERE program_id = :pid"), {"pid": program_id})
+            recount_unread([row[0] for row in owner_rows if row[1]])
+            mark_notifications_removed([row[0] for row in owner_rows])
             db.session.execute(text("DELETE FROM programs WHERE id = :pid"), {"pid": program_id})
             
             db.session.commit()
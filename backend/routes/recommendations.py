@@ -3,7 +3,8 @@
 - 외부 API: xAI Grok (OpenAI 호환 chat/completions). burnfat_ai.py 의 호출 패턴을 재사용.
 - 캐싱: (user_id, assignment_date) 단위로 daily_assignments 테이블에 1행.
 - 라우트:
-    POST /api/recommendations/generate  (내부/디버그용)
+    POST /api/recommendations/generate    (내부/디버그용)
+    GET  /api/recommendations/push-reach  (일자별 푸시 도달 리포트)
 """
 
 from __future__ import annotations
@@ -30,7 +31,7 @@ bp = Blueprint('recommendations', __name__, url_prefix='/api')
 
 logger = logging.getLogger(__name__)
 
-XAI_API_URL = "https://api.x.ai/v1/chat/completions"
+XAI_API_URL = os.environ.get("XAI_API_URL", "https://api.x.ai/v1/chat/completions")
 XAI_MODEL = os.environ.get("XAI_MODEL", "grok-4-1-fast-non-reasoning")
 XAI_MAX_TOKENS = int(os.environ.get("XAI_MAX_TOKENS_RECOMMEND", "300"))
 XAI_TIMEOUT_SECONDS = int(os.environ.get("XAI_TIMEOUT_SECONDS", "30"))
@@ -504,3 +505,17 @@ def recommendations_health():
         'daily_refresh_limit': DAILY_REFRESH_LIMIT,
         'candidate_pool_limit': CANDIDATE_POOL_LIMIT,
     }), 200
+
+
+@bp.route('/recommendations/push-reach', methods=['GET'])
+def recommendations_push_reach():
+    """일자별 데일리 푸시 도달 현황 (운영 모니터링용, 관리자 전용 — 전체 사용자 집계)."""
+    from utils.profiler import is_admin_request
+    if not is_admin_request():
+        return jsonify({'message': '권한이 없습니다'}), 403
+    try:
+        days = min(max(int(request.args.get('days', 14)), 1), 90)
+    except (TypeError, ValueError):
+        days = 14
+    from utils.scheduler import push_reach_report
+    return jsonify({'days': days, 'report': push_reach_report(days)}), 200
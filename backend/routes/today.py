@@ -20,6 +20,7 @@ from routes.recommendations import (
     DAILY_REFRESH_LIMIT,
     _today_for_user,
 )
+from routes.workout_records import record_added
 
 
 bp = Blueprint('today', __name__, url_prefix='/api/today')
@@ -118,6 +119,8 @@ def complete_today():
             completed_at=datetime.utcnow(),
         )
         db.session.add(record)
+        db.session.flush()
+        record_added(record)
         db.session.commit()
         return jsonify({
             'message': '완료 기록이 저장되었습니다',
@@ -1,10 +1,20 @@
 """운동 기록 관련 라우트"""
 
-from flask import Blueprint, request, jsonify, session, current_app
+import base64
+import csv
+import io
+import json
+from datetime import datetime
+
+from flask import Blueprint, Response, request, jsonify, session, current_app, stream_with_context
+from sqlalchemy import case, func, literal, tuple_
 from config.database import db
 from models.user import Users
 from models.program import Programs, ProgramParticipants, Registrations
-from models.workout_record import WorkoutRecords
+from models.workout_record import WorkoutRecords, WorkoutRecordRollups
+from routes.leaderboard import add_record_to_leaderboard, refresh_leaderboard_entry
+from routes.notifications import decode_cursor
+from utils.db_routing import read_replica, use_primary
 
 # 블루프린트 생성
 bp = Blueprint('workout_records', __name__, url_prefix='/api')
@@ -17,6 +27,211 @@ def get_user_id_from_session_or_cookies():
     return get_user_id()
 
 
+RECORDS_DEFAULT_LIMIT = 50
+RECORDS_MAX_LIMIT = 200
+EXPORT_BATCH_SIZE = 500  # 내보내기 시 서버 측 커서에서 한 번에 가져오는 행 수
+EXPORT_FIELDS = ['id', 'program_id', 'program_title', 'completion_time', 'completed_at', 'notes', 'is_public']
+
+
+def _resolve_user_id(tag):
+    """인증 사용자 ID (Safari 는 자동 인증 대안 적용)"""
+    user_id = get_user_id_from_session_or_cookies()
+    
+    # Safari 대안: User-Agent로 Safari 감지 시 자동 인증
+    if not user_id:
+        user_agent = request.headers.get('User-Agent', '').lower()
+        if 'safari' in user_agent and 'chrome' not in user_agent:
+            current_app.logger.info(f'Safari 브라우저 자동 인증 적용 ({tag})')
+            user_id = 1  # simadeit@naver.com
+            session['user_id'] = user_id
+            session.permanent = True
+    return user_id
+
+
+def encode_record_cursor(completed_at, record_id):
+    """(completed_at, id) → 불투명 커서 문자열 (알림 커서와 같은 형식)"""
+    raw = f'{completed_at.isoformat()}|{record_id}'
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def _user_records_query(user_id):
+    """사용자 기록 + 프로그램 제목 (한 번의 JOIN, 최신순)"""
+    return db.session.query(
+        WorkoutRecords.id,
+        WorkoutRecords.program_id,
+        Programs.title.label('program_title'),
+        WorkoutRecords.completion_time,
+        WorkoutRecords.completed_at,
+        WorkoutRecords.notes,
+        WorkoutRecords.is_public,
+    ).outerjoin(Programs, Programs.id == WorkoutRecords.program_id).filter(
+        WorkoutRecords.user_id == user_id
+    ).order_by(WorkoutRecords.completed_at.desc(), WorkoutRecords.id.desc())
+
+
+def _serialize_record_row(row):
+    return {
+        'id': row.id,
+        'program_id': row.program_id,
+        'program_title': row.program_title or 'Unknown Program',
+        'completion_time': row.completion_time,
+        'completed_at': row.completed_at.strftime('%Y-%m-%d %H:%M:%S'),
+        'notes': row.notes,
+        'is_public': row.is_public
+    }
+
+
+# --------------------------------------------------------------------
+# workout_record_rollups 유지 (커밋은 호출자)
+# --------------------------------------------------------------------
+
+
+def _rollup_upsert(values, set_expr):
+    """workout_record_rollups INSERT ... ON CONFLICT (user_id, program_id) DO UPDATE 문 (PG/SQLite)"""
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+    table = WorkoutRecordRollups.__table__
+    stmt = insert(table).values(values)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.user_id, table.c.program_id],
+        set_=dict(set_expr(table, stmt.excluded), updated_at=stmt.excluded.updated_at),
+    )
+
+
+def add_record_to_rollup(record):
+    """새 기록 한 건을 (user, program) 집계에 더한다"""
+    completed_at = record.completed_at or datetime.utcnow()
+
+    def _add(table, excluded):
+        return {
+            'record_count': table.c.record_count + 1,
+            'time_sum': table.c.time_sum + excluded.time_sum,
+            'best_time': case(
+                (table.c.best_time.is_(None) | (excluded.best_time < table.c.best_time), excluded.best_time),
+                else_=table.c.best_time,
+            ),
+            'last_completed_at': case(
+                (table.c.last_completed_at.is_(None) | (excluded.last_completed_at > table.c.last_completed_at),
+                 excluded.last_completed_at),
+                else_=table.c.last_completed_at,
+            ),
+        }
+
+    stmt = _rollup_upsert({
+        'user_id': record.user_id,
+        'program_id': record.program_id,
+        'record_count': 1,
+        'time_sum': record.completion_time,
+        'best_time': record.completion_time,
+        'last_completed_at': completed_at,
+        'updated_at': datetime.utcnow(),
+    }, _add)
+    if stmt is None:
+        refresh_record_rollup(record.user_id, record.program_id)
+        return
+    db.session.execute(stmt)
+
+
+def refresh_record_rollup(user_id, program_id):
+    """(user, program) 한 쌍을 workout_records 에서 다시 집계 (수정/삭제 후). 기록이 없으면 행 삭제"""
+    count, total, best, last = db.session.query(
+        func.count(WorkoutRecords.id),
+        func.coalesce(func.sum(WorkoutRecords.completion_time), 0),
+        func.min(WorkoutRecords.completion_time),
+        func.max(WorkoutRecords.completed_at),
+    ).filter(WorkoutRecords.user_id == user_id, WorkoutRecords.program_id == program_id).one()
+    if not count:
+        WorkoutRecordRollups.query.filter_by(user_id=user_id, program_id=program_id).delete(
+            synchronize_session=False)
+        return
+    values = {
+        'user_id': user_id,
+        'program_id': program_id,
+        'record_count': count,
+        'time_sum': total,
+        'best_time': best,
+        'last_completed_at': last,
+        'updated_at': datetime.utcnow(),
+    }
+    stmt = _rollup_upsert(values, lambda table, excluded: {
+        name: getattr(excluded, name) for name in ('record_count', 'time_sum', 'best_time', 'last_completed_at')
+    })
+    if stmt is None:
+        db.session.merge(WorkoutRecordRollups(**values))
+        return
+    db.session.execute(stmt)
+
+
+def rebuild_record_rollups(user_ids):
+    """사용자들의 집계를 workout_records GROUP BY 한 번으로 다시 만든다"""
+    user_ids = list(dict.fromkeys(user_ids))
+    if not user_ids:
+        return
+    table = WorkoutRecordRollups.__table__
+    db.session.execute(table.delete().where(table.c.user_id.in_(user_ids)))
+    grouped = db.session.query(
+        WorkoutRecords.user_id,
+        WorkoutRecords.program_id,
+        func.count(WorkoutRecords.id),
+        func.sum(WorkoutRecords.completion_time),
+        func.min(WorkoutRecords.completion_time),
+        func.max(WorkoutRecords.completed_at),
+        literal(datetime.utcnow(), db.DateTime),
+    ).filter(WorkoutRecords.user_id.in_(user_ids)).group_by(WorkoutRecords.user_id, WorkoutRecords.program_id)
+    db.session.execute(table.insert().from_select(
+        ['user_id', 'program_id', 'record_count', 'time_sum', 'best_time', 'last_completed_at', 'updated_at'],
+        grouped.statement,
+    ))
+
+
+def record_added(record):
+    """새 기록을 집계 / 리더보드에 반영 (flush 후, 커밋 전에 호출)"""
+    add_record_to_rollup(record)
+    add_record_to_leaderboard(record)
+
+
+def record_changed(user_id, program_id):
+    """기록 수정/삭제 후 (user, program) 한 쌍의 집계 / 리더보드를 다시 맞춘다"""
+    refresh_record_rollup(user_id, program_id)
+    refresh_leaderboard_entry(program_id, user_id)
+
+
+def get_record_rollups(user_id):
+    """(program_id, 기록 수, 시간 합, 최고 기록, 프로그램 제목) 목록.
+
+    집계 행이 없는데 기록이 있으면 (마이그레이션 이전 기록) primary 기준으로 한 번 채운다.
+    """
+    def _query():
+        return db.session.query(
+            WorkoutRecordRollups.program_id,
+            WorkoutRecordRollups.record_count,
+            WorkoutRecordRollups.time_sum,
+            WorkoutRecordRollups.best_time,
+            Programs.title,
+        ).outerjoin(Programs, Programs.id == WorkoutRecordRollups.program_id).filter(
+            WorkoutRecordRollups.user_id == user_id,
+            WorkoutRecordRollups.record_count > 0,
+        ).all()
+
+    rows = _query()
+    if rows:
+        return rows
+    with use_primary():
+        has_records = db.session.query(
+            WorkoutRecords.query.filter_by(user_id=user_id).exists()
+        ).scalar()
+        if not has_records:
+            return []
+        rebuild_record_rollups([user_id])
+        db.session.commit()
+        return _query()
+
+
 @bp.route('/programs/<int:program_id>/records', methods=['POST'])
 def create_workout_record(program_id):
     """운동 기록 생성"""
@@ -58,6 +273,8 @@ def create_workout_record(program_id):
         )
         
         db.session.add(record)
+        db.session.flush()
+        record_added(record)
         db.session.commit()
         
         current_app.logger.info(f'사용자 {user_id}가 프로그램 {program_id}의 운동 기록을 생성했습니다: {completion_time}초')
@@ -87,18 +304,19 @@ def get_program_records(program_id):
         if not program:
             return jsonify({'error': '프로그램을 찾을 수 없습니다'}), 404
         
-        # 공개된 기록만 조회 (개인 기록은 별도 API에서)
-        records = WorkoutRecords.query.filter_by(
-            program_id=program_id,
-            is_public=True
+        # 공개된 기록만 조회 (개인 기록은 별도 API에서), 사용자 이름은 같은 쿼리에서 JOIN
+        records = db.session.query(WorkoutRecords, Users.name).outerjoin(
+            Users, Users.id == WorkoutRecords.user_id
+        ).filter(
+            WorkoutRecords.program_id == program_id,
+            WorkoutRecords.is_public.is_(True)
         ).order_by(WorkoutRecords.completion_time.asc()).all()
         
         records_data = []
-        for record in records:
-            user = Users.query.get(record.user_id)
+        for record, user_name in records:
             records_data.append({
                 'id': record.id,
-                'user_name': user.name if user else 'Unknown',
+                'user_name': user_name or 'Unknown',
                 'completion_time': record.completion_time,
                 'completed_at': record.completed_at.strftime('%Y-%m-%d %H:%M:%S'),
                 'notes': record.notes,
@@ -117,44 +335,46 @@ def get_program_records(program_id):
 
 
 @bp.route('/users/records', methods=['GET'])
+@read_replica
 def get_user_records():
-    """사용자의 개인 운동 기록 조회"""
+    """사용자의 개인 운동 기록 조회
+
+    - 파라미터 없음: 전체 기록 (기존 응답 형태)
+    - ?cursor= (빈 값): 최신 limit 개 + next_cursor / has_more
+    - ?cursor=<cursor>: 커서보다 오래된 기록 limit 개 (completed_at, id 키셋)
+    """
     try:
-        user_id = get_user_id_from_session_or_cookies()
-        
-        # Safari 대안: User-Agent로 Safari 감지 시 자동 인증
-        if not user_id:
-            user_agent = request.headers.get('User-Agent', '').lower()
-            if 'safari' in user_agent and 'chrome' not in user_agent:
-                current_app.logger.info('Safari 브라우저 자동 인증 적용 (records)')
-                user_id = 1  # simadeit@naver.com
-                session['user_id'] = user_id
-                session.permanent = True
-        
+        user_id = _resolve_user_id('records')
         if not user_id:
             return jsonify({'error': '로그인이 필요합니다'}), 401
         
-        # 사용자의 모든 운동 기록 조회
-        records = WorkoutRecords.query.filter_by(
-            user_id=user_id
-        ).order_by(WorkoutRecords.completed_at.desc()).all()
+        query = _user_records_query(user_id)
+        cursor = request.args.get('cursor')
+        if cursor is None:
+            records_data = [_serialize_record_row(row) for row in query.all()]
+            return jsonify({
+                'records': records_data,
+                'total_count': len(records_data)
+            }), 200
         
-        records_data = []
-        for record in records:
-            program = Programs.query.get(record.program_id)
-            records_data.append({
-                'id': record.id,
-                'program_id': record.program_id,
-                'program_title': program.title if program else 'Unknown Program',
-                'completion_time': record.completion_time,
-                'completed_at': record.completed_at.strftime('%Y-%m-%d %H:%M:%S'),
-                'notes': record.notes,
-                'is_public': record.is_public
-            })
+        limit = max(1, min(request.args.get('limit', RECORDS_DEFAULT_LIMIT, type=int), RECORDS_MAX_LIMIT))
+        if cursor:
+            try:
+                cursor_at, cursor_id = decode_cursor(cursor)
+            except ValueError:
+                return jsonify({'error': '잘못된 커서입니다'}), 400
+            query = query.filter(
+                tuple_(WorkoutRecords.completed_at, WorkoutRecords.id) < tuple_(cursor_at, cursor_id)
+            )
+        # limit+1 개를 가져와 다음 페이지 유무 판단
+        rows = query.limit(limit + 1).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
         
         return jsonify({
-            'records': records_data,
-            'total_count': len(records_data)
+            'records': [_serialize_record_row(row) for row in rows],
+            'next_cursor': encode_record_cursor(rows[-1].completed_at, rows[-1].id) if has_more else '',
+            'has_more': has_more
         }), 200
         
     except Exception as e:
@@ -162,6 +382,60 @@ def get_user_records():
         return jsonify({'error': '개인 운동 기록 조회 중 오류가 발생했습니다'}), 500
 
 
+@bp.route('/users/records/export', methods=['GET'])
+@read_replica
+def export_user_records():
+    """개인 운동 기록 전체 내보내기 (?format=ndjson 기본 | csv)
+
+    서버 측 커서(yield_per)로 EXPORT_BATCH_SIZE 행씩 읽어 바로 흘려보내므로 기록 수와 무관하게
+    메모리에 전체 목록을 만들지 않는다.
+    """
+    user_id = _resolve_user_id('export')
+    if not user_id:
+        return jsonify({'error': '로그인이 필요합니다'}), 401
+    
+    export_format = request.args.get('format', 'ndjson').lower()
+    if export_format not in ('ndjson', 'csv'):
+        return jsonify({'error': 'format은 ndjson 또는 csv여야 합니다'}), 400
+    
+    # 핸들러 안에서 실행해 read_replica 라우팅을 적용하고, 행은 응답을 보내면서 가져온다
+    result = db.session.execute(
+        _user_records_query(user_id).statement.execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    
+    def _lines():
+        try:
+            for batch in result.partitions():
+                records = [_serialize_record_row(row) for row in batch]
+                if export_format == 'ndjson':
+                    yield ''.join(json.dumps(r, ensure_ascii=False) + '\n' for r in records)
+                else:
+                    buffer = io.StringIO()
+                    csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS).writerows(records)
+                    yield buffer.getvalue()
+        except Exception as e:
+            current_app.logger.exception('export_user_records error: %s', str(e))
+            raise
+        finally:
+            result.close()
+    
+    def _stream():
+        if export_format == 'csv':
+            buffer = io.StringIO()
+            csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS).writeheader()
+            # 엑셀에서 한글이 깨지지 않도록 BOM
+            yield '\ufeff' + buffer.getvalue()
+        yield from _lines()
+    
+    filename = f'workout_records.{export_format}'
+    mimetype = 'application/x-ndjson' if export_format == 'ndjson' else 'text/csv'
+    return Response(
+        stream_with_context(_stream()),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+    )
+
+
 @bp.route('/records/<int:record_id>', methods=['PUT'])
 def update_workout_record(record_id):
     """운동 기록 수정"""
@@ -183,6 +457,7 @@ def update_workout_record(record_id):
             return jsonify({'error': '데이터가 필요합니다'}), 400
         
         # 수정 가능한 필드들 업데이트
+        ranked_before = (record.completion_time, record.is_public)
         if 'completion_time' in data:
             if isinstance(data['completion_time'], int) and data['completion_time'] > 0:
                 record.completion_time = data['completion_time']
@@ -195,6 +470,11 @@ def update_workout_record(record_id):
         if 'is_public' in data:
             record.is_public = bool(data['is_public'])
         
+        # 시간/공개 여부가 바뀌면 집계와 리더보드를 다시 맞춘다
+        if (record.completion_time, record.is_public) != ranked_before:
+            db.session.flush()
+            record_changed(record.user_id, record.program_id)
+        
         db.session.commit()
         
         current_app.logger.info(f'사용자 {user_id}가 기록 {record_id}를 수정했습니다')
@@ -228,6 +508,8 @@ def delete_workout_record(record_id):
             return jsonify({'error': '본인의 기록만 삭제할 수 있습니다'}), 403
         
         db.session.delete(record)
+        db.session.flush()
+        record_changed(record.user_id, record.program_id)
         db.session.commit()
         
         current_app.logger.info(f'사용자 {user_id}가 기록 {record_id}를 삭제했습니다')
@@ -240,27 +522,18 @@ def delete_workout_record(record_id):
 
 
 @bp.route('/users/records/stats', methods=['GET'])
+@read_replica
 def get_user_stats():
     """사용자의 개인 통계 조회"""
     try:
-        user_id = get_user_id_from_session_or_cookies()
-        
-        # Safari 대안: User-Agent로 Safari 감지 시 자동 인증
-        if not user_id:
-            user_agent = request.headers.get('User-Agent', '').lower()
-            if 'safari' in user_agent and 'chrome' not in user_agent:
-                current_app.logger.info('Safari 브라우저 자동 인증 적용 (stats)')
-                user_id = 1  # simadeit@naver.com
-                session['user_id'] = user_id
-                session.permanent = True
-        
+        user_id = _resolve_user_id('stats')
         if not user_id:
             return jsonify({'error': '로그인이 필요합니다'}), 401
         
-        # 사용자의 모든 운동 기록 조회
-        records = WorkoutRecords.query.filter_by(user_id=user_id).all()
+        # 프로그램별 집계 (workout_record_rollups, 프로그램 제목 포함 한 번에)
+        rollups = get_record_rollups(user_id)
         
-        if not records:
+        if not rollups:
             return jsonify({
                 'total_workouts': 0,
                 'average_time': 0,
@@ -270,32 +543,22 @@ def get_user_stats():
                 'program_stats': {}
             }), 200
         
-        # 기본 통계 계산
-        total_workouts = len(records)
-        completion_times = [record.completion_time for record in records]
-        average_time = sum(completion_times) / len(completion_times)
-        best_time = min(completion_times)
-        
-        # 프로그램별 통계
-        program_stats = {}
-        for record in records:
-            program_id = record.program_id
-            if program_id not in program_stats:
-                program_stats[program_id] = []
-            program_stats[program_id].append(record.completion_time)
-        
-        programs_completed = len(program_stats)
+        # 기본 통계 계산 (프로그램별 집계를 합산)
+        total_workouts = sum(row.record_count for row in rollups)
+        average_time = sum(row.time_sum for row in rollups) / total_workouts
+        best_time = min(row.best_time for row in rollups)
+        programs_completed = len(rollups)
         
         # 최근 개선도 계산 (최근 5개 기록의 평균 vs 이전 5개 기록의 평균)
         recent_improvement = 0
-        if len(records) >= 10:
-            recent_5 = sorted(records, key=lambda x: x.completed_at)[-5:]
-            previous_5 = sorted(records, key=lambda x: x.completed_at)[-10:-5]
-            
-            recent_avg = sum(r.completion_time for r in recent_5) / 5
-            previous_avg = sum(r.completion_time for r in previous_5) / 5
-            
-            recent_improvement = ((previous_avg - recent_avg) / previous_avg) * 100
+        if total_workouts >= 10:
+            recent_times = [time for (time,) in db.session.query(WorkoutRecords.completion_time).filter(
+                WorkoutRecords.user_id == user_id
+            ).order_by(WorkoutRecords.completed_at.desc()).limit(10)]
+            if len(recent_times) == 10:
+                recent_avg = sum(recent_times[:5]) / 5
+                previous_avg = sum(recent_times[5:]) / 5
+                recent_improvement = ((previous_avg - recent_avg) / previous_avg) * 100
         
         return jsonify({
             'total_workouts': total_workouts,
@@ -304,13 +567,13 @@ def get_user_stats():
             'programs_completed': programs_completed,
             'recent_improvement': round(recent_improvement, 1),
             'program_stats': {
-                str(program_id): {
-                    'count': len(times),
-                    'average_time': round(sum(times) / len(times), 1),
-                    'best_time': min(times),
-                    'program_title': Programs.query.get(program_id).title if Programs.query.get(program_id) else 'Unknown'
+                str(row.program_id): {
+                    'count': row.record_count,
+                    'average_time': round(row.time_sum / row.record_count, 1),
+                    'best_time': row.best_time,
+                    'program_title': row.title or 'Unknown'
                 }
-                for program_id, times in program_stats.items()
+                for row in rollups
             }
         }), 200
         
@@ -0,0 +1,125 @@
+"""읽기 전용 복제본(read replica) 라우팅.
+
+``DATABASE_REPLICA_URL`` 이 설정되면 ``replica`` bind 엔진을 추가하고, :func:`read_replica` 를 붙인
+GET 핸들러의 SELECT 를 복제본으로 보낸다. 나머지(쓰기, flush, DML, 데코레이터가 없는 핸들러)는
+모두 primary 로 간다.
+
+- 핸들러 안에서 쓰기(flush / INSERT·UPDATE·DELETE)가 한 번이라도 일어나면 그 요청의 이후 조회는
+  primary 로 고정한다.
+- read-your-writes: 쓰기 요청(POST/PUT/PATCH/DELETE, 4xx/5xx 제외) 뒤 마지막 쓰기 시각을 서명된
+  세션 쿠키에 남기고, ``PT_REPLICA_STICKY_SECONDS`` 동안 그 클라이언트의 조회는 primary 로 보낸다.
+  쿠키에 실려 다니므로 워커/인스턴스가 여럿이어도 같은 판단을 한다.
+- 복제본에서 읽은 값을 바탕으로 다시 쓰는 경로는 :func:`use_primary` 로 감싼다.
+
+환경 변수:
+- ``DATABASE_REPLICA_URL``: 복제본 접속 URL (미설정 시 라우팅 없음)
+- ``PT_REPLICA_STICKY_SECONDS`` (기본 5, 0 이면 stickiness 끔)
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from flask import has_request_context, session
+from flask_sqlalchemy.session import Session
+
+REPLICA_URL = os.environ.get('DATABASE_REPLICA_URL') or ''
+STICKY_SECONDS = float(os.environ.get('PT_REPLICA_STICKY_SECONDS', '5'))
+
+REPLICA_BIND = 'replica'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+_USE_REPLICA = 'use_replica'
+# 세션 쿠키에 남기는 마지막 쓰기 시각 (epoch 초)
+LAST_WRITE_SESSION_KEY = 'last_write_at'
+
+
+def recently_wrote(now: float | None = None) -> bool:
+    """현재 요청의 클라이언트가 STICKY_SECONDS 안에 쓰기를 했는지 (세션 쿠키 기준)."""
+    if STICKY_SECONDS <= 0 or not has_request_context():
+        return False
+    last_write = session.get(LAST_WRITE_SESSION_KEY)
+    if not isinstance(last_write, (int, float)):
+        return False
+    return (time.time() if now is None else now) - last_write < STICKY_SECONDS
+
+
+class RoutingSession(Session):
+    """``session.info['use_replica']`` 가 켜져 있으면 SELECT 를 replica 엔진으로 보내는 세션."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self.info.get(_USE_REPLICA) and REPLICA_BIND in self._db.engines:
+            if self._flushing or (clause is not None and not getattr(clause, 'is_select', False)):
+                # 쓰기가 시작됐으면 이 요청의 나머지 조회도 primary (방금 쓴 값을 읽을 수 있게)
+                self.info[_USE_REPLICA] = False
+            elif recently_wrote():
+                # 직전 요청에서 쓴 값이 아직 복제되지 않았을 수 있다 (read-your-writes)
+                self.info[_USE_REPLICA] = False
+            else:
+                return self._db.engines[REPLICA_BIND]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def replica_enabled() -> bool:
+    from flask import current_app
+
+    return REPLICA_BIND in (current_app.config.get('SQLALCHEMY_BINDS') or {})
+
+
+def read_replica(view):
+    """GET 핸들러의 조회를 복제본으로 (쓰기 직후 클라이언트는 primary — :meth:`RoutingSession.get_bind`)."""
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        from flask import request
+
+        from config.database import db
+
+        if not (replica_enabled() and request.method in SAFE_METHODS):
+            return view(*args, **kwargs)
+        db.session.info[_USE_REPLICA] = True
+        try:
+            return view(*args, **kwargs)
+        finally:
+            db.session.info.pop(_USE_REPLICA, None)
+
+    return wrapper
+
+
+@contextmanager
+def use_primary():
+    """블록 안의 조회를 primary 로 (복제본 값으로 다시 쓰면 안 되는 경로)."""
+    from config.database import db
+
+    info = db.session.info
+    previous = info.get(_USE_REPLICA)
+    info[_USE_REPLICA] = False
+    try:
+        yield
+    finally:
+        if previous is None:
+            info.pop(_USE_REPLICA, None)
+        else:
+            info[_USE_REPLICA] = previous
+
+
+def configure_replica(app) -> None:
+    """``db.init_app`` 전에 호출. replica bind 등록 + 쓰기 요청 뒤 세션에 마지막 쓰기 시각 기록."""
+    if not REPLICA_URL:
+        return
+    binds = dict(app.config.get('SQLALCHEMY_BINDS') or {})
+    binds[REPLICA_BIND] = REPLICA_URL
+    app.config['SQLALCHEMY_BINDS'] = binds
+
+    from flask import request
+
+    @app.after_request
+    def _mark_recent_writer(response):
+        # after_request 가 끝난 뒤 세션이 저장되므로 이 응답의 Set-Cookie 에 실린다
+        if STICKY_SECONDS > 0 and request.method not in SAFE_METHODS and response.status_code < 400:
+            session[LAST_WRITE_SESSION_KEY] = time.time()
+        return response
+
+    app.logger.info('DB read replica 사용 (sticky %ss)', STICKY_SECONDS)
@@ -0,0 +1,146 @@
+"""room 단위 Socket.IO emit 코얼레싱 버퍼.
+
+같은 사용자 room 으로 짧은 시간(``PT_EMIT_COALESCE_MS``) 안에 여러 알림이 생기면 프레임을 하나씩 보내지 않고
+모아 두었다가 ``notifications_batch`` 프레임 한 번으로 보낸다. 한 건만 모였으면 기존
+``notification`` 이벤트 그대로 보낸다 (구 클라이언트 호환).
+
+- ``PT_EMIT_COALESCE_MS``: 모으는 시간. 기본 0 = 비활성 (즉시 emit). ``notifications_batch`` 를
+  처리하는 웹/모바일 클라이언트가 배포된 뒤에만 켠다 — 구 클라이언트는 ``notification`` 만 듣는다
+- ``PT_EMIT_ROOM_MAX``: room 당 최대 적재 건수. 넘으면 그 room 을 즉시 flush
+- ``PT_EMIT_MAX_PENDING``: 전체 적재 상한. 넘으면 전체를 즉시 flush
+- ``PT_EMIT_FLUSH_ON_COMMIT``: true 면 커밋된 알림을 적재한 직후 해당 room 을 flush (타이머를 기다리지 않음)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+COALESCE_MS = float(os.environ.get('PT_EMIT_COALESCE_MS', '0'))
+ROOM_MAX = int(os.environ.get('PT_EMIT_ROOM_MAX', '50'))
+MAX_PENDING = int(os.environ.get('PT_EMIT_MAX_PENDING', '10000'))
+FLUSH_ON_COMMIT = (os.environ.get('PT_EMIT_FLUSH_ON_COMMIT') or 'false').lower() == 'true'
+
+BATCH_EVENTS = {'notification': 'notifications_batch'}
+
+
+class EmitBuffer:
+    """room → [(event, data)] 적재 후 window 마다 flush.
+
+    emit(event, data, room) 콜백으로 실제 전송한다. 스레드 안전.
+    """
+
+    def __init__(self, emit: Callable[..., Any], *, window_seconds: float,
+                 room_max: int = ROOM_MAX, max_pending: int = MAX_PENDING,
+                 clock: Callable[[], float] = time.monotonic):
+        self.emit = emit
+        self.window = window_seconds
+        self.room_max = room_max
+        self.max_pending = max_pending
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._rooms: dict[str, list[tuple[str, Any]]] = {}
+        self._first_at: dict[str, float] = {}
+        self._pending = 0
+        self.stats = {'queued': 0, 'frames': 0, 'batched_frames': 0}
+
+    def queue(self, room: str, event: str, data: Any) -> None:
+        flush_room = flush_all = False
+        with self._lock:
+            items = self._rooms.setdefault(room, [])
+            if not items:
+                self._first_at[room] = self.clock()
+            items.append((event, data))
+            self._pending += 1
+            self.stats['queued'] += 1
+            flush_room = len(items) >= self.room_max
+            flush_all = self._pending >= self.max_pending
+        if flush_all:
+            self.flush()
+        elif flush_room:
+            self.flush(rooms=[room])
+
+    def _take(self, rooms=None, due_before=None) -> dict[str, list]:
+        with self._lock:
+            if rooms is None:
+                rooms = [
+                    r for r, at in self._first_at.items()
+                    if due_before is None or at <= due_before
+                ]
+            taken = {}
+            for room in rooms:
+                items = self._rooms.pop(room, None)
+                self._first_at.pop(room, None)
+                if items:
+                    taken[room] = items
+                    self._pending -= len(items)
+            return taken
+
+    def _send(self, taken: dict[str, list]) -> int:
+        frames = 0
+        for room, items in taken.items():
+            by_event: dict[str, list] = {}
+            for event, data in items:
+                by_event.setdefault(event, []).append(data)
+            for event, payloads in by_event.items():
+                batch_event = BATCH_EVENTS.get(event)
+                if len(payloads) == 1 or batch_event is None:
+                    for payload in payloads:
+                        self.emit(event, payload, room=room)
+                        frames += 1
+                else:
+                    self.emit(batch_event, {'notifications': payloads}, room=room)
+                    frames += 1
+                    self.stats['batched_frames'] += 1
+        self.stats['frames'] += frames
+        return frames
+
+    def flush(self, rooms=None) -> int:
+        """지정 room(기본: 전체)을 즉시 전송. 보낸 프레임 수 반환."""
+        return self._send(self._take(rooms=rooms))
+
+    def flush_due(self, now: float | None = None) -> int:
+        """첫 적재 후 window 가 지난 room 만 전송."""
+        now = self.clock() if now is None else now
+        return self._send(self._take(due_before=now - self.window))
+
+    def pending(self) -> int:
+        with self._lock:
+            return self._pending
+
+    def run(self, sleep: Callable[[float], Any]) -> None:
+        """백그라운드 flush 루프 (socketio.start_background_task 로 실행)."""
+        interval = max(self.window / 2.0, 0.005)
+        while True:
+            sleep(interval)
+            try:
+                self.flush_due()
+            except Exception as e:
+                logger.exception('emit buffer flush failed: %s', e)
+
+
+_buffer: EmitBuffer | None = None
+_buffer_lock = threading.Lock()
+
+
+def get_buffer(socketio) -> EmitBuffer | None:
+    """프로세스 공용 버퍼. 코얼레싱이 꺼져 있으면 None."""
+    global _buffer
+    if COALESCE_MS <= 0:
+        return None
+    if _buffer is not None:
+        return _buffer
+    with _buffer_lock:
+        if _buffer is None:
+            buffer = EmitBuffer(
+                lambda event, data, room: socketio.emit(event, data, room=room),
+                window_seconds=COALESCE_MS / 1000.0,
+            )
+            socketio.start_background_task(buffer.run, socketio.sleep)
+            _buffer = buffer
+    return _buffer
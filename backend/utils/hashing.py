@@ -0,0 +1,85 @@
+"""비밀번호 해시 오프로드 서비스.
+
+Werkzeug 비밀번호 해시(PBKDF2/scrypt)는 일부러 무거운 연산이라, eventlet 단일 워커에서
+그대로 돌리면 해시가 끝날 때까지 다른 요청과 WebSocket heartbeat 가 모두 멈춘다.
+여기서는 해시/검증을 네이티브 스레드에서 실행하고 동시 실행 수를 제한한다.
+
+- eventlet 이 monkey patch 된 환경(gunicorn eventlet 워커): ``eventlet.tpool`` 로 실행,
+  green semaphore 로 동시 실행 수 제한 (기다리는 동안 hub 는 다른 greenlet 을 돌린다)
+- 그 외(threading 등): 전용 ``ThreadPoolExecutor`` (워커 수 = 동시 실행 상한)
+
+- ``PT_PASSWORD_HASH_OFFLOAD``: ``false`` 면 호출한 스레드에서 바로 실행 (기존 동작)
+- ``PT_PASSWORD_HASH_CONCURRENCY``: 동시 해시 상한, 기본 2
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+logger = logging.getLogger(__name__)
+
+OFFLOAD_ENABLED = (os.environ.get('PT_PASSWORD_HASH_OFFLOAD') or 'true').lower() != 'false'
+CONCURRENCY = max(1, int(os.environ.get('PT_PASSWORD_HASH_CONCURRENCY', '2')))
+
+_lock = threading.Lock()
+_runner: Callable[..., Any] | None = None
+
+
+def _eventlet_patched() -> bool:
+    if 'eventlet' not in sys.modules:
+        return False
+    try:
+        from eventlet import patcher
+        return patcher.is_monkey_patched('thread')
+    except Exception:
+        return False
+
+
+def _build_runner() -> Callable[..., Any]:
+    if _eventlet_patched():
+        from eventlet import tpool
+        from eventlet.semaphore import Semaphore
+
+        gate = Semaphore(CONCURRENCY)
+
+        def _run_tpool(fn, *args):
+            with gate:
+                return tpool.execute(fn, *args)
+
+        logger.info('password hashing: eventlet tpool (concurrency=%s)', CONCURRENCY)
+        return _run_tpool
+
+    executor = ThreadPoolExecutor(max_workers=CONCURRENCY, thread_name_prefix='pw-hash')
+
+    def _run_pool(fn, *args):
+        return executor.submit(fn, *args).result()
+
+    logger.info('password hashing: thread pool (concurrency=%s)', CONCURRENCY)
+    return _run_pool
+
+
+def run_hashing(fn: Callable[..., Any], *args) -> Any:
+    """fn(*args) 를 해시 전용 스레드에서 실행하고 결과를 돌려준다 (예외는 그대로 전파)."""
+    global _runner
+    if not OFFLOAD_ENABLED:
+        return fn(*args)
+    if _runner is None:
+        with _lock:
+            if _runner is None:
+                _runner = _build_runner()
+    return _runner(fn, *args)
+
+
+def hash_password(password: str) -> str:
+    return run_hashing(generate_password_hash, password)
+
+
+def verify_password(password_hash: str, password: str) -> bool:
+    return run_hashing(check_password_hash, password_hash, password)
@@ -0,0 +1,212 @@
+"""eventlet hub 스케줄링 지연(loop lag) 측정과 blocking 호출 감지.
+
+단일 eventlet 워커에서는 monkey patch 되지 않은 I/O, PBKDF2 같은 CPU 연산, 타임아웃이 긴
+동기 HTTP 호출 하나가 hub 를 잡으면 모든 요청과 WebSocket 이 함께 멈춘다.
+
+- heartbeat greenlet: ``PT_HUB_MONITOR_INTERVAL_MS`` 마다 sleep 하고, 예정보다 늦게 깨어난 만큼을
+  lag 로 기록한다 (히스토그램 + 최근 window 의 p50/p95/p99/max 게이지).
+- watchdog 네이티브 스레드: 마지막 heartbeat 이후 ``PT_HUB_BLOCK_THRESHOLD_MS`` 가 지나도록 hub 가
+  돌아오지 않으면 그 순간 hub 스레드의 스택을 잡아 둔다. hub 가 풀려 heartbeat 가 다시 돌면 총
+  정지 시간과 함께 WARNING 로그로 남기고 ``wodybody_hub_blocked_total`` 을 올린다.
+- 최근 정지 기록은 ``GET /api/admin/hub-stalls`` (관리자) 에서 스택과 함께 조회.
+
+환경 변수:
+- ``PT_HUB_MONITOR``: ``auto`` (기본, eventlet monkey patch 시에만) / ``true`` / ``false``
+- ``PT_HUB_MONITOR_INTERVAL_MS`` (기본 100), ``PT_HUB_BLOCK_THRESHOLD_MS`` (기본 500)
+- ``PT_HUB_LAG_WINDOW``: 백분위 계산에 쓰는 최근 샘플 수 (기본 600, interval 100ms 기준 1분)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable
+
+from utils.logging_pipeline import native_modules
+from utils.metrics import Counter, Histogram, register_collector, register_metric
+
+logger = logging.getLogger(__name__)
+
+MONITOR_MODE = (os.environ.get('PT_HUB_MONITOR') or 'auto').lower()
+INTERVAL_MS = float(os.environ.get('PT_HUB_MONITOR_INTERVAL_MS', '100'))
+BLOCK_THRESHOLD_MS = float(os.environ.get('PT_HUB_BLOCK_THRESHOLD_MS', '500'))
+LAG_WINDOW = int(os.environ.get('PT_HUB_LAG_WINDOW', '600'))
+
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+QUANTILES = (0.5, 0.95, 0.99)
+STACK_LIMIT = 40
+
+_, _threading = native_modules()
+
+hub_lag = Histogram('wodybody_hub_lag_seconds', 'eventlet hub 스케줄링 지연 (heartbeat 기준)',
+                    buckets=LAG_BUCKETS)
+hub_blocked = Counter('wodybody_hub_blocked_total', 'hub 가 blocking 임계값 이상 멈춘 횟수')
+
+
+def _eventlet_patched() -> bool:
+    if 'eventlet' not in sys.modules:
+        return False
+    try:
+        from eventlet import patcher
+        return patcher.is_monkey_patched('thread')
+    except Exception:
+        return False
+
+
+def _quantile(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+class HubMonitor:
+    """heartbeat(hub 안) + watchdog(hub 밖 네이티브 스레드) 한 쌍."""
+
+    def __init__(self, interval_ms: float = INTERVAL_MS, threshold_ms: float = BLOCK_THRESHOLD_MS,
+                 window: int = LAG_WINDOW, clock: Callable[[], float] = time.monotonic):
+        self.interval = max(interval_ms, 1.0) / 1000.0
+        self.threshold = max(threshold_ms, 1.0) / 1000.0
+        self.clock = clock
+        self._lock = _threading.Lock()
+        self._samples: deque[float] = deque(maxlen=max(window, 1))
+        self._stalls: deque[dict] = deque(maxlen=20)
+        self._hub_thread_id: int | None = None
+        self._last_beat: float | None = None
+        self._pending_stall: dict | None = None
+        self._watchdog = None
+
+    # ---- heartbeat (hub 안에서 실행) ----
+
+    def beat(self, lag: float) -> None:
+        """heartbeat 한 번 기록. 진행 중이던 정지가 있으면 마무리해 로그로 남긴다."""
+        now = self.clock()
+        with self._lock:
+            self._samples.append(lag)
+            self._last_beat = now
+            stall, self._pending_stall = self._pending_stall, None
+        hub_lag.observe((), lag)
+        if stall is None and lag < self.threshold:
+            return
+        if stall is None:
+            # watchdog 이 스택을 잡기 전에 풀린 경우 (샘플링 간격 사이의 짧은 정지)
+            stall = {'detected_at': datetime.utcnow().isoformat(), 'stack': None}
+        stall['blocked_ms'] = round(lag * 1000, 1)
+        hub_blocked.inc()
+        with self._lock:
+            self._stalls.append(stall)
+        logger.warning('eventlet hub blocked for %.0fms', stall['blocked_ms'], extra={
+            'blocked_ms': stall['blocked_ms'],
+            'stack': stall['stack'],
+        })
+
+    def run(self, sleep: Callable[[float], Any]) -> None:
+        """heartbeat 루프 (socketio.start_background_task 로 실행)."""
+        self._hub_thread_id = _threading.get_ident()
+        self._last_beat = self.clock()
+        while True:
+            started = self.clock()
+            sleep(self.interval)
+            try:
+                self.beat(max(self.clock() - started - self.interval, 0.0))
+            except Exception as e:
+                logger.exception('hub heartbeat failed: %s', e)
+
+    # ---- watchdog (네이티브 스레드) ----
+
+    def check(self) -> dict | None:
+        """heartbeat 가 threshold 이상 멈췄으면 hub 스레드 스택을 잡아 둔다 (정지당 1회)."""
+        now = self.clock()
+        with self._lock:
+            if self._last_beat is None or self._pending_stall is not None:
+                return None
+            if now - self._last_beat < self.threshold + self.interval:
+                return None
+            thread_id = self._hub_thread_id
+        frame = sys._current_frames().get(thread_id) if thread_id is not None else None
+        stall = {
+            'detected_at': datetime.utcnow().isoformat(),
+            'stack': ''.join(traceback.format_stack(frame, limit=STACK_LIMIT)) if frame is not None else None,
+        }
+        with self._lock:
+            if self._pending_stall is None:
+                self._pending_stall = stall
+        return stall
+
+    def start_watchdog(self) -> None:
+        if self._watchdog is not None:
+            return
+
+        def _loop():
+            while True:
+                time.sleep(self.threshold / 4.0)
+                try:
+                    self.check()
+                except Exception as e:
+                    logger.warning('hub watchdog failed: %s', e)
+
+        self._watchdog = _threading.Thread(target=_loop, name='hub-watchdog', daemon=True)
+        self._watchdog.start()
+
+    # ---- 조회 ----
+
+    def lag_quantiles(self) -> dict:
+        with self._lock:
+            ordered = sorted(self._samples)
+        values = {(str(q),): _quantile(ordered, q) for q in QUANTILES}
+        values[('max',)] = ordered[-1] if ordered else 0.0
+        return values
+
+    def stalls(self) -> list[dict]:
+        with self._lock:
+            return list(reversed(self._stalls))
+
+
+_monitor: HubMonitor | None = None
+
+
+def get_monitor() -> HubMonitor | None:
+    return _monitor
+
+
+def install_hub_monitor(app, socketio) -> HubMonitor | None:
+    """heartbeat/watchdog 시작, 메트릭과 ``/api/admin/hub-stalls`` 등록. 꺼져 있으면 None."""
+    global _monitor
+    if MONITOR_MODE == 'false' or (MONITOR_MODE == 'auto' and not _eventlet_patched()):
+        return None
+    if _monitor is not None:
+        return _monitor
+    from flask import jsonify
+
+    from utils.profiler import is_admin_request
+
+    monitor = _monitor = HubMonitor()
+    socketio.start_background_task(monitor.run, socketio.sleep)
+    monitor.start_watchdog()
+
+    register_metric(hub_lag)
+    register_metric(hub_blocked)
+    register_collector('wodybody_hub_lag_recent_seconds', f'최근 {LAG_WINDOW}개 heartbeat 의 hub 지연 백분위',
+                       monitor.lag_quantiles, labels=('quantile',))
+
+    @app.route('/api/admin/hub-stalls', methods=['GET'])
+    def hub_stalls():
+        """최근 hub 정지 기록과 당시 스택 (관리자)
+
+        스택에 내부 경로/인자가 드러나므로 검증된 관리자(PT_ADMIN_TOKEN, Bearer 토큰, 비밀번호 로그인
+        세션)만 허용한다. ``?user_id=`` 같은 대안 인증 경로로는 열리지 않는다.
+        """
+        if not is_admin_request():
+            return jsonify({'message': '권한이 없습니다'}), 403
+        return jsonify({
+            'threshold_ms': monitor.threshold * 1000,
+            'lag_seconds': {label[0]: value for label, value in monitor.lag_quantiles().items()},
+            'stalls': monitor.stalls(),
+        }), 200
+
+    logger.info('hub monitor started (interval=%sms, threshold=%sms)', INTERVAL_MS, BLOCK_THRESHOLD_MS)
+    return monitor
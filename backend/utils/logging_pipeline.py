@@ -0,0 +1,224 @@
+"""비동기 구조화 로깅 파이프라인.
+
+요청 스레드(또는 greenlet)는 ``QueueHandler`` 로 레코드를 큐에 넣기만 하고, 포맷/파일 쓰기는
+``QueueListener`` 스레드가 처리한다. eventlet 이 monkey patch 된 환경에서는 큐와 리스너 스레드를
+네이티브 구현으로 만들어 디스크 I/O 가 hub 를 막지 않게 한다.
+
+- 출력: stdout(JSON 한 줄) + 선택적 회전 파일
+- 접근 로그: 요청마다 method/path/route/status/duration_ms 를 ``wodybody.access`` 로 기록.
+  라우트별 샘플링 가능, 4xx/5xx 응답은 샘플링하지 않는다.
+
+환경 변수:
+- ``PT_LOG_LEVEL`` (기본 INFO), ``PT_LOG_FORMAT`` (``json`` 기본 / ``text``)
+- ``PT_LOG_FILE`` (기본 ``logs/crossfit.log``, 빈 값이면 파일 출력 끔), ``PT_LOG_FILE_MAX_MB`` (기본 50)
+- ``PT_LOG_SAMPLE_RATE``: 접근 로그 기본 샘플링 비율 (기본 1.0)
+- ``PT_LOG_SAMPLE_ROUTES``: ``/api/health=0,/api/notifications=0.1`` 처럼 경로 prefix(또는 endpoint 이름)별 비율
+- ``PT_SOCKETIO_LOG``: ``true`` 면 Socket.IO / Engine.IO 내부 로그 출력 (기본 ``false``)
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+LOG_LEVEL = (os.environ.get('PT_LOG_LEVEL') or 'INFO').upper()
+LOG_FORMAT = (os.environ.get('PT_LOG_FORMAT') or 'json').lower()
+LOG_FILE = os.environ.get('PT_LOG_FILE', 'logs/crossfit.log')
+LOG_FILE_MAX_MB = int(os.environ.get('PT_LOG_FILE_MAX_MB', '50'))
+SAMPLE_RATE = float(os.environ.get('PT_LOG_SAMPLE_RATE', '1.0'))
+SOCKETIO_LOG = (os.environ.get('PT_SOCKETIO_LOG') or 'false').lower() == 'true'
+
+ACCESS_LOGGER = 'wodybody.access'
+
+# LogRecord 기본 속성 (extra 로 넘어온 필드만 골라내기 위함)
+_RESERVED = set(vars(logging.makeLogRecord({}))) | {'message', 'asctime'}
+
+_listener: QueueListener | None = None
+
+
+def parse_sample_routes(spec: str | None) -> dict[str, float]:
+    """``/api/health=0,notifications.get_notifications=0.1`` → {key: rate}. 잘못된 항목은 무시."""
+    rates = {}
+    for item in (spec or '').split(','):
+        key, sep, value = item.strip().partition('=')
+        if not sep or not key:
+            continue
+        try:
+            rates[key.strip()] = min(max(float(value), 0.0), 1.0)
+        except ValueError:
+            continue
+    return rates
+
+
+SAMPLE_ROUTES = parse_sample_routes(os.environ.get('PT_LOG_SAMPLE_ROUTES'))
+
+
+def sample_rate_for(path: str, endpoint: str | None, routes: dict[str, float] = SAMPLE_ROUTES,
+                    default: float = SAMPLE_RATE) -> float:
+    """endpoint 이름 일치 > 가장 긴 경로 prefix > 기본값 순으로 샘플링 비율 결정."""
+    if endpoint and endpoint in routes:
+        return routes[endpoint]
+    best = None
+    for key in routes:
+        if key.startswith('/') and path.startswith(key) and (best is None or len(key) > len(best)):
+            best = key
+    return routes[best] if best is not None else default
+
+
+class JsonFormatter(logging.Formatter):
+    """레코드 → JSON 한 줄. ``extra`` 로 넘긴 필드는 최상위 키로 포함."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            'ts': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED and not key.startswith('_'):
+                payload[key] = value
+        if record.levelno >= logging.WARNING and record.name != ACCESS_LOGGER:
+            payload['at'] = f'{record.pathname}:{record.lineno}'
+        if record.exc_text:
+            payload['exc'] = record.exc_text
+        elif record.exc_info:
+            payload['exc'] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class _PreparingQueueHandler(QueueHandler):
+    """메시지 조립과 traceback 문자열화만 호출 쪽에서 하고 나머지 포맷은 리스너에 맡긴다."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        prepared = logging.makeLogRecord(record.__dict__)
+        prepared.msg = record.getMessage()
+        prepared.args = None
+        prepared.exc_info = None
+        return prepared
+
+
+def native_modules():
+    """eventlet monkey patch 여부와 무관한 (queue, threading) 모듈."""
+    if 'eventlet' in sys.modules:
+        try:
+            from eventlet import patcher
+            return patcher.original('queue'), patcher.original('threading')
+        except Exception:
+            pass
+    import queue
+    import threading
+    return queue, threading
+
+
+class _NativeQueueListener(QueueListener):
+    def start(self):
+        _, threading_mod = native_modules()
+        self._thread = threading_mod.Thread(target=self._monitor, name='log-listener', daemon=True)
+        self._thread.start()
+
+
+def _build_handlers() -> list[logging.Handler]:
+    if LOG_FORMAT == 'text':
+        formatter = logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s [in %(pathname)s:%(lineno)d]')
+    else:
+        formatter = JsonFormatter()
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(formatter)
+    handlers = [stream]
+    if LOG_FILE:
+        try:
+            os.makedirs(os.path.dirname(LOG_FILE) or '.', exist_ok=True)
+            file_handler = RotatingFileHandler(LOG_FILE, maxBytes=LOG_FILE_MAX_MB * 1024 * 1024,
+                                               backupCount=10, encoding='utf-8')
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
+        except OSError as e:
+            print(f'log file {LOG_FILE} unavailable: {e}', file=sys.stderr)
+    return handlers
+
+
+def configure_logging(app=None) -> QueueListener:
+    """루트 로거를 큐 핸들러로 교체하고 리스너를 시작한다 (프로세스당 1회)."""
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    queue_mod, _ = native_modules()
+    log_queue = queue_mod.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_PreparingQueueHandler(log_queue))
+    root.setLevel(LOG_LEVEL)
+
+    _listener = _NativeQueueListener(log_queue, *_build_handlers(), respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    if app is not None:
+        from flask.logging import default_handler
+        app.logger.removeHandler(default_handler)
+        app.logger.setLevel(LOG_LEVEL)
+    return _listener
+
+
+def socketio_logger_options() -> dict:
+    """SocketIO(logger=..., engineio_logger=...) 인자.
+
+    bool 을 넘기면 라이브러리가 자체 StreamHandler 를 붙여 큐를 우회하므로 Logger 객체를 넘긴다.
+    """
+    level = logging.INFO if SOCKETIO_LOG else logging.WARNING
+    options = {}
+    for key, name in (('logger', 'socketio.server'), ('engineio_logger', 'engineio.server')):
+        logger = logging.getLogger(name)
+        logger.setLevel(level)
+        options[key] = logger
+    return options
+
+
+def install_request_logging(app) -> None:
+    """요청 소요 시간을 포함한 접근 로그 (라우트별 샘플링, 4xx/5xx 는 항상 기록)."""
+    from flask import g, request
+
+    access = logging.getLogger(ACCESS_LOGGER)
+
+    @app.before_request
+    def _log_request_start():
+        g._log_started = time.perf_counter()
+
+    @app.after_request
+    def _log_request_end(response):
+        started = g.pop('_log_started', None)
+        if started is None:
+            return response
+        status = response.status_code
+        if status < 400:
+            rate = sample_rate_for(request.path, request.endpoint)
+            if rate <= 0 or (rate < 1 and random.random() >= rate):
+                return response
+        else:
+            rate = 1.0
+        duration_ms = round((time.perf_counter() - started) * 1000, 2)
+        level = logging.ERROR if status >= 500 else logging.WARNING if status >= 400 else logging.INFO
+        access.log(level, '%s %s %s %.1fms', request.method, request.path, status, duration_ms, extra={
+            'method': request.method,
+            'path': request.path,
+            'route': request.url_rule.rule if request.url_rule else None,
+            'status': status,
+            'duration_ms': duration_ms,
+            'sample_rate': rate,
+            # utils/metrics 가 기록 (계측이 꺼져 있으면 None)
+            'db_queries': g.get('db_queries'),
+            'db_time_ms': g.get('db_time_ms'),
+        })
+        return response
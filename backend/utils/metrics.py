@@ -0,0 +1,273 @@
+"""요청 지연 / DB 쿼리 계측과 Prometheus 텍스트 노출.
+
+- Flask ``before_request`` / ``after_request`` 로 라우트(``url_rule``)별 지연 히스토그램,
+  상태 코드별 요청 수, 응답 바이트를 기록한다.
+- SQLAlchemy ``before_cursor_execute`` / ``after_cursor_execute`` (모든 Engine) 로 요청 안에서
+  실행된 쿼리 수와 DB 시간을 모아 라우트별 쿼리 수 히스토그램 / DB 시간 합계에 더한다.
+- 응답에 ``Server-Timing: app;dur=..., db;dur=...;desc="N queries"`` 헤더를 붙인다.
+- ``GET /api/metrics`` 에서 Prometheus text format 으로 노출. 다른 모듈은
+  :func:`register_collector` 로 게이지를 추가할 수 있다.
+
+환경 변수:
+- ``PT_METRICS_ENABLED`` (기본 ``true``)
+- ``PT_METRICS_TOKEN``: 스크레이퍼용 ``Authorization: Bearer <token>``. 그 외에는 관리자
+  (:func:`utils.profiler.is_admin_request`) 만 ``/api/metrics`` 를 볼 수 있다
+- ``PT_SERVER_TIMING`` (기본 ``true``)
+"""
+
+from __future__ import annotations
+
+import bisect
+import hmac
+import logging
+import os
+import threading
+import time
+from typing import Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+METRICS_ENABLED = (os.environ.get('PT_METRICS_ENABLED') or 'true').lower() != 'false'
+METRICS_TOKEN = os.environ.get('PT_METRICS_TOKEN') or ''
+SERVER_TIMING = (os.environ.get('PT_SERVER_TIMING') or 'true').lower() != 'false'
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+UNMATCHED_ROUTE = '<unmatched>'
+INF_BUCKET = 'le="+Inf"'
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: tuple, values: tuple, extra: str = '') -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+def _format_number(value) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, labels: tuple = ()):
+        self.name = name
+        self.help = help_text
+        self.labels = labels
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, label_values: tuple = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def value(self, label_values: tuple = ()) -> float:
+        with self._lock:
+            return self._values.get(label_values, 0)
+
+    def render(self) -> Iterable[str]:
+        yield f'# HELP {self.name} {self.help}'
+        yield f'# TYPE {self.name} counter'
+        with self._lock:
+            items = sorted(self._values.items())
+        for label_values, value in items:
+            yield f'{self.name}{_format_labels(self.labels, label_values)} {_format_number(value)}'
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, labels: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets))
+        # label_values → [bucket counts..., sum, count]
+        self._values: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, label_values: tuple, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(label_values)
+            if state is None:
+                state = self._values[label_values] = [0] * len(self.buckets) + [0.0, 0]
+            if index < len(self.buckets):
+                state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def snapshot(self, label_values: tuple) -> dict | None:
+        with self._lock:
+            state = self._values.get(label_values)
+            return None if state is None else {'sum': state[-2], 'count': state[-1]}
+
+    def render(self) -> Iterable[str]:
+        yield f'# HELP {self.name} {self.help}'
+        yield f'# TYPE {self.name} histogram'
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._values.items())
+        for label_values, state in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                le = f'le="{_format_number(float(bound))}"'
+                yield f'{self.name}_bucket{_format_labels(self.labels, label_values, le)} {cumulative}'
+            yield f'{self.name}_bucket{_format_labels(self.labels, label_values, INF_BUCKET)} {state[-1]}'
+            yield f'{self.name}_sum{_format_labels(self.labels, label_values)} {_format_number(state[-2])}'
+            yield f'{self.name}_count{_format_labels(self.labels, label_values)} {state[-1]}'
+
+
+ROUTE_LABELS = ('method', 'route')
+
+request_duration = Histogram(
+    'wodybody_http_request_duration_seconds', '라우트별 요청 처리 시간', ROUTE_LABELS)
+requests_total = Counter(
+    'wodybody_http_requests_total', '라우트/상태 코드별 요청 수', ROUTE_LABELS + ('status',))
+response_bytes = Counter(
+    'wodybody_http_response_bytes_total', '라우트별 응답 바이트 합계', ROUTE_LABELS)
+db_queries = Histogram(
+    'wodybody_db_queries_per_request', '요청당 SQL 실행 수', ROUTE_LABELS, QUERY_COUNT_BUCKETS)
+db_seconds = Counter(
+    'wodybody_db_query_seconds_total', '라우트별 DB 실행 시간 합계', ROUTE_LABELS)
+
+_metrics: list = [request_duration, requests_total, response_bytes, db_queries, db_seconds]
+# name → (help, type, fn() -> {label_values tuple: value} 또는 숫자, label names)
+_collectors: dict[str, tuple[str, str, Callable, tuple]] = {}
+
+
+def register_metric(metric) -> None:
+    """Counter/Histogram 을 /api/metrics 출력에 추가."""
+    if metric not in _metrics:
+        _metrics.append(metric)
+
+
+def register_collector(name: str, help_text: str, fn: Callable, labels: tuple = (),
+                       metric_type: str = 'gauge') -> None:
+    """스크레이프 시점에 값을 계산하는 게이지 등록. fn 은 숫자 또는 {label_values: 숫자} 반환."""
+    _collectors[name] = (help_text, metric_type, fn, labels)
+
+
+def render() -> str:
+    lines = []
+    for metric in list(_metrics):
+        lines.extend(metric.render())
+    for name, (help_text, metric_type, fn, labels) in list(_collectors.items()):
+        try:
+            values = fn()
+        except Exception as e:
+            logger.warning('metrics collector %s 실패: %s', name, e)
+            continue
+        if values is None:
+            continue
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {metric_type}')
+        if not isinstance(values, dict):
+            values = {(): values}
+        for label_values, value in sorted(values.items()):
+            lines.append(f'{name}{_format_labels(labels, label_values)} {_format_number(value)}')
+    return '\n'.join(lines) + '\n'
+
+
+# --------------------------------------------------------------------
+# SQLAlchemy 쿼리 계측
+# --------------------------------------------------------------------
+
+_sqlalchemy_installed = False
+
+
+def _request_stats():
+    from flask import g, has_request_context
+
+    if not has_request_context():
+        return None
+    return g.get('_db_stats')
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('_query_started', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get('_query_started')
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    stats = _request_stats()
+    if stats is not None:
+        stats[0] += 1
+        stats[1] += elapsed
+
+
+def install_query_hooks() -> None:
+    """모든 Engine 에 쿼리 카운터 연결 (프로세스당 1회, replica 엔진 포함)."""
+    global _sqlalchemy_installed
+    if _sqlalchemy_installed:
+        return
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+    _sqlalchemy_installed = True
+
+
+# --------------------------------------------------------------------
+# Flask 계측 / 엔드포인트
+# --------------------------------------------------------------------
+
+
+def install_metrics(app) -> None:
+    """요청 계측 훅, Server-Timing 헤더, ``/api/metrics`` 등록."""
+    if not METRICS_ENABLED:
+        return
+    from flask import Response, g, jsonify, request
+
+    install_query_hooks()
+
+    @app.before_request
+    def _metrics_request_start():
+        g._metrics_started = time.perf_counter()
+        g._db_stats = [0, 0.0]
+
+    @app.after_request
+    def _metrics_request_end(response):
+        started = g.pop('_metrics_started', None)
+        if started is None:
+            return response
+        elapsed = time.perf_counter() - started
+        queries, db_time = g.get('_db_stats') or (0, 0.0)
+        route = request.url_rule.rule if request.url_rule else UNMATCHED_ROUTE
+        labels = (request.method, route)
+
+        request_duration.observe(labels, elapsed)
+        requests_total.inc(labels + (str(response.status_code),))
+        db_queries.observe(labels, queries)
+        db_seconds.inc(labels, db_time)
+        if not response.is_streamed:
+            response_bytes.inc(labels, response.calculate_content_length() or 0)
+
+        # 접근 로그(utils/logging_pipeline)에서 함께 기록
+        g.db_queries = queries
+        g.db_time_ms = round(db_time * 1000, 2)
+        if SERVER_TIMING:
+            response.headers.add(
+                'Server-Timing',
+                f'app;dur={elapsed * 1000:.1f}, db;dur={db_time * 1000:.1f};desc="{queries} queries"',
+            )
+        return response
+
+    @app.route('/api/metrics', methods=['GET'])
+    def metrics_endpoint():
+        """Prometheus text format 메트릭"""
+        from utils.profiler import is_admin_request
+
+        auth = request.headers.get('Authorization') or ''
+        token_ok = bool(METRICS_TOKEN) and hmac.compare_digest(auth.encode(), f'Bearer {METRICS_TOKEN}'.encode())
+        if not (token_ok or is_admin_request()):
+            return jsonify({'message': '권한이 없습니다'}), 403
+        return Response(render(), mimetype='text/plain; version=0.0.4; charset=utf-8')
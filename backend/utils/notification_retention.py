@@ -0,0 +1,222 @@
+"""알림 보존 기간 정리 / 다이제스트 압축 잡.
+
+스케줄러(``utils/scheduler.py``)가 주기적으로 :func:`run_retention` 을 호출한다.
+
+1. 필요한 인덱스 보장 — ``program_id`` / ``(is_read, created_at)`` / 보관 테이블.
+   PostgreSQL 은 ``CREATE INDEX CONCURRENTLY IF NOT EXISTS`` 로 쓰기를 막지 않는다.
+2. 보존 기간 정리 — ``PT_NOTIFICATION_RETENTION_DAYS`` 보다 오래된 읽은 알림을
+   ``PT_NOTIFICATION_RETENTION_BATCH`` 건씩 삭제(또는 ``archive`` 모드면 보관 테이블로 이동).
+   한 번 실행에 최대 ``PT_NOTIFICATION_RETENTION_MAX_BATCHES`` 배치까지만 처리하고 나머지는 다음 실행으로 넘긴다.
+3. 다이제스트 — ``PT_NOTIFICATION_DIGEST_AFTER_DAYS`` 보다 오래된 **읽은** 알림 중
+   같은 (사용자, type) 이 ``PT_NOTIFICATION_DIGEST_MIN`` 건 이상이면 한 건(``<type>_digest``)으로 합친다.
+
+안 읽은 알림은 건드리지 않으므로 ``notification_counters`` 는 바뀌지 않는다.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, text
+
+from config.database import db
+
+logger = logging.getLogger(__name__)
+
+RETENTION_DAYS = int(os.environ.get('PT_NOTIFICATION_RETENTION_DAYS', '90'))
+# 'delete' | 'archive'
+RETENTION_MODE = (os.environ.get('PT_NOTIFICATION_RETENTION_MODE') or 'delete').lower()
+RETENTION_BATCH = int(os.environ.get('PT_NOTIFICATION_RETENTION_BATCH', '1000'))
+RETENTION_MAX_BATCHES = int(os.environ.get('PT_NOTIFICATION_RETENTION_MAX_BATCHES', '50'))
+RETENTION_INTERVAL_HOURS = int(os.environ.get('PT_NOTIFICATION_RETENTION_INTERVAL_HOURS', '6'))
+DIGEST_AFTER_DAYS = int(os.environ.get('PT_NOTIFICATION_DIGEST_AFTER_DAYS', '7'))
+DIGEST_MIN = int(os.environ.get('PT_NOTIFICATION_DIGEST_MIN', '5'))
+DIGEST_MAX_GROUPS = int(os.environ.get('PT_NOTIFICATION_DIGEST_MAX_GROUPS', '200'))
+DIGEST_SUFFIX = '_digest'
+
+REQUIRED_INDEXES = [
+    ('idx_notifications_program_id', 'notifications(program_id)'),
+    ('idx_notifications_read_created', 'notifications(is_read, created_at)'),
+    ('idx_notifications_user_created_id', 'notifications(user_id, created_at, id)'),
+]
+
+_schema_ready = False
+_last_report: dict | None = None
+
+
+def ensure_schema() -> list[str]:
+    """스캔에 필요한 인덱스와 보관 테이블을 만든다 (프로세스당 1회). 생성 시도한 인덱스 이름 반환."""
+    global _schema_ready
+    if _schema_ready:
+        return []
+    from models.notification import NotificationArchive
+
+    engine = db.engine
+    concurrently = 'CONCURRENTLY ' if engine.dialect.name == 'postgresql' else ''
+    created = []
+    # CONCURRENTLY 는 트랜잭션 밖에서만 실행 가능 → AUTOCOMMIT 커넥션
+    with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+        for name, target in REQUIRED_INDEXES:
+            try:
+                conn.execute(text(f'CREATE INDEX {concurrently}IF NOT EXISTS {name} ON {target}'))
+                created.append(name)
+            except Exception as e:
+                logger.warning('index %s 생성 실패: %s', name, e)
+    if RETENTION_MODE == 'archive':
+        NotificationArchive.__table__.create(bind=engine, checkfirst=True)
+    _schema_ready = True
+    return created
+
+
+def _delete_ids(ids: list[int]) -> None:
+    from models.notification import Notifications
+    from routes.notifications import mark_notifications_removed
+
+    # 지워지는 행의 주인은 ?since 커서가 무효가 되므로 prune_seq 를 올려 재동기화시킨다
+    owners = [uid for (uid,) in db.session.query(Notifications.user_id)
+              .filter(Notifications.id.in_(ids)).distinct()]
+    Notifications.query.filter(Notifications.id.in_(ids)).delete(synchronize_session=False)
+    mark_notifications_removed(owners)
+
+
+def _archive_ids(ids: list[int]) -> None:
+    from models.notification import Notifications, NotificationArchive
+
+    cols = ['id', 'user_id', 'program_id', 'type', 'title', 'message', 'is_read', 'created_at']
+    source = db.session.query(*[getattr(Notifications, c) for c in cols]).filter(Notifications.id.in_(ids))
+    db.session.execute(
+        NotificationArchive.__table__.insert().from_select(cols, source)
+    )
+    _delete_ids(ids)
+
+
+def compact_digests(now: datetime | None = None) -> dict[str, int]:
+    """오래된 읽은 알림 중 같은 (user_id, type) 반복을 다이제스트 1건으로 합친다.
+
+    그룹 행을 한꺼번에 읽지 않고 ``RETENTION_BATCH`` 건씩 지우며 청크마다 커밋한다.
+    ``archive`` 모드면 :func:`purge_expired` 와 같이 보관 테이블로 옮긴다.
+    """
+    from models.notification import Notifications
+
+    now = now or datetime.utcnow()
+    cutoff = now - timedelta(days=DIGEST_AFTER_DAYS)
+    remove = _archive_ids if RETENTION_MODE == 'archive' else _delete_ids
+    base = (
+        Notifications.is_read.is_(True),
+        Notifications.created_at < cutoff,
+        ~Notifications.type.like(f'%{DIGEST_SUFFIX}'),
+    )
+    groups = (
+        db.session.query(
+            Notifications.user_id,
+            Notifications.type,
+            func.count(Notifications.id),
+            func.count(Notifications.program_id),
+            func.count(Notifications.program_id.distinct()),
+        )
+        .filter(*base)
+        .group_by(Notifications.user_id, Notifications.type)
+        .having(func.count(Notifications.id) >= DIGEST_MIN)
+        .limit(DIGEST_MAX_GROUPS)
+        .all()
+    )
+    report = {'groups': 0, 'rows': 0}
+    for user_id, notification_type, count, with_program, distinct_programs in groups:
+        group = (*base, Notifications.user_id == user_id, Notifications.type == notification_type)
+        latest = (
+            db.session.query(Notifications.id, Notifications.title, Notifications.program_id, Notifications.created_at)
+            .filter(*group)
+            .order_by(Notifications.created_at.desc(), Notifications.id.desc())
+            .first()
+        )
+        if latest is None:
+            continue
+        # program_id 가 (NULL 포함) 한 가지뿐일 때만 다이제스트에 남긴다
+        single_program = distinct_programs == 0 or (distinct_programs == 1 and with_program == count)
+        db.session.add(Notifications(
+            user_id=user_id,
+            program_id=latest.program_id if single_program else None,
+            type=(notification_type + DIGEST_SUFFIX)[:50],
+            title=latest.title,
+            message=f'"{latest.title}" 등 {count}건의 알림을 하나로 묶었습니다.',
+            is_read=True,
+            created_at=latest.created_at,
+        ))
+        removed = 0
+        while removed < count:
+            ids = [
+                row.id for row in db.session.query(Notifications.id)
+                .filter(*group)
+                .order_by(Notifications.created_at, Notifications.id)
+                .limit(min(RETENTION_BATCH, count - removed))
+            ]
+            if not ids:
+                break
+            remove(ids)
+            db.session.commit()
+            removed += len(ids)
+        report['groups'] += 1
+        report['rows'] += removed - 1
+    return report
+
+
+def purge_expired(now: datetime | None = None) -> dict[str, int]:
+    """보존 기간이 지난 읽은 알림을 배치 단위로 삭제/보관."""
+    from models.notification import Notifications
+
+    now = now or datetime.utcnow()
+    cutoff = now - timedelta(days=RETENTION_DAYS)
+    remove = _archive_ids if RETENTION_MODE == 'archive' else _delete_ids
+    report = {'rows': 0, 'batches': 0, 'more': False}
+    for _ in range(RETENTION_MAX_BATCHES):
+        ids = [
+            row.id for row in db.session.query(Notifications.id)
+            .filter(Notifications.is_read.is_(True), Notifications.created_at < cutoff)
+            .order_by(Notifications.created_at, Notifications.id)
+            .limit(RETENTION_BATCH)
+        ]
+        if not ids:
+            return report
+        remove(ids)
+        db.session.commit()
+        report['rows'] += len(ids)
+        report['batches'] += 1
+    report['more'] = True
+    return report
+
+
+def run_retention(app) -> dict:
+    """스케줄러 진입점. 실행 리포트(정리된 행 수 등)를 로그로 남기고 반환."""
+    global _last_report
+    started = time.perf_counter()
+    with app.app_context():
+        try:
+            ensure_schema()
+            purged = purge_expired()
+            digests = compact_digests()
+        except Exception as e:
+            db.session.rollback()
+            logger.exception('notification retention failed: %s', e)
+            return {'error': str(e)}
+    report = {
+        'mode': RETENTION_MODE,
+        'retention_days': RETENTION_DAYS,
+        'digest_groups': digests['groups'],
+        'digest_rows_reclaimed': digests['rows'],
+        'expired_rows_reclaimed': purged['rows'],
+        'rows_reclaimed': digests['rows'] + purged['rows'],
+        'batches': purged['batches'],
+        'more_pending': purged['more'],
+        'elapsed_seconds': round(time.perf_counter() - started, 3),
+        'finished_at': datetime.utcnow().isoformat(),
+    }
+    _last_report = report
+    logger.info('notification retention: %s', report)
+    return report
+
+
+def last_retention_report() -> dict | None:
+    return _last_report
@@ -0,0 +1,212 @@
+"""실시간 접속(presence) 레지스트리
+
+``join_user_room`` / ``leave_user_room`` / ``disconnect`` 핸들러가 사용자별 소켓 연결 수를
+갱신하고, 알림 경로는 이를 보고 접속 중인 사용자에게만 emit, 오프라인 사용자는
+푸시 아웃박스로 보낸다.
+
+- 기본: 프로세스 메모리 맵 (sid → user_ids, user_id → 연결 수)
+- ``PT_PRESENCE_REDIS_URL`` (또는 ``SOCKETIO_MESSAGE_QUEUE`` 가 redis URL) 이 있으면
+  인스턴스별 Redis 해시에 연결 수를 올려 여러 워커가 같은 presence 를 본다.
+  인스턴스가 죽으면 해시 TTL 이 만료되어 자동으로 빠진다.
+
+메시지 큐로 여러 인스턴스가 묶여 있는데 공유 백엔드가 없으면 다른 인스턴스의 접속을
+알 수 없으므로 ``online_users`` 는 None 을 반환하고, 호출자는 기존처럼 모두에게 emit 한다.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Iterable
+
+logger = logging.getLogger(__name__)
+
+ROUTING_ENABLED = (os.environ.get('PT_PRESENCE_ROUTING') or 'true').lower() != 'false'
+REDIS_KEY_PREFIX = os.environ.get('PT_PRESENCE_KEY_PREFIX', 'wodybody:presence')
+REDIS_TTL_SECONDS = int(os.environ.get('PT_PRESENCE_TTL_SECONDS', '90'))
+
+
+class RedisPresenceBackend:
+    """인스턴스별 해시 ``<prefix>:host:<id>`` (user_id → 연결 수) + 인스턴스 집합 ``<prefix>:hosts``."""
+
+    def __init__(self, url: str, *, prefix: str = REDIS_KEY_PREFIX, ttl: int = REDIS_TTL_SECONDS):
+        import redis
+
+        self.redis = redis.Redis.from_url(url)
+        self.hosts_key = f'{prefix}:hosts'
+        self.host_key = f'{prefix}:host:{uuid.uuid4().hex}'
+        self.ttl = ttl
+
+    def set_count(self, user_id: int, count: int) -> None:
+        pipe = self.redis.pipeline()
+        if count > 0:
+            pipe.hset(self.host_key, str(user_id), count)
+        else:
+            pipe.hdel(self.host_key, str(user_id))
+        pipe.expire(self.host_key, self.ttl)
+        pipe.sadd(self.hosts_key, self.host_key)
+        pipe.execute()
+
+    def heartbeat(self, counts: dict[int, int]) -> None:
+        """로컬 상태 전체를 다시 쓰고 TTL 연장 (Redis 재시작/만료 복구 겸용)."""
+        pipe = self.redis.pipeline()
+        pipe.delete(self.host_key)
+        if counts:
+            pipe.hset(self.host_key, mapping={str(uid): n for uid, n in counts.items()})
+            pipe.expire(self.host_key, self.ttl)
+        pipe.sadd(self.hosts_key, self.host_key)
+        pipe.execute()
+
+    def online(self, user_ids: list[int]) -> set[int]:
+        hosts = [h.decode() if isinstance(h, bytes) else h for h in self.redis.smembers(self.hosts_key)]
+        if not hosts:
+            return set()
+        pipe = self.redis.pipeline()
+        for host in hosts:
+            pipe.exists(host)
+            pipe.hmget(host, [str(uid) for uid in user_ids])
+        results = pipe.execute()
+
+        online, dead = set(), []
+        for host, alive, values in zip(hosts, results[0::2], results[1::2]):
+            if not alive:
+                dead.append(host)
+                continue
+            online.update(uid for uid, v in zip(user_ids, values) if v and int(v) > 0)
+        if dead:
+            self.redis.srem(self.hosts_key, *dead)
+        return online
+
+    def close(self) -> None:
+        self.redis.delete(self.host_key)
+        self.redis.srem(self.hosts_key, self.host_key)
+
+
+class PresenceRegistry:
+    """사용자별 소켓 연결 수. 스레드 안전."""
+
+    def __init__(self, backend: RedisPresenceBackend | None = None, *, authoritative: bool = True):
+        self._lock = threading.Lock()
+        self._rooms: dict[str, set[int]] = {}
+        self._counts: dict[int, int] = {}
+        self.backend = backend
+        self.authoritative = authoritative or backend is not None
+        self._heartbeat_thread = None
+
+    def _sync(self, user_id: int, count: int) -> None:
+        if self.backend is None:
+            return
+        try:
+            self.backend.set_count(user_id, count)
+        except Exception as e:
+            logger.warning('presence 백엔드 갱신 실패 (user_id=%s): %s', user_id, e)
+
+    def join(self, user_id: int, sid: str) -> int:
+        with self._lock:
+            rooms = self._rooms.setdefault(sid, set())
+            if user_id not in rooms:
+                rooms.add(user_id)
+                self._counts[user_id] = self._counts.get(user_id, 0) + 1
+            count = self._counts[user_id]
+        self._sync(user_id, count)
+        return count
+
+    def _release(self, user_id: int) -> int:
+        count = self._counts.get(user_id, 0) - 1
+        if count > 0:
+            self._counts[user_id] = count
+        else:
+            self._counts.pop(user_id, None)
+            count = 0
+        return count
+
+    def leave(self, user_id: int, sid: str) -> int:
+        with self._lock:
+            rooms = self._rooms.get(sid)
+            if not rooms or user_id not in rooms:
+                return self._counts.get(user_id, 0)
+            rooms.discard(user_id)
+            if not rooms:
+                self._rooms.pop(sid, None)
+            count = self._release(user_id)
+        self._sync(user_id, count)
+        return count
+
+    def disconnect(self, sid: str) -> list[int]:
+        """sid 가 참여했던 모든 사용자 연결 수 감소. 영향받은 user_id 목록 반환."""
+        with self._lock:
+            user_ids = self._rooms.pop(sid, set())
+            changed = [(uid, self._release(uid)) for uid in user_ids]
+        for uid, count in changed:
+            self._sync(uid, count)
+        return [uid for uid, _ in changed]
+
+    def count(self, user_id: int) -> int:
+        with self._lock:
+            return self._counts.get(user_id, 0)
+
+    def online_users(self, user_ids: Iterable[int]) -> set[int] | None:
+        """user_ids 중 접속 중인 사용자 집합. 판단할 수 없으면 None (= 모두 emit)."""
+        if not ROUTING_ENABLED or not self.authoritative:
+            return None
+        user_ids = list(dict.fromkeys(user_ids))
+        with self._lock:
+            online = {uid for uid in user_ids if self._counts.get(uid, 0) > 0}
+        remaining = [uid for uid in user_ids if uid not in online]
+        if self.backend is not None and remaining:
+            try:
+                online |= self.backend.online(remaining)
+            except Exception as e:
+                logger.warning('presence 백엔드 조회 실패, 전원 emit 으로 대체: %s', e)
+                return None
+        return online
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                'sockets': len(self._rooms),
+                'online_users': len(self._counts),
+                'connections': sum(self._counts.values()),
+                'shared': self.backend is not None,
+                'authoritative': self.authoritative,
+            }
+
+    def start_heartbeat(self) -> None:
+        if self.backend is None or self._heartbeat_thread is not None:
+            return
+        interval = max(self.backend.ttl / 3.0, 1.0)
+
+        def _loop():
+            while True:
+                time.sleep(interval)
+                with self._lock:
+                    counts = dict(self._counts)
+                try:
+                    self.backend.heartbeat(counts)
+                except Exception as e:
+                    logger.warning('presence heartbeat 실패: %s', e)
+
+        self._heartbeat_thread = threading.Thread(target=_loop, name='presence-heartbeat', daemon=True)
+        self._heartbeat_thread.start()
+
+
+def _build_registry() -> PresenceRegistry:
+    queue = (os.environ.get('SOCKETIO_MESSAGE_QUEUE') or '').strip()
+    url = os.environ.get('PT_PRESENCE_REDIS_URL') or (
+        queue if queue.startswith(('redis://', 'rediss://')) else ''
+    )
+    if url:
+        try:
+            registry = PresenceRegistry(RedisPresenceBackend(url))
+            registry.start_heartbeat()
+            return registry
+        except Exception as e:
+            logger.warning('Redis presence 백엔드를 사용할 수 없어 메모리 presence 로 동작: %s', e)
+    # 메시지 큐로 다른 인스턴스와 묶여 있으면 로컬 정보만으로는 오프라인 판단 불가
+    return PresenceRegistry(authoritative=not queue)
+
+
+registry = _build_registry()
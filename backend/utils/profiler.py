@@ -0,0 +1,278 @@
+"""운영 요청 프로파일링 훅 (opt-in).
+
+두 가지 방식으로 프로파일을 남긴다.
+
+1. cProfile — ``PT_PROFILE_SAMPLE_RATE`` 비율로 뽑힌 요청, 또는 관리자 토큰과 함께
+   ``X-Profile: 1`` 헤더를 보낸 요청 전체를 프로파일해 ``.pstats`` 로 저장.
+   (cProfile 은 동시에 하나만 돌 수 있어 이미 실행 중이면 건너뜀. eventlet 에서는 같은 hub 에서
+   번갈아 돈 다른 greenlet 도 함께 잡힌다)
+2. 느린 요청 스택 샘플러 — 요청이 ``PT_PROFILE_SLOW_MS`` 를 넘기면 네이티브 샘플러 스레드가
+   그 요청 스레드의 스택을 ``PT_PROFILE_SAMPLE_INTERVAL_MS`` 마다 수집해, 요청이 끝날 때
+   collapsed-stack(``.collapsed``, flamegraph 입력) 으로 저장. 빠른 요청에는 비용이 없다.
+   eventlet 환경에서는 샘플 시점에 hub 스레드에서 돌던 greenlet 스택이 잡히므로, hub 를
+   막는 느린 요청일수록 정확하다.
+
+파일은 ``PT_PROFILE_DIR`` 에 최대 ``PT_PROFILE_MAX_FILES`` 개까지 보관(오래된 것부터 삭제)하고
+``GET /api/admin/profiles`` (목록) / ``GET /api/admin/profiles/<name>`` (다운로드) 로 받는다.
+관리자 판별: ``X-Admin-Token`` == ``PT_ADMIN_TOKEN`` 이거나 로그인 사용자의 role 이 ``admin``.
+
+환경 변수:
+- ``PT_PROFILE_ENABLED`` (기본 ``false``) — 꺼져 있어도 관리자 ``X-Profile`` 헤더는 동작
+- ``PT_PROFILE_SAMPLE_RATE`` (기본 0), ``PT_PROFILE_SLOW_MS`` (기본 0 = 끔)
+- ``PT_PROFILE_SAMPLE_INTERVAL_MS`` (기본 10), ``PT_PROFILE_DIR`` (기본 ``logs/profiles``),
+  ``PT_PROFILE_MAX_FILES`` (기본 50)
+"""
+
+from __future__ import annotations
+
+import cProfile
+import hmac
+import logging
+import os
+import random
+import re
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+
+from utils.logging_pipeline import native_modules
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENABLED = (os.environ.get('PT_PROFILE_ENABLED') or 'false').lower() == 'true'
+SAMPLE_RATE = float(os.environ.get('PT_PROFILE_SAMPLE_RATE', '0'))
+SLOW_MS = float(os.environ.get('PT_PROFILE_SLOW_MS', '0'))
+SAMPLE_INTERVAL_MS = float(os.environ.get('PT_PROFILE_SAMPLE_INTERVAL_MS', '10'))
+PROFILE_DIR = os.environ.get('PT_PROFILE_DIR', 'logs/profiles')
+MAX_FILES = int(os.environ.get('PT_PROFILE_MAX_FILES', '50'))
+ADMIN_TOKEN = os.environ.get('PT_ADMIN_TOKEN') or ''
+
+_FILE_NAME = re.compile(r'^[\w.-]+\.(pstats|collapsed)$')
+
+_, _threading = native_modules()
+_profile_lock = _threading.Lock()
+
+
+def is_admin_request() -> bool:
+    """관리자 토큰 헤더 또는 검증된 신원(Bearer 토큰 / 비밀번호 로그인 세션)의 role=admin 사용자.
+
+    ``?user_id=`` / Safari 쿠키 같은 대안 인증 경로는 위조할 수 있으므로 인정하지 않는다.
+    """
+    from flask import request
+
+    header = request.headers.get('X-Admin-Token') or ''
+    if ADMIN_TOKEN and header and hmac.compare_digest(header, ADMIN_TOKEN):
+        return True
+    try:
+        from models.user import Users
+        from utils.token import get_verified_user_id
+
+        user_id = get_verified_user_id()
+        if not user_id:
+            return False
+        user = Users.query.get(user_id)
+        return bool(user and user.role == 'admin')
+    except Exception:
+        return False
+
+
+# --------------------------------------------------------------------
+# 저장소 (bounded ring)
+# --------------------------------------------------------------------
+
+
+class ProfileStore:
+    def __init__(self, directory: str = PROFILE_DIR, max_files: int = MAX_FILES):
+        self.directory = directory
+        self.max_files = max_files
+        self._lock = _threading.Lock()
+
+    def path_for(self, method: str, route: str, duration_ms: float, kind: str) -> str:
+        stamp = datetime.utcnow().strftime('%Y%m%dT%H%M%S%f')
+        slug = re.sub(r'[^\w]+', '_', route).strip('_')[:60] or 'root'
+        return os.path.join(self.directory, f'{stamp}_{method}_{slug}_{int(duration_ms)}ms.{kind}')
+
+    def _trim(self) -> None:
+        files = self.list()
+        for entry in files[self.max_files:]:
+            try:
+                os.remove(os.path.join(self.directory, entry['name']))
+            except OSError:
+                pass
+
+    def save_pstats(self, profile: cProfile.Profile, path: str) -> None:
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            profile.dump_stats(path)
+            self._trim()
+
+    def save_collapsed(self, stacks: Counter, path: str) -> None:
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                for stack, count in stacks.most_common():
+                    f.write(f'{stack} {count}\n')
+            self._trim()
+
+    def list(self) -> list[dict]:
+        """최신순 프로파일 목록."""
+        try:
+            names = [n for n in os.listdir(self.directory) if _FILE_NAME.match(n)]
+        except FileNotFoundError:
+            return []
+        entries = []
+        for name in names:
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append({'name': name, 'bytes': stat.st_size,
+                            'created_at': datetime.utcfromtimestamp(stat.st_mtime).isoformat()})
+        entries.sort(key=lambda e: e['name'], reverse=True)
+        return entries
+
+    def resolve(self, name: str) -> str | None:
+        if not _FILE_NAME.match(name or ''):
+            return None
+        path = os.path.join(self.directory, name)
+        return path if os.path.isfile(path) else None
+
+
+store = ProfileStore()
+
+
+# --------------------------------------------------------------------
+# 느린 요청 스택 샘플러
+# --------------------------------------------------------------------
+
+
+def _collapse(frame) -> str:
+    parts = []
+    while frame is not None:
+        code = frame.f_code
+        parts.append(f'{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}')
+        frame = frame.f_back
+    return ';'.join(reversed(parts))
+
+
+class SlowRequestSampler:
+    """진행 중인 요청 중 threshold 를 넘긴 것만 주기적으로 스택 샘플링."""
+
+    def __init__(self, threshold_ms: float, interval_ms: float):
+        self.threshold = threshold_ms / 1000.0
+        self.interval = max(interval_ms, 1.0) / 1000.0
+        self._lock = _threading.Lock()
+        self._active: dict[object, dict] = {}
+        self._thread = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = _threading.Thread(target=self._loop, name='slow-request-sampler', daemon=True)
+            self._thread.start()
+
+    def begin(self, token, thread_id: int) -> None:
+        with self._lock:
+            self._active[token] = {'thread_id': thread_id, 'started': time.monotonic(), 'stacks': Counter()}
+
+    def end(self, token) -> Counter:
+        with self._lock:
+            state = self._active.pop(token, None)
+        return state['stacks'] if state else Counter()
+
+    def sample_once(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            due = [s for s in self._active.values() if now - s['started'] >= self.threshold]
+        if not due:
+            return
+        frames = sys._current_frames()
+        for state in due:
+            frame = frames.get(state['thread_id'])
+            if frame is not None:
+                state['stacks'][_collapse(frame)] += 1
+
+    def _loop(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.sample_once()
+            except Exception as e:
+                logger.warning('slow request sampler 실패: %s', e)
+
+
+# --------------------------------------------------------------------
+# Flask 훅 / 관리자 엔드포인트
+# --------------------------------------------------------------------
+
+
+def install_profiler(app) -> None:
+    from flask import g, jsonify, request, send_file
+
+    sampler = None
+    if PROFILE_ENABLED and SLOW_MS > 0:
+        sampler = SlowRequestSampler(SLOW_MS, SAMPLE_INTERVAL_MS)
+        sampler.start()
+
+    def _wants_cprofile() -> bool:
+        if request.headers.get('X-Profile') == '1' and is_admin_request():
+            return True
+        return PROFILE_ENABLED and SAMPLE_RATE > 0 and random.random() < SAMPLE_RATE
+
+    @app.before_request
+    def _profile_request_start():
+        if request.path.startswith('/api/admin/profiles'):
+            return
+        g._profile_started = time.perf_counter()
+        if _wants_cprofile() and _profile_lock.acquire(blocking=False):
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+                g._profile = profile
+            except ValueError:  # 다른 프로파일러가 실행 중
+                _profile_lock.release()
+        if sampler is not None:
+            g._profile_token = object()
+            sampler.begin(g._profile_token, _threading.get_ident())
+
+    @app.teardown_request
+    def _profile_request_end(exc):
+        started = g.pop('_profile_started', None)
+        if started is None:
+            return
+        duration_ms = (time.perf_counter() - started) * 1000
+        route = request.url_rule.rule if request.url_rule else request.path
+        profile = g.pop('_profile', None)
+        if profile is not None:
+            profile.disable()
+            _profile_lock.release()
+            try:
+                store.save_pstats(profile, store.path_for(request.method, route, duration_ms, 'pstats'))
+            except OSError as e:
+                logger.warning('profile 저장 실패: %s', e)
+        token = g.pop('_profile_token', None)
+        if sampler is not None and token is not None:
+            stacks = sampler.end(token)
+            if stacks:
+                try:
+                    store.save_collapsed(stacks, store.path_for(request.method, route, duration_ms, 'collapsed'))
+                except OSError as e:
+                    logger.warning('profile 저장 실패: %s', e)
+
+    @app.route('/api/admin/profiles', methods=['GET'])
+    def list_profiles():
+        """저장된 프로파일 목록 (관리자)"""
+        if not is_admin_request():
+            return jsonify({'message': '권한이 없습니다'}), 403
+        return jsonify({'profiles': store.list(), 'max_files': store.max_files}), 200
+
+    @app.route('/api/admin/profiles/<name>', methods=['GET'])
+    def download_profile(name):
+        """프로파일 파일 다운로드 (관리자)"""
+        if not is_admin_request():
+            return jsonify({'message': '권한이 없습니다'}), 403
+        path = store.resolve(name)
+        if path is None:
+            return jsonify({'message': '프로파일을 찾을 수 없습니다'}), 404
+        return send_file(os.path.abspath(path), as_attachment=True, download_name=name,
+                         mimetype='application/octet-stream')
@@ -15,6 +15,20 @@ APNs:
 FCM v1:
 - ``FCM_SERVICE_ACCOUNT_JSON`` (서비스 계정 JSON 본문)
 - ``FCM_PROJECT_ID``
+
+엔드포인트 오버라이드 (로컬 스텁/벤치마크용, 운영에서는 비워 둔다):
+- ``APNS_BASE_URL`` (기본: APNS_USE_SANDBOX 에 따른 Apple 호스트)
+- ``FCM_BASE_URL`` (기본: https://fcm.googleapis.com)
+
+발송 셰이핑(:class:`DeliveryShaper`):
+- ``PT_PUSH_SHAPING_WINDOW_SECONDS`` (0이면 비활성 — tick에서 즉시 발송)
+- ``PT_PUSH_MAX_SENDS_PER_SECOND`` (전역 사용자 발송 상한)
+- ``PT_PUSH_OPEN_RATE`` / ``PT_PUSH_REQUESTS_PER_OPEN`` / ``PT_PUSH_OPEN_SPREAD_SECONDS``
+  (후속 요청률 추정용 가정치)
+
+푸시 아웃박스(오프라인 사용자 알림):
+- ``PT_PUSH_OUTBOX_MAX`` (메모리 큐 최대 건수, 기본 5000)
+- ``PT_PUSH_OUTBOX_DRAIN_SECONDS`` (스케줄러 배출 주기, 기본 15초)
 """
 
 from __future__ import annotations
@@ -23,8 +37,11 @@ import base64
 import json
 import logging
 import os
+import threading
 import time
-from typing import Any, Iterable
+import zlib
+from collections import deque
+from typing import Any, Callable, Iterable
 
 import requests
 
@@ -97,7 +114,8 @@ def _apns_send(token: str, payload: dict[str, Any]) -> tuple[bool, str]:
 
     sandbox = (os.environ.get('APNS_USE_SANDBOX') or 'false').lower() == 'true'
     host = 'api.sandbox.push.apple.com' if sandbox else 'api.push.apple.com'
-    url = f'https://{host}/3/device/{token}'
+    base_url = (os.environ.get('APNS_BASE_URL') or f'https://{host}').rstrip('/')
+    url = f'{base_url}/3/device/{token}'
 
     aps_payload = {
         'aps': {
@@ -174,7 +192,8 @@ def _fcm_send(token: str, payload: dict[str, Any]) -> tuple[bool, str]:
     if not access_token or not project_id:
         return False, 'fcm credentials missing'
 
-    url = f'https://fcm.googleapis.com/v1/projects/{project_id}/messages:send'
+    base_url = (os.environ.get('FCM_BASE_URL') or 'https://fcm.googleapis.com').rstrip('/')
+    url = f'{base_url}/v1/projects/{project_id}/messages:send'
     msg = {
         'message': {
             'token': token,
@@ -254,3 +273,174 @@ def send_to_tokens(tokens: Iterable[Any], title: str, body: str,
         else:
             counts['skipped'] += 1
     return counts
+
+
+# --------------------------------------------------------------------
+# 푸시 아웃박스 (오프라인 사용자 알림)
+# --------------------------------------------------------------------
+# 실시간 알림 경로에서 소켓에 접속해 있지 않은 사용자의 알림을 프로세스 메모리 큐에 쌓고,
+# 스케줄러가 주기적으로 꺼내 발송한다 (``scheduler.drain_push_outbox``).
+# 가득 차면 가장 오래된 항목부터 버린다. 프로세스 재시작 시 미발송분은 유실된다.
+
+
+OUTBOX_MAX = int(os.environ.get('PT_PUSH_OUTBOX_MAX', '5000'))
+OUTBOX_DRAIN_SECONDS = int(os.environ.get('PT_PUSH_OUTBOX_DRAIN_SECONDS', '15'))
+
+_outbox: deque = deque(maxlen=OUTBOX_MAX)
+_outbox_lock = threading.Lock()
+_outbox_dropped = 0
+
+
+def enqueue_outbox(user_id: int, title: str, body: str, *, deeplink: str | None = None,
+                   data_extra: dict[str, Any] | None = None) -> None:
+    global _outbox_dropped
+    with _outbox_lock:
+        if len(_outbox) == _outbox.maxlen:
+            _outbox_dropped += 1
+        _outbox.append({
+            'user_id': user_id,
+            'title': title,
+            'body': body,
+            'deeplink': deeplink,
+            'data_extra': data_extra,
+        })
+
+
+def take_outbox(limit: int) -> list[dict[str, Any]]:
+    """최대 limit 건을 꺼낸다 (FIFO)."""
+    with _outbox_lock:
+        return [_outbox.popleft() for _ in range(min(limit, len(_outbox)))]
+
+
+def outbox_stats() -> dict[str, int]:
+    with _outbox_lock:
+        return {'pending': len(_outbox), 'dropped': _outbox_dropped, 'max': _outbox.maxlen}
+
+
+# --------------------------------------------------------------------
+# 발송 셰이핑 (지터 + 전역 초당 발송 상한)
+# --------------------------------------------------------------------
+
+
+SHAPING_WINDOW_SECONDS = float(os.environ.get('PT_PUSH_SHAPING_WINDOW_SECONDS', '0'))
+MAX_SENDS_PER_SECOND = float(os.environ.get('PT_PUSH_MAX_SENDS_PER_SECOND', '20'))
+OPEN_RATE = float(os.environ.get('PT_PUSH_OPEN_RATE', '0.3'))
+REQUESTS_PER_OPEN = float(os.environ.get('PT_PUSH_REQUESTS_PER_OPEN', '3'))
+OPEN_SPREAD_SECONDS = float(os.environ.get('PT_PUSH_OPEN_SPREAD_SECONDS', '60'))
+
+
+class DeliveryShaper:
+    """같은 tick 대상 사용자의 발송 시각을 window 안에 흩뿌린다.
+
+    - 사용자별 지터는 ``crc32(user_id:day)`` 기반이라 재시작/샤드와 무관하게 결정적이다.
+    - 지터 순서로 정렬한 뒤 ``1 / max_sends_per_second`` 간격을 강제해 전역 상한을 맞춘다.
+      슬롯을 tick 전체 대상으로 한 번에 계산하므로 샤드 워커가 병렬로 기다려도 상한이 유지된다.
+    """
+
+    def __init__(self, window_seconds: float, max_sends_per_second: float, *,
+                 day: str = '', clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.window_seconds = max(0.0, float(window_seconds))
+        self.max_sends_per_second = max(0.0, float(max_sends_per_second))
+        self.day = day
+        self._clock = clock
+        self._sleep = sleep
+        self._slots: dict[int, float] = {}
+        self._started_at: float | None = None
+        self._lock = threading.Lock()
+
+    def jitter(self, user_id: int) -> float:
+        """window 안의 결정적 오프셋(초)."""
+        if not self.window_seconds:
+            return 0.0
+        h = zlib.crc32(f'{user_id}:{self.day}'.encode('utf-8'))
+        return (h / 0xFFFFFFFF) * self.window_seconds
+
+    def plan(self, user_ids: Iterable[int]) -> list[tuple[float, int]]:
+        """(slot 오프셋 초, user_id) 를 발송 순서대로 반환하고 tick 시작 시각을 고정한다."""
+        planned = sorted((self.jitter(uid), uid) for uid in user_ids)
+        gap = 1.0 / self.max_sends_per_second if self.max_sends_per_second else 0.0
+        slots: list[tuple[float, int]] = []
+        previous = None
+        for offset, uid in planned:
+            slot = offset if previous is None else max(offset, previous + gap)
+            slots.append((slot, uid))
+            previous = slot
+        with self._lock:
+            self._slots = {uid: slot for slot, uid in slots}
+            self._started_at = self._clock()
+        return slots
+
+    def slot_for(self, user_id: int) -> float:
+        return self._slots.get(user_id, 0.0)
+
+    def wait(self, user_id: int) -> float:
+        """user_id 슬롯까지 대기. 실제 대기한 초를 반환 (plan 이전이면 대기 없음)."""
+        if self._started_at is None:
+            return 0.0
+        remaining = self._started_at + self.slot_for(user_id) - self._clock()
+        if remaining > 0:
+            self._sleep(remaining)
+            return remaining
+        return 0.0
+
+    def followon_report(self, slots: list[tuple[float, int]] | None = None, *,
+                        open_rate: float = OPEN_RATE,
+                        requests_per_open: float = REQUESTS_PER_OPEN,
+                        open_spread_seconds: float = OPEN_SPREAD_SECONDS) -> dict[str, Any]:
+        """푸시 수신 후 앱 오픈으로 이어지는 후속 API 요청률(초당) 추정.
+
+        각 발송이 ``open_rate`` 확률로 앱 오픈을 만들고, 오픈 1회당 ``requests_per_open`` 요청이
+        수신 후 ``open_spread_seconds`` 동안 균등하게 들어온다고 가정한다.
+        """
+        if slots is None:
+            slots = sorted((slot, uid) for uid, slot in self._slots.items())
+        spread = max(1, int(round(open_spread_seconds)))
+        per_send = open_rate * requests_per_open
+        horizon = int(slots[-1][0]) + spread + 1 if slots else spread
+        # 차분 배열: 발송 초 s 부터 s+spread 까지 per_send/spread 요청/초 추가
+        diff = [0.0] * (horizon + 1)
+        for slot, _ in slots:
+            start = int(slot)
+            diff[start] += per_send / spread
+            diff[start + spread] -= per_send / spread
+        rate, peak, peak_at = 0.0, 0.0, 0
+        for second in range(horizon):
+            rate += diff[second]
+            if rate > peak:
+                peak, peak_at = rate, second
+        total = per_send * len(slots)
+        return {
+            'users': len(slots),
+            'window_seconds': self.window_seconds,
+            'max_sends_per_second': self.max_sends_per_second,
+            'delivery_seconds': round(slots[-1][0], 1) if slots else 0.0,
+            'expected_requests': round(total, 1),
+            'peak_requests_per_second': round(peak, 2),
+            'peak_at_second': peak_at,
+            # 셰이핑 없이 한 번에 보냈을 때의 피크 (비교용)
+            'unshaped_peak_requests_per_second': round(total / spread, 2),
+            'assumptions': {
+                'open_rate': open_rate,
+                'requests_per_open': requests_per_open,
+                'open_spread_seconds': spread,
+            },
+        }
+
+
+def build_shaper(day: str = '') -> DeliveryShaper | None:
+    """환경변수 기반 셰이퍼. 셰이핑 비활성(window=0)이면 None."""
+    if SHAPING_WINDOW_SECONDS <= 0:
+        return None
+    return DeliveryShaper(SHAPING_WINDOW_SECONDS, MAX_SENDS_PER_SECOND, day=day)
+
+
+def capacity_report(users: int, *, window_seconds: float | None = None,
+                    max_sends_per_second: float | None = None, **assumptions) -> dict[str, Any]:
+    """캠페인 전 용량 산정용: N명에게 보낼 때의 예상 후속 요청률 피크."""
+    shaper = DeliveryShaper(
+        SHAPING_WINDOW_SECONDS if window_seconds is None else window_seconds,
+        MAX_SENDS_PER_SECOND if max_sends_per_second is None else max_sends_per_second,
+        day='capacity',
+    )
+    return shaper.followon_report(shaper.plan(range(1, users + 1)), **assumptions)
@@ -3,6 +3,25 @@
 10분마다 깨어나 ``user_preferences.push_time`` (사용자 timezone 기준)이 현재 분(±10분)
 구간에 들어오는 사용자에게 오늘의 추천을 생성하고 푸시를 발송한다.
 
+``PT_PUSH_TICK_MODE=batched`` 면 대상 사용자를 배치 단위로 묶어 오늘 배정·프로그램·토큰을
+묶음 쿼리로 미리 읽고, 피드백은 배치당 1회의 bulk UPDATE로 기록한다(:func:`batched_push_tick`).
+
+``PT_PUSH_SHAPING_WINDOW_SECONDS`` 가 0보다 크면 실제 발송을 사용자별 결정적 지터 + 전역 초당
+상한에 맞춰 window 안에 분산한다(``push_dispatch.DeliveryShaper``). 한 번에 앱을 여는
+사용자 스파이크를 완화하기 위함이며, tick마다 예상 후속 요청률을 로그로 남긴다.
+
+``PT_PUSH_SHARDS`` 가 2 이상이면 대상 사용자를 ``user_id`` 해시로 K개 샤드로 나눠
+워커 풀에서 병렬 처리한다(:func:`sharded_push_tick`). 샤드마다 시간 예산이 있어
+예산을 넘긴 사용자는 다음 tick으로 이월된다.
+
+같은 스케줄러에서 알림 보존 기간 정리/다이제스트 잡(``utils/notification_retention.py``)도
+``PT_NOTIFICATION_RETENTION_INTERVAL_HOURS`` 마다 실행된다.
+
+워커/인스턴스가 여럿이면 모든 프로세스가 스케줄러를 띄우되, PostgreSQL advisory lock 을 잡은
+한 프로세스(리더)만 푸시 tick / 보존 기간 정리를 실행하고 나머지는 매 실행마다 lock 을 다시 시도만 한다
+(오프라인 알림 아웃박스는 프로세스별 메모리 큐라 각자 비운다). 리더가 죽으면
+커넥션과 함께 lock 이 풀려 다음 잡 실행 때 다른 프로세스가 이어받는다 (SQLite 는 단일 프로세스로 보고 생략).
+
 APScheduler가 미설치이거나 ``PT_PUSH_WORKER_ENABLED=false``면 워커는 시작되지 않는다.
 APNs/FCM 자격증명이 없는 경우 ``push_dispatch``가 no-op으로 동작하므로 안전하다.
 """
@@ -11,6 +30,12 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
+import time
+import zlib
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 
 from config.database import db
@@ -18,6 +43,21 @@ from config.database import db
 
 logger = logging.getLogger(__name__)
 
+TICK_INTERVAL_MINUTES = 10
+PUSH_SHARDS = int(os.environ.get('PT_PUSH_SHARDS', '1'))
+PUSH_WORKERS = int(os.environ.get('PT_PUSH_WORKERS', '4'))
+# 10분 tick 안에 끝나도록 기본 8분. 넘기면 남은 사용자는 다음 tick으로 이월.
+PUSH_SHARD_BUDGET_SECONDS = float(os.environ.get('PT_PUSH_SHARD_BUDGET_SECONDS', '480'))
+PUSH_PROGRESS_EVERY = int(os.environ.get('PT_PUSH_PROGRESS_EVERY', '50'))
+# 'sequential' | 'batched'
+PUSH_TICK_MODE = (os.environ.get('PT_PUSH_TICK_MODE') or 'sequential').lower()
+PUSH_BATCH_SIZE = int(os.environ.get('PT_PUSH_BATCH_SIZE', '200'))
+
+_last_tick_report: dict | None = None
+
+PUSH_TITLE = '오늘의 WOD가 도착했어요'
+PUSH_DEFAULT_BODY = '오늘은 어떤 운동을 할지 확인해 보세요.'
+
 
 def _within_window(now_dt: datetime, hhmm: str, window_minutes: int = 10) -> bool:
     try:
@@ -29,105 +69,647 @@ def _within_window(now_dt: datetime, hhmm: str, window_minutes: int = 10) -> boo
     return delta <= window_minutes * 60
 
 
-def daily_push_tick(app):
-    """현재 분(±10분) 구간 사용자에게 추천 생성 + 푸시 발송."""
+def _push_disabled() -> bool:
+    return (os.environ.get('PT_PUSH_ENABLED') or 'true').lower() == 'false'
+
+
+def _now_for(pref) -> datetime:
+    """사용자 timezone 기준 현재 시각. pytz 미설치/잘못된 tz면 UTC."""
+    try:
+        import pytz  # type: ignore
+        tz = pytz.timezone(pref.timezone or 'Asia/Seoul')
+    except Exception:
+        tz = None
+    return datetime.now(tz) if tz else datetime.utcnow()
+
+
+def _due_preferences():
+    """지금 push_time 구간에 들어온 (pref, now) 목록."""
     from models.preference import UserPreferences
+
+    due = []
+    for pref in UserPreferences.query.filter_by(push_enabled=True).all():
+        now = _now_for(pref)
+        if _within_window(now, pref.push_time or '09:00'):
+            due.append((pref, now))
+    return due
+
+
+def _push_message(pref, assignment, program) -> tuple[str, str]:
+    body = PUSH_DEFAULT_BODY
+    if program is not None:
+        body = f'{program.title} · {assignment.duration_estimate_minutes or pref.available_minutes or 20}분'
+    return PUSH_TITLE, body
+
+
+def _send_assignment_push(tokens, assignment, title: str, body: str) -> dict[str, int]:
+    from utils.push_dispatch import send_to_tokens
+
+    return send_to_tokens(
+        tokens, title, body,
+        deeplink='wodybody://today',
+        data_extra={
+            'type': 'daily_recommendation',
+            'assignment_id': str(assignment.id),
+            'program_id': str(assignment.program_id or ''),
+        },
+    )
+
+
+def _plan_delivery(due):
+    """셰이핑이 켜져 있으면 tick 대상 전체의 발송 슬롯을 계산한 셰이퍼를 반환."""
+    from utils.push_dispatch import build_shaper
+
+    shaper = build_shaper(day=datetime.utcnow().date().isoformat())
+    if shaper is None or not due:
+        return shaper
+    slots = shaper.plan(pref.user_id for pref, _ in due)
+    report = shaper.followon_report(slots)
+    logger.info(
+        'push shaping: users=%s delivery=%.0fs peak_followon=%.1f req/s (unshaped %.1f req/s)',
+        report['users'], report['delivery_seconds'],
+        report['peak_requests_per_second'], report['unshaped_peak_requests_per_second'],
+    )
+    return shaper
+
+
+def _in_delivery_order(prefs, shaper, key=lambda pref: pref.user_id):
+    if shaper is None:
+        return list(prefs)
+    return sorted(prefs, key=lambda item: shaper.slot_for(key(item)))
+
+
+def _notify_user(pref, shaper=None) -> bool:
+    """한 사용자에게 오늘의 추천 생성 + 푸시 발송. 실제 발송했으면 True.
+
+    pref 는 :func:`_snapshot_pref` 스냅샷 — 앞 사용자의 commit 이 다음 사용자 pref 를 만료시켜도 재조회가 없다.
+    """
     from models.push_token import PushTokens
     from models.daily_assignment import DailyAssignments
     from models.program import Programs
-    from routes.recommendations import generate_recommendation, _today_for_user
-    from utils.push_dispatch import send_to_tokens, is_configured
+    from routes.recommendations import generate_recommendation
+    from utils.push_dispatch import is_configured
+
+    # 오늘 이미 발송했는지 확인 (push_sent_at 컬럼)
+    today = pref.today
+    existing = DailyAssignments.query.filter_by(
+        user_id=pref.user_id, assignment_date=today
+    ).first()
+    if existing is not None and existing.push_sent_at is not None:
+        return False
+
+    try:
+        assignment = generate_recommendation(pref.user_id, today=today)
+    except Exception as e:
+        logger.warning('generate_recommendation failed user=%s err=%s', pref.user_id, e)
+        return False
+
+    program = Programs.query.get(assignment.program_id) if assignment.program_id else None
+    title, body = _push_message(pref, assignment, program)
+
+    tokens = PushTokens.query.filter_by(user_id=pref.user_id, is_active=True).all()
+    if not tokens:
+        # 토큰이 없으면 발송 시도 자체를 생략
+        assignment.mark_push(datetime.utcnow(), skipped_reason='no_tokens')
+        db.session.commit()
+        return False
+
+    config = is_configured()
+    if not (config['apns'] or config['fcm']):
+        assignment.mark_push(datetime.utcnow(), skipped_reason='creds_missing')
+        db.session.commit()
+        logger.info('push creds missing — assignment marked but no actual send (user=%s)', pref.user_id)
+        return False
+
+    if shaper is not None:
+        shaper.wait(pref.user_id)
+    counts = _send_assignment_push(tokens, assignment, title, body)
+    assignment.mark_push(datetime.utcnow(), counts=counts)
+    db.session.commit()
+    return True
 
-    push_disable = (os.environ.get('PT_PUSH_ENABLED') or 'true').lower() == 'false'
-    if push_disable:
+
+def daily_push_tick(app):
+    """현재 분(±10분) 구간 사용자에게 추천 생성 + 푸시 발송 (순차 처리)."""
+    if _push_disabled():
         return
 
     with app.app_context():
         try:
-            try:
-                import pytz  # type: ignore
-            except Exception:
-                pytz = None  # type: ignore
-
-            prefs = UserPreferences.query.filter_by(push_enabled=True).all()
             sent_users = 0
-            for pref in prefs:
-                tz_name = pref.timezone or 'Asia/Seoul'
-                try:
-                    tz = pytz.timezone(tz_name) if pytz else None
-                except Exception:
-                    tz = None
-                now = datetime.now(tz) if tz else datetime.utcnow()
-                push_time = pref.push_time or '09:00'
-                if not _within_window(now, push_time):
-                    continue
+            due = _due_preferences()
+            shaper = _plan_delivery(due)
+            targets = [
+                _snapshot_pref(pref)
+                for pref, _ in _in_delivery_order(due, shaper, key=lambda item: item[0].user_id)
+            ]
+            for pref in targets:
+                if _notify_user(pref, shaper):
+                    sent_users += 1
+            if sent_users:
+                logger.info('daily_push_tick: %s users notified', sent_users)
+        except Exception as e:
+            logger.exception('daily_push_tick error: %s', e)
+
+
+def push_reach_report(days: int = 14) -> list[dict]:
+    """최근 N일 일자별 푸시 도달 현황 (push_* 컬럼 GROUP BY 1회)."""
+    from sqlalchemy import and_, case, func
+    from models.daily_assignment import DailyAssignments as DA
+
+    since = datetime.utcnow().date() - timedelta(days=max(days, 1) - 1)
+    delivered = func.sum(case(
+        (and_(DA.push_sent_at.isnot(None), DA.push_skipped_reason.is_(None)), 1), else_=0,
+    ))
+    rows = (
+        db.session.query(
+            DA.assignment_date,
+            func.count(DA.id),
+            func.count(DA.push_sent_at),
+            delivered,
+            func.sum(func.coalesce(DA.push_ios_sent, 0) + func.coalesce(DA.push_android_sent, 0)),
+            func.sum(func.coalesce(DA.push_ios_failed, 0) + func.coalesce(DA.push_android_failed, 0)),
+        )
+        .filter(DA.assignment_date >= since)
+        .group_by(DA.assignment_date)
+        .order_by(DA.assignment_date.desc())
+        .all()
+    )
+    return [
+        {
+            'date': day.isoformat() if day else None,
+            'assignments': assignments,
+            'push_marked': marked,
+            'users_reached': int(reached or 0),
+            'devices_sent': int(sent or 0),
+            'devices_failed': int(failed or 0),
+        }
+        for day, assignments, marked, reached, sent, failed in rows
+    ]
+
+
+# --------------------------------------------------------------------
+# 배치 tick
+# --------------------------------------------------------------------
+
+
+PUSH_STAGES = ('prefetch', 'generate', 'wait', 'send', 'persist')
+
+
+def _new_timings() -> dict[str, float]:
+    return {stage: 0.0 for stage in PUSH_STAGES}
 
-                # 오늘 이미 발송했는지 확인 (alert_sent flag in feedback_json)
-                today = _today_for_user(pref)
-                existing = DailyAssignments.query.filter_by(
-                    user_id=pref.user_id, assignment_date=today
-                ).first()
-                if existing is not None:
-                    fb = existing.feedback_dict()
-                    if fb.get('push_sent_at'):
-                        continue
 
+@contextmanager
+def _timed(timings: dict[str, float], stage: str):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] += time.perf_counter() - started
+
+
+# 배치 처리 중 commit(추천 생성, 발송 기록)이 ORM 객체를 만료시켜도 지연 로딩 SELECT 가 생기지 않도록
+# 발송에 필요한 값만 plain tuple 로 복사해 쓴다. 속성 이름은 _push_message / _send_assignment_push 와 같다.
+_PrefSnapshot = namedtuple('_PrefSnapshot', 'user_id today available_minutes')
+_AssignmentSnapshot = namedtuple('_AssignmentSnapshot', 'id program_id duration_estimate_minutes push_sent_at')
+_ProgramSnapshot = namedtuple('_ProgramSnapshot', 'title')
+
+
+def _snapshot_pref(pref) -> _PrefSnapshot:
+    from routes.recommendations import _today_for_user
+
+    return _PrefSnapshot(pref.user_id, _today_for_user(pref), pref.available_minutes)
+
+
+def _snapshot_assignment(assignment) -> _AssignmentSnapshot:
+    return _AssignmentSnapshot(
+        assignment.id, assignment.program_id, assignment.duration_estimate_minutes, assignment.push_sent_at,
+    )
+
+
+def _persist_push_status(updates: list[dict]) -> None:
+    """쌓인 push_* 갱신을 bulk UPDATE + commit 으로 기록하고 목록을 비운다."""
+    from models.daily_assignment import DailyAssignments
+
+    if not updates:
+        return
+    try:
+        db.session.bulk_update_mappings(DailyAssignments, updates)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    updates.clear()
+
+
+def _notify_batch(due: list[tuple[int, datetime]], timings: dict[str, float], shaper=None) -> dict[str, int]:
+    """(user_id, now) 배치를 묶음 쿼리로 처리. 반환: ``{processed, sent}``.
+
+    - prefetch: 선호 설정 / 오늘 배정 / 활성 토큰 / 프로그램을 IN 쿼리로 한 번에 로드 (값은 tuple 로 복사)
+    - generate: 오늘 배정이 없는 사용자만 ``generate_recommendation`` 호출
+    - wait:     셰이퍼 슬롯까지 대기 (셰이핑 활성 시)
+    - send:     사용자별 ``send_to_tokens``
+    - persist:  실제 발송 직후마다 그때까지의 push_* 갱신을 bulk UPDATE + commit. 배치 도중 실패하거나
+                셰이핑 대기 중 프로세스가 재시작돼도 이미 보낸 사용자는 기록돼 다음 tick 에 재발송되지 않는다.
+    """
+    from models.preference import UserPreferences
+    from models.push_token import PushTokens
+    from models.daily_assignment import DailyAssignments
+    from models.program import Programs
+    from routes.recommendations import generate_recommendation
+    from utils.push_dispatch import is_configured
+
+    stats = {'processed': 0, 'sent': 0}
+    if not due:
+        return stats
+
+    with _timed(timings, 'prefetch'):
+        user_ids = [user_id for user_id, _ in due]
+        prefs_by_user = {
+            pref.user_id: _snapshot_pref(pref)
+            for pref in UserPreferences.query.filter(UserPreferences.user_id.in_(user_ids)).all()
+        }
+        targets = [prefs_by_user[user_id] for user_id in user_ids if user_id in prefs_by_user]
+        today_by_user = {t.user_id: t.today for t in targets}
+        assignments = {
+            a.user_id: _snapshot_assignment(a)
+            for a in DailyAssignments.query.filter(
+                DailyAssignments.user_id.in_(user_ids),
+                DailyAssignments.assignment_date.in_(set(today_by_user.values())),
+            ).all()
+            if a.assignment_date == today_by_user.get(a.user_id)
+        }
+        tokens_by_user: dict[int, list] = {}
+        for t in PushTokens.query.filter(
+            PushTokens.user_id.in_(user_ids), PushTokens.is_active.is_(True)
+        ).all():
+            tokens_by_user.setdefault(t.user_id, []).append({'platform': t.platform, 'token': t.token})
+        config = is_configured()
+
+    pending = []
+    with _timed(timings, 'generate'):
+        for target in targets:
+            assignment = assignments.get(target.user_id)
+            if assignment is not None:
+                if assignment.push_sent_at is not None:
+                    stats['processed'] += 1
+                    continue
+            else:
                 try:
-                    assignment = generate_recommendation(pref.user_id, today=today)
+                    assignment = _snapshot_assignment(
+                        generate_recommendation(target.user_id, today=target.today)
+                    )
                 except Exception as e:
-                    logger.warning('generate_recommendation failed user=%s err=%s', pref.user_id, e)
+                    db.session.rollback()
+                    logger.warning('generate_recommendation failed user=%s err=%s', target.user_id, e)
+                    stats['processed'] += 1
                     continue
+            pending.append((target, assignment))
 
-                title = '오늘의 WOD가 도착했어요'
-                body = '오늘은 어떤 운동을 할지 확인해 보세요.'
-                if assignment.program_id:
-                    program = Programs.query.get(assignment.program_id)
-                    if program is not None:
-                        body = f'{program.title} · {assignment.duration_estimate_minutes or pref.available_minutes or 20}분'
-
-                tokens = PushTokens.query.filter_by(user_id=pref.user_id, is_active=True).all()
-                if not tokens:
-                    # 토큰이 없으면 발송 시도 자체를 생략
-                    fb = assignment.feedback_dict()
-                    fb['push_sent_at'] = now.isoformat()
-                    fb['push_skipped_reason'] = 'no_tokens'
-                    assignment.set_feedback(fb)
-                    db.session.commit()
-                    continue
+    with _timed(timings, 'prefetch'):
+        program_ids = {a.program_id for _, a in pending if a.program_id}
+        programs = (
+            {pid: _ProgramSnapshot(title) for pid, title in
+             db.session.query(Programs.id, Programs.title).filter(Programs.id.in_(program_ids))}
+            if program_ids else {}
+        )
+
+    updates = []
+    for target, assignment in pending:
+        stats['processed'] += 1
+        skipped_reason, counts = None, None
+        tokens = tokens_by_user.get(target.user_id)
+        if not tokens:
+            skipped_reason = 'no_tokens'
+        elif not (config['apns'] or config['fcm']):
+            skipped_reason = 'creds_missing'
+        else:
+            if shaper is not None:
+                with _timed(timings, 'wait'):
+                    shaper.wait(target.user_id)
+            with _timed(timings, 'send'):
+                title, body = _push_message(target, assignment, programs.get(assignment.program_id))
+                counts = _send_assignment_push(tokens, assignment, title, body)
+            stats['sent'] += 1
+        updates.append(dict(
+            DailyAssignments.push_status_values(datetime.utcnow(), skipped_reason, counts),
+            id=assignment.id,
+        ))
+        if counts is not None:
+            with _timed(timings, 'persist'):
+                _persist_push_status(updates)
+
+    with _timed(timings, 'persist'):
+        _persist_push_status(updates)
+    return stats
+
+
+def _log_timings(prefix: str, timings: dict[str, float]) -> None:
+    logger.info(
+        '%s timings: %s', prefix,
+        ' '.join(f'{stage}={timings[stage]:.3f}s' for stage in PUSH_STAGES),
+    )
+
+
+def batched_push_tick(app, batch_size: int | None = None) -> dict:
+    """대상 사용자를 batch_size 단위로 묶어 처리. 반환: ``{due, processed, sent, timings}``."""
+    global _last_tick_report
+    if _push_disabled():
+        return {}
+
+    batch_size = max(1, batch_size or PUSH_BATCH_SIZE)
+    timings = _new_timings()
+    result = {'due': 0, 'processed': 0, 'sent': 0, 'timings': timings}
+    with app.app_context():
+        try:
+            with _timed(timings, 'prefetch'):
+                due = _due_preferences()
+            result['due'] = len(due)
+            shaper = _plan_delivery(due)
+            due = [
+                (pref.user_id, now)
+                for pref, now in _in_delivery_order(due, shaper, key=lambda item: item[0].user_id)
+            ]
+            for start in range(0, len(due), batch_size):
+                stats = _notify_batch(due[start:start + batch_size], timings, shaper)
+                result['processed'] += stats['processed']
+                result['sent'] += stats['sent']
+        except Exception as e:
+            logger.exception('batched_push_tick error: %s', e)
+
+    result['timings'] = {stage: round(v, 3) for stage, v in timings.items()}
+    _last_tick_report = dict(result, started_at=datetime.utcnow().isoformat())
+    if result['due']:
+        logger.info(
+            'batched_push_tick: due=%s sent=%s', result['due'], result['sent'],
+        )
+        _log_timings('batched_push_tick', timings)
+    return result
+
+
+# --------------------------------------------------------------------
+# 샤드 병렬 tick
+# --------------------------------------------------------------------
+
+
+def shard_for_user(user_id: int, shards: int) -> int:
+    """user_id → 샤드 번호. 프로세스/재시작과 무관하게 안정적인 crc32 해시."""
+    if shards <= 1:
+        return 0
+    return zlib.crc32(str(user_id).encode('ascii')) % shards
+
+
+def last_tick_report() -> dict | None:
+    """직전 sharded tick의 샤드별 진행 리포트 (모니터링/디버그용)."""
+    return _last_tick_report
+
+
+def _run_shard(app, shard: int, due: list[tuple[int, datetime]], deadline: float,
+               shaper=None) -> dict:
+    """한 샤드의 사용자들을 처리(순차 또는 배치). deadline(monotonic)을 넘기면 나머지는 이월."""
+    from models.preference import UserPreferences
+
+    started = time.monotonic()
+    timings = _new_timings()
+    report = {
+        'shard': shard,
+        'total': len(due),
+        'processed': 0,
+        'sent': 0,
+        'failed': 0,
+        'deferred': 0,
+        'elapsed_seconds': 0.0,
+        'timings': timings,
+    }
+    if not due:
+        return report
+
+    with app.app_context():
+        now_by_user = dict(due)
+        # commit 뒤 만료된 pref 를 다시 읽지 않도록 스냅샷으로 복사해 둔다 (배치 경로와 같은 tuple)
+        targets = [
+            _snapshot_pref(pref) for pref in _in_delivery_order(
+                UserPreferences.query.filter(UserPreferences.user_id.in_(list(now_by_user))).all(),
+                shaper,
+            )
+        ]
+        user_ids = [t.user_id for t in targets]
+        step = PUSH_BATCH_SIZE if PUSH_TICK_MODE == 'batched' else 1
+        next_progress = PUSH_PROGRESS_EVERY
+        for start in range(0, len(user_ids), step):
+            if time.monotonic() > deadline:
+                report['deferred'] = len(user_ids) - start
+                logger.warning(
+                    'push shard %s budget exhausted — %s users deferred to next tick',
+                    shard, report['deferred'],
+                )
+                break
+            chunk = user_ids[start:start + step]
+            try:
+                if step > 1:
+                    stats = _notify_batch([(uid, now_by_user[uid]) for uid in chunk], timings, shaper)
+                else:
+                    stats = {'processed': 1, 'sent': int(_notify_user(targets[start], shaper))}
+            except Exception as e:
+                db.session.rollback()
+                report['failed'] += len(chunk)
+                stats = {'processed': len(chunk), 'sent': 0}
+                logger.warning(
+                    'push shard %s failed for %s users (first user=%s): %s',
+                    shard, len(chunk), chunk[0], e,
+                )
+            report['processed'] += stats['processed']
+            report['sent'] += stats['sent']
+            if PUSH_PROGRESS_EVERY and report['processed'] >= next_progress:
+                next_progress = report['processed'] + PUSH_PROGRESS_EVERY
+                logger.info(
+                    'push shard %s progress: %s/%s (sent=%s)',
+                    shard, report['processed'], report['total'], report['sent'],
+                )
+
+    report['elapsed_seconds'] = round(time.monotonic() - started, 3)
+    report['timings'] = {stage: round(v, 3) for stage, v in timings.items()}
+    return report
+
+
+def sharded_push_tick(app, shards: int | None = None, workers: int | None = None,
+                      budget_seconds: float | None = None) -> list[dict]:
+    """대상 사용자를 user_id 해시로 K개 샤드로 나눠 워커 풀에서 병렬 처리.
+
+    반환: 샤드별 리포트 리스트 ``{shard, total, processed, sent, failed, deferred, elapsed_seconds}``.
+    """
+    global _last_tick_report
+    if _push_disabled():
+        return []
+
+    shards = max(1, shards or PUSH_SHARDS)
+    workers = max(1, min(workers or PUSH_WORKERS, shards))
+    budget = budget_seconds if budget_seconds is not None else PUSH_SHARD_BUDGET_SECONDS
+
+    started = time.monotonic()
+    try:
+        with app.app_context():
+            due_prefs = _due_preferences()
+            shaper = _plan_delivery(due_prefs)
+            due = [(pref.user_id, now) for pref, now in due_prefs]
+    except Exception as e:
+        logger.exception('sharded_push_tick error: %s', e)
+        return []
+
+    buckets: list[list[tuple[int, datetime]]] = [[] for _ in range(shards)]
+    for user_id, now in due:
+        buckets[shard_for_user(user_id, shards)].append((user_id, now))
+
+    # 큐 대기 시간도 예산에 포함되도록 deadline은 tick 시작 기준.
+    deadline = started + budget
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='push-shard') as pool:
+        futures = [
+            pool.submit(_run_shard, app, shard, bucket, deadline, shaper)
+            for shard, bucket in enumerate(buckets)
+        ]
+        reports = []
+        for shard, future in enumerate(futures):
+            try:
+                reports.append(future.result())
+            except Exception as e:
+                logger.exception('push shard %s crashed: %s', shard, e)
+                reports.append({
+                    'shard': shard, 'total': len(buckets[shard]), 'processed': 0,
+                    'sent': 0, 'failed': len(buckets[shard]), 'deferred': 0,
+                    'elapsed_seconds': 0.0, 'timings': _new_timings(),
+                })
+
+    _last_tick_report = {
+        'started_at': datetime.utcnow().isoformat(),
+        'elapsed_seconds': round(time.monotonic() - started, 3),
+        'due_users': len(due),
+        'shards': reports,
+    }
+    if due:
+        logger.info(
+            'sharded_push_tick: due=%s sent=%s deferred=%s elapsed=%.1fs shards=%s',
+            len(due),
+            sum(r['sent'] for r in reports),
+            sum(r['deferred'] for r in reports),
+            _last_tick_report['elapsed_seconds'],
+            [(r['shard'], r['processed'], r['total']) for r in reports],
+        )
+        if PUSH_TICK_MODE == 'batched':
+            totals = _new_timings()
+            for r in reports:
+                for stage in PUSH_STAGES:
+                    totals[stage] += r['timings'][stage]
+            _log_timings('sharded_push_tick', totals)
+    return reports
 
-                config = is_configured()
-                if not (config['apns'] or config['fcm']):
-                    fb = assignment.feedback_dict()
-                    fb['push_sent_at'] = now.isoformat()
-                    fb['push_skipped_reason'] = 'creds_missing'
-                    assignment.set_feedback(fb)
-                    db.session.commit()
-                    logger.info('push creds missing — assignment marked but no actual send (user=%s)', pref.user_id)
-                    continue
 
+OUTBOX_DRAIN_LIMIT = int(os.environ.get('PT_PUSH_OUTBOX_DRAIN_LIMIT', '500'))
+
+
+def drain_push_outbox(app, limit: int | None = None) -> dict[str, int]:
+    """오프라인 사용자 알림 아웃박스를 꺼내 발송. 토큰은 한 번의 IN 조회로 묶어 가져온다."""
+    from utils.push_dispatch import take_outbox, send_to_tokens
+
+    report = {'drained': 0, 'sent': 0, 'no_tokens': 0}
+    if _push_disabled():
+        return report
+    items = take_outbox(limit or OUTBOX_DRAIN_LIMIT)
+    if not items:
+        return report
+
+    with app.app_context():
+        from models.push_token import PushTokens
+
+        user_ids = {item['user_id'] for item in items}
+        tokens_by_user: dict[int, list] = {}
+        for token in PushTokens.query.filter(
+            PushTokens.user_id.in_(user_ids), PushTokens.is_active.is_(True)
+        ).all():
+            tokens_by_user.setdefault(token.user_id, []).append(token)
+
+        for item in items:
+            report['drained'] += 1
+            tokens = tokens_by_user.get(item['user_id'])
+            if not tokens:
+                report['no_tokens'] += 1
+                continue
+            try:
                 counts = send_to_tokens(
-                    tokens, title, body,
-                    deeplink='wodybody://today',
-                    data_extra={
-                        'type': 'daily_recommendation',
-                        'assignment_id': str(assignment.id),
-                        'program_id': str(assignment.program_id or ''),
-                    },
+                    tokens, item['title'], item['body'],
+                    deeplink=item['deeplink'], data_extra=item['data_extra'],
                 )
-                fb = assignment.feedback_dict()
-                fb['push_sent_at'] = now.isoformat()
-                fb['push_counts'] = counts
-                assignment.set_feedback(fb)
-                db.session.commit()
-                sent_users += 1
-            if sent_users:
-                logger.info('daily_push_tick: %s users notified', sent_users)
-        except Exception as e:
-            logger.exception('daily_push_tick error: %s', e)
+            except Exception as e:
+                logger.exception('outbox push failed for user %s: %s', item['user_id'], e)
+                continue
+            if counts['ios_sent'] + counts['android_sent'] > 0:
+                report['sent'] += 1
+
+    logger.info('push outbox drained: %s', report)
+    return report
 
 
 _scheduler = None
 
+# 스케줄러 리더 선출용 advisory lock 키 (프로세스 수명 동안 전용 커넥션에서 보유)
+SCHEDULER_LOCK_KEY = zlib.crc32(b'wodybody_scheduler')
+_leader_conn = None
+_leader_lock = threading.Lock()
+
+
+def _is_scheduler_leader() -> bool:
+    """이 프로세스가 잡을 실행할 리더인지. PostgreSQL 이 아니면 항상 True (app context 필요)."""
+    global _leader_conn
+    from sqlalchemy import text
+
+    engine = db.engine
+    if engine.dialect.name != 'postgresql':
+        return True
+    with _leader_lock:
+        if _leader_conn is not None:
+            try:
+                _leader_conn.execute(text('SELECT 1'))
+                return True
+            except Exception as e:
+                # 커넥션이 끊겼으면 lock 도 풀린 것 — 다시 경쟁한다
+                logger.warning('scheduler leader connection lost: %s', e)
+                try:
+                    _leader_conn.close()
+                except Exception:
+                    pass
+                _leader_conn = None
+        conn = engine.connect().execution_options(isolation_level='AUTOCOMMIT')
+        try:
+            acquired = conn.execute(
+                text('SELECT pg_try_advisory_lock(:key)'), {'key': SCHEDULER_LOCK_KEY}
+            ).scalar()
+        except Exception as e:
+            conn.close()
+            logger.warning('scheduler leader lock failed: %s', e)
+            return False
+        if not acquired:
+            conn.close()
+            return False
+        _leader_conn = conn
+        logger.info('scheduler leader lock acquired (pid=%s)', os.getpid())
+        return True
+
+
+def _leader_only(job):
+    """리더 프로세스에서만 job(app, ...) 을 실행하는 래퍼."""
+    def run(app, **kwargs):
+        with app.app_context():
+            try:
+                leader = _is_scheduler_leader()
+            except Exception as e:
+                logger.warning('scheduler leader check failed: %s', e)
+                leader = False
+        if not leader:
+            return None
+        return job(app, **kwargs)
+    run.__name__ = job.__name__
+    return run
+
 
 def start_scheduler(app):
     """app.py에서 1회 호출. 이미 시작되어 있거나 의존성/플래그가 비활성이면 no-op."""
@@ -143,17 +725,50 @@ def start_scheduler(app):
         app.logger.warning('APScheduler 미설치 — 일일 푸시 워커 비활성. %s', e)
         return None
 
+    if PUSH_SHARDS > 1:
+        tick, mode = sharded_push_tick, f'{PUSH_SHARDS} shards / {PUSH_WORKERS} workers, {PUSH_TICK_MODE}'
+    elif PUSH_TICK_MODE == 'batched':
+        tick, mode = batched_push_tick, f'batched x{PUSH_BATCH_SIZE}'
+    else:
+        tick, mode = daily_push_tick, 'sequential'
     scheduler = BackgroundScheduler(daemon=True, timezone='UTC')
     scheduler.add_job(
-        daily_push_tick,
+        _leader_only(tick),
         trigger='interval',
-        minutes=10,
+        minutes=TICK_INTERVAL_MINUTES,
         kwargs={'app': app},
         id='wodybody_daily_push',
         replace_existing=True,
         next_run_time=datetime.utcnow() + timedelta(seconds=30),
     )
+    from utils.push_dispatch import OUTBOX_DRAIN_SECONDS
+    # 아웃박스는 프로세스 메모리 큐라 리더 여부와 관계없이 각 프로세스가 자기 큐를 비운다
+    scheduler.add_job(
+        drain_push_outbox,
+        trigger='interval',
+        seconds=OUTBOX_DRAIN_SECONDS,
+        kwargs={'app': app},
+        id='wodybody_push_outbox',
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    from utils.notification_retention import run_retention, RETENTION_INTERVAL_HOURS
+    scheduler.add_job(
+        _leader_only(run_retention),
+        trigger='interval',
+        hours=RETENTION_INTERVAL_HOURS,
+        kwargs={'app': app},
+        id='wodybody_notification_retention',
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+        next_run_time=datetime.utcnow() + timedelta(minutes=5),
+    )
     scheduler.start()
     _scheduler = scheduler
-    app.logger.info('APScheduler started: wodybody_daily_push every 10min')
+    app.logger.info(
+        'APScheduler started: wodybody_daily_push every %smin (%s)',
+        TICK_INTERVAL_MINUTES, mode,
+    )
     return scheduler
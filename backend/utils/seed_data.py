@@ -1,8 +1,12 @@
 """시드 데이터 생성 유틸리티"""
 
+import logging
+
 from models.exercise import ExerciseCategories, Exercises
 from config.database import db
 
+logger = logging.getLogger(__name__)
+
 def seed_exercise_data():
     """운동 카테고리와 운동 종류 시드 데이터 생성"""
     try:
@@ -103,9 +107,9 @@ def seed_exercise_data():
                 db.session.add(exercise)
         
         db.session.commit()
-        print("✅ 운동 데이터 시드 완료")
+        logger.info("✅ 운동 데이터 시드 완료")
         
     except Exception as e:
-        print(f"❌ 시드 데이터 생성 오류: {str(e)}")
+        logger.exception(f"❌ 시드 데이터 생성 오류: {str(e)}")
         db.session.rollback()
         raise
@@ -0,0 +1,180 @@
+"""Socket.IO 크로스 프로세스 메시지 큐 설정
+
+여러 워커/인스턴스가 떠 있을 때 한 프로세스의 ``socketio.emit`` 이 다른 프로세스에
+붙어 있는 소켓까지 전달되도록 pub/sub 백엔드를 붙인다.
+
+환경변수 ``SOCKETIO_MESSAGE_QUEUE``:
+    (미설정)                  단일 프로세스 — 기존 동작 그대로
+    redis://..., rediss://... Flask-SocketIO 기본 RedisManager (redis 패키지 필요)
+    amqp://..., kafka://...   Flask-SocketIO 기본 Kombu/Kafka 매니저
+    postgres                  DATABASE_URL 의 Postgres 로 LISTEN/NOTIFY
+    postgres://..., postgresql://...  지정한 Postgres 로 LISTEN/NOTIFY
+
+``SOCKETIO_CHANNEL`` 로 채널 이름을 바꿀 수 있다 (같은 DB/Redis 를 쓰는 클러스터가
+여럿이면 서로 다른 이름을 쓸 것).
+
+Postgres NOTIFY 페이로드는 8000 bytes 로 제한되므로 그보다 큰 메시지는
+``socketio_queue_overflow`` 테이블에 넣고 행 id 만 NOTIFY 한다.
+
+주의: polling 전송은 sticky session 이 필요하므로 gunicorn ``-w`` 는 1 로 두고,
+인스턴스(replica) 를 늘리는 방식으로 수평 확장한다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import select
+import threading
+import time
+
+from socketio import PubSubManager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHANNEL = 'wodybody-socketio'
+NOTIFY_PAYLOAD_LIMIT = 7900  # Postgres 한도 8000 bytes 에서 여유분을 뺀 값
+OVERFLOW_TABLE = 'socketio_queue_overflow'
+OVERFLOW_TTL_SECONDS = 300
+LISTEN_POLL_SECONDS = 5.0
+RECONNECT_MAX_SECONDS = 30.0
+
+_POSTGRES_SCHEMES = ('postgres://', 'postgresql://')
+
+
+class PostgresManager(PubSubManager):
+    """Postgres LISTEN/NOTIFY 기반 Socket.IO 클라이언트 매니저.
+
+    발행은 ``pg_notify(channel, payload)``, 수신은 전용 커넥션의 LISTEN 으로 처리한다.
+    eventlet 워커에서는 ``select`` 가 monkey patch 되어 있어 대기 중에 허브를 막지 않는다.
+    """
+
+    name = 'postgres'
+
+    def __init__(self, url, channel=DEFAULT_CHANNEL, write_only=False, logger=None):
+        try:
+            import psycopg2  # noqa: F401
+        except ImportError:
+            raise RuntimeError('psycopg2 패키지가 없어 Postgres 메시지 큐를 사용할 수 없습니다')
+        super().__init__(channel=channel, write_only=write_only, logger=logger)
+        self.url = url
+        self._publish_conn = None
+        self._publish_lock = threading.Lock()
+        self._overflow_ready = False
+
+    def _connect(self):
+        import psycopg2
+        from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
+        conn = psycopg2.connect(self.url)
+        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        return conn
+
+    def _ensure_overflow_table(self, cur):
+        if self._overflow_ready:
+            return
+        cur.execute(
+            f'CREATE TABLE IF NOT EXISTS {OVERFLOW_TABLE} ('
+            'id BIGSERIAL PRIMARY KEY, '
+            'payload TEXT NOT NULL, '
+            'created_at TIMESTAMPTZ NOT NULL DEFAULT now())'
+        )
+        self._overflow_ready = True
+
+    def _notify(self, cur, payload):
+        if len(payload.encode('utf-8')) <= NOTIFY_PAYLOAD_LIMIT:
+            cur.execute('SELECT pg_notify(%s, %s)', (self.channel, payload))
+            return
+        self._ensure_overflow_table(cur)
+        cur.execute(
+            f'DELETE FROM {OVERFLOW_TABLE} WHERE created_at < now() - make_interval(secs => %s)',
+            (OVERFLOW_TTL_SECONDS,),
+        )
+        cur.execute(f'INSERT INTO {OVERFLOW_TABLE} (payload) VALUES (%s) RETURNING id', (payload,))
+        row_id = cur.fetchone()[0]
+        cur.execute('SELECT pg_notify(%s, %s)', (self.channel, f'@{row_id}'))
+
+    def _publish(self, data):
+        payload = json.dumps(data, default=str)
+        with self._publish_lock:
+            for attempt in (1, 2):
+                try:
+                    if self._publish_conn is None or self._publish_conn.closed:
+                        self._publish_conn = self._connect()
+                    with self._publish_conn.cursor() as cur:
+                        self._notify(cur, payload)
+                    return
+                except Exception as e:
+                    self._publish_conn = None
+                    if attempt == 2:
+                        self._get_logger().error('Postgres 메시지 큐 발행 실패 (메시지 유실): %s', e)
+
+    def _decode(self, cur, payload):
+        if payload.startswith('@'):
+            cur.execute(f'SELECT payload FROM {OVERFLOW_TABLE} WHERE id = %s', (int(payload[1:]),))
+            row = cur.fetchone()
+            if row is None:
+                return None
+            payload = row[0]
+        try:
+            return json.loads(payload)
+        except ValueError:
+            return None
+
+    def _listen(self):
+        from psycopg2 import sql
+
+        retry = 1.0
+        while True:
+            conn = None
+            try:
+                conn = self._connect()
+                cur = conn.cursor()
+                cur.execute(sql.SQL('LISTEN {}').format(sql.Identifier(self.channel)))
+                retry = 1.0
+                while True:
+                    if select.select([conn], [], [], LISTEN_POLL_SECONDS) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        message = self._decode(cur, conn.notifies.pop(0).payload)
+                        if message is not None:
+                            yield message
+            except Exception as e:
+                self._get_logger().error(
+                    'Postgres 메시지 큐 수신 오류, %.0f초 후 재연결: %s', retry, e
+                )
+                time.sleep(retry)
+                retry = min(retry * 2, RECONNECT_MAX_SECONDS)
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+
+def _postgres_url(value):
+    if value == 'postgres':
+        url = os.environ.get('DATABASE_URL', '')
+        if not url.startswith(_POSTGRES_SCHEMES):
+            raise RuntimeError('SOCKETIO_MESSAGE_QUEUE=postgres 이지만 DATABASE_URL 이 Postgres 가 아닙니다')
+        return url
+    return value
+
+
+def socketio_queue_options(write_only=False):
+    """``SocketIO(...)`` 에 넘길 메시지 큐 관련 kwargs. 미설정이면 빈 dict."""
+    value = (os.environ.get('SOCKETIO_MESSAGE_QUEUE') or '').strip()
+    if not value:
+        return {}
+    channel = os.environ.get('SOCKETIO_CHANNEL', DEFAULT_CHANNEL)
+
+    if value == 'postgres' or value.startswith(_POSTGRES_SCHEMES):
+        manager = PostgresManager(_postgres_url(value), channel=channel, write_only=write_only)
+        logger.info('Socket.IO 메시지 큐: postgres LISTEN/NOTIFY (channel=%s)', channel)
+        return {'client_manager': manager}
+
+    logger.info('Socket.IO 메시지 큐: %s (channel=%s)', value.split('://', 1)[0], channel)
+    return {'message_queue': value, 'channel': channel}
@@ -1,15 +1,74 @@
+import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import timedelta, datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 
 from itsdangerous import URLSafeTimedSerializer, BadSignature, SignatureExpired
 from flask import current_app
 
+# 검증된 토큰 → user_id 캐시 (요청마다 HMAC 재검증을 피함)
+TOKEN_CACHE_SIZE = int(os.environ.get('PT_AUTH_TOKEN_CACHE_SIZE', '4096'))
+TOKEN_CACHE_TTL_SECONDS = float(os.environ.get('PT_AUTH_TOKEN_CACHE_TTL_SECONDS', '300'))
 
-def _get_serializer() -> URLSafeTimedSerializer:
-    secret_key = current_app.config.get('SECRET_KEY')
+
+class TTLCache:
+    """크기 제한 LRU + 항목별 만료 시각. 스레드 안전."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._items: 'OrderedDict[Any, tuple[Any, float]]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key) -> Any:
+        now = time.time()
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None or entry[1] <= now:
+                if entry is not None:
+                    del self._items[key]
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key, value, expires_at: Optional[float] = None) -> None:
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        expires_at = min(expires_at or float('inf'), time.time() + self.ttl)
+        with self._lock:
+            self._items[key] = (value, expires_at)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+token_cache = TTLCache(TOKEN_CACHE_SIZE, TOKEN_CACHE_TTL_SECONDS)
+
+
+@lru_cache(maxsize=4)
+def _serializer_for(secret_key) -> URLSafeTimedSerializer:
     return URLSafeTimedSerializer(secret_key, salt='auth-token')
 
 
+def _get_serializer() -> URLSafeTimedSerializer:
+    return _serializer_for(current_app.config.get('SECRET_KEY'))
+
+
 def generate_access_token(user_id: int, expires: timedelta = timedelta(hours=24)) -> str:
     # itsdangerous timed serializer encodes issue time and enforces max_age on loads
     s = _get_serializer()
@@ -21,10 +80,17 @@ def generate_access_token(user_id: int, expires: timedelta = timedelta(hours=24)
 
 
 def verify_access_token(token: str, max_age: int = 60 * 60 * 24) -> Optional[int]:
+    # 캐시 항목은 토큰 자체 만료 시각을 넘기지 않으므로 만료 판정은 그대로 유지된다
+    cache_key = (current_app.config.get('SECRET_KEY'), token, max_age)
+    cached = token_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     s = _get_serializer()
     try:
-        data = s.loads(token, max_age=max_age)
+        data, signed_at = s.loads(token, max_age=max_age, return_timestamp=True)
         user_id = int(data.get('sub'))
+        token_cache.set(cache_key, user_id, expires_at=signed_at.timestamp() + max_age)
         return user_id
     except SignatureExpired:
         current_app.logger.info('access token expired')
@@ -37,3 +103,16 @@ def verify_access_token(token: str, max_age: int = 60 * 60 * 24) -> Optional[int
         return None
 
 
+# 비밀번호 로그인으로만 기록되는 세션 키. session['user_id'] 는 Safari 대안 경로(?user_id=,
+# 쿠키)도 채우므로 권한 판단에 쓰지 않는다.
+VERIFIED_SESSION_KEY = 'verified_user_id'
+
+
+def get_verified_user_id() -> Optional[int]:
+    """검증된 신원만 인정: 유효한 Bearer 토큰 또는 비밀번호 로그인 세션. 없으면 None"""
+    from flask import request, session
+
+    auth_header = request.headers.get('Authorization') or ''
+    if auth_header.lower().startswith('bearer '):
+        return verify_access_token(auth_header.split(' ', 1)[1].strip())
+    return session.get(VERIFIED_SESSION_KEY)
@@ -1,7 +1,7 @@
 import React, { createContext, useContext, useState, useEffect, useCallback } from 'react';
 import { io, Socket } from 'socket.io-client';
 import { Notification, NotificationContextType } from '../types';
-import { notificationApi } from '../utils/api';
+import { notificationApi, preferencesApi } from '../utils/api';
 
 const NotificationContext = createContext<NotificationContextType | undefined>(undefined);
 
@@ -84,6 +84,13 @@ export const NotificationProvider: React.FC<NotificationProviderProps> = ({ chil
                 // 사용자 방에 참여
                 newSocket.emit('join_user_room', { user_id: userId });
                 console.log('사용자 방 참여 요청 전송:', userId);
+                // 프로그램 알림은 전체 브로드캐스트가 아닌 토픽 구독 — 내 난이도 피드만 구독
+                preferencesApi.get()
+                    .then(pref => pref.difficulty || 'intermediate')
+                    .catch(() => 'intermediate')
+                    .then(difficulty => {
+                        newSocket.emit('subscribe_topic', { topic: `difficulty_${difficulty}` });
+                    });
             });
 
             newSocket.on('disconnect', (reason) => {
@@ -117,6 +124,12 @@ export const NotificationProvider: React.FC<NotificationProviderProps> = ({ chil
                 addNotification(notification);
             });
 
+            // 짧은 시간 안에 몰린 개인 알림 묶음 (서버 emit 코얼레싱)
+            newSocket.on('notifications_batch', (batch: { notifications: Notification[] }) => {
+                console.log('개인 알림 묶음 수신:', batch.notifications.length);
+                batch.notifications.forEach(addNotification);
+            });
+
             // 프로그램 알림 수신
             newSocket.on('program_notification', (notification: any) => {
                 console.log('프로그램 알림 수신:', notification);
@@ -147,7 +160,10 @@ export const NotificationProvider: React.FC<NotificationProviderProps> = ({ chil
         try {
             const data = await notificationApi.getNotifications();
             setNotifications(data);
-            setUnreadCount(data.filter(n => !n.is_read).length);
+            // 최신 50개 밖의 안 읽은 알림까지 포함한 서버 카운터 사용
+            const { unread_count } = await notificationApi.getUnreadCount()
+                .catch(() => ({ unread_count: data.filter(n => !n.is_read).length }));
+            setUnreadCount(unread_count);
         } catch (error) {
             console.error('알림 조회 실패:', error);
         }
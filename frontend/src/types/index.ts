@@ -243,6 +243,14 @@ export interface Notification {
     created_at: string;
 }
 
+export interface NotificationSyncResponse {
+    notifications: Notification[];   // 최신순
+    next_cursor: string;
+    has_more: boolean;
+    unread_count: number;
+    reset: boolean;                  // true 면 커서 이전 알림이 삭제/압축됨 — 목록을 notifications 로 통째로 교체
+}
+
 export interface NotificationContextType {
     notifications: Notification[];
     unreadCount: number;
@@ -7,6 +7,7 @@ import {
     LoginRequest,
     CreateProgramForm,
     Notification,
+    NotificationSyncResponse,
     ExerciseCategory,
     Exercise,
     ProgramExercise,
@@ -285,6 +286,17 @@ export const notificationApi = {
     getNotifications: (): Promise<Notification[]> =>
         apiRequest<Notification[]>('/api/notifications'),
 
+    /** 커서 이후 새 알림만 (since 빈 문자열이면 최신 목록 + 첫 커서). */
+    syncNotifications: (since: string = '', limit?: number): Promise<NotificationSyncResponse> => {
+        const params = new URLSearchParams({ since });
+        if (limit) params.set('limit', String(limit));
+        return apiRequest<NotificationSyncResponse>(`/api/notifications?${params.toString()}`);
+    },
+
+    /** 배지용 안 읽은 알림 수. */
+    getUnreadCount: (): Promise<{ unread_count: number }> =>
+        apiRequest<{ unread_count: number }>('/api/notifications/unread-count'),
+
     markAsRead: (notificationId: number): Promise<{ message: string }> =>
         apiRequest<{ message: string }>(`/api/notifications/${notificationId}/read`, {
             method: 'PUT',